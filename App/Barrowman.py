@@ -0,0 +1,335 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Barrowman center of pressure and static margin calculations"""
+
+__title__ = "FreeCAD Rocket Barrowman Stability"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+import numpy as np
+
+from App.Constants import STYLE_SOLID, FIN_TYPE_TRAPEZOID, FIN_TYPE_ELLIPSE, FIN_TYPE_SKETCH
+from App.Geometry.MassProperties import profileMassProperties
+from App.Geometry.Nose import noseProfile
+from App.Geometry.Transition import transitionProfile
+from App.FinSketchShapeHandler import FinSketchShapeHandler
+from App.ShapeNoseCone import ShapeNoseCone
+from App.ShapeTransition import ShapeTransition
+from App.ShapeBodyTube import ShapeBodyTube
+from App.ShapeLaunchLug import ShapeLaunchLug
+from App.ShapeFin import ShapeFin
+from App.ShapeFinCan import ShapeFinCan
+
+# Fin-fin interference reduces the effectiveness of each fin beyond four fins. Indexed by the
+# fin count, the last entry is used for all larger counts. Values are those used by OpenRocket
+_FIN_EFFICIENCY = np.array([0.0, 1.0, 1.0, 1.0, 1.0, 0.948, 0.913, 0.854, 0.81, 0.75])
+
+# Barrowman engines by document name
+_engines = {}
+
+def _integrate(y, x):
+    # Trapezoidal rule
+    return float(np.sum((y[1:] + y[:-1]) * np.diff(x)) / 2.0)
+
+class _BodyContribution:
+    """ Slender body normal force of a body of revolution between foreX and aftX """
+
+    def __init__(self, foreX, aftX, foreRadius, aftRadius, volume):
+        self.foreX = foreX
+        self.aftX = aftX
+        self.foreRadius = foreRadius
+        self.aftRadius = aftRadius
+
+        # Normal force coefficient slope times the reference area, and its center. For a nose
+        # the center reduces to the familiar L - V/A aft of the tip
+        foreArea = math.pi * foreRadius * foreRadius
+        aftArea = math.pi * aftRadius * aftRadius
+        self.normalForceArea = 2.0 * (aftArea - foreArea)
+        if self.normalForceArea != 0.0:
+            self.center = foreX - ((foreX - aftX) * aftArea - volume) / (aftArea - foreArea)
+        else:
+            self.center = (foreX + aftX) / 2.0
+
+    def radiusAt(self, x):
+        if x < self.aftX or x > self.foreX:
+            return None
+        if self.foreX == self.aftX:
+            return max(self.foreRadius, self.aftRadius)
+        return self.aftRadius + (self.foreRadius - self.aftRadius) * (x - self.aftX) / (self.foreX - self.aftX)
+
+class _FinContribution:
+    """ A set of identical fins sharing a root station """
+
+    def __init__(self, count, span, area, midChordCos, center, bodyRadius=None):
+        self.count = count
+        self.span = span
+        self.area = area
+        self.midChordCos = midChordCos
+        self.center = center            # Barrowman fin center of pressure
+        self.bodyRadius = bodyRadius    # None when it is found from the body at the center
+
+def _trapezoidPlanform(rootChord, tipChord, sweep, span):
+    # Returns the span, area, mid chord sweep cosine, center of pressure and the forward most
+    # point of the fin, all in fin coordinates where the root leading edge is at x = rootChord
+    a, b = rootChord, tipChord
+    midChord = math.hypot(span, sweep + (b - a) / 2.0)
+    center = sweep * (a + 2.0 * b) / (3.0 * (a + b)) + ((a + b) - a * b / (a + b)) / 6.0
+    return span, span * (a + b) / 2.0, span / midChord, a - center, max(a, a - sweep)
+
+def _ellipsePlanform(rootChord, span):
+    # The quarter chord of the mean aerodynamic chord, with a straight mid chord line
+    center = rootChord * (0.5 - 2.0 / (3.0 * math.pi))
+    return span, math.pi * rootChord * span / 4.0, 1.0, rootChord - center, rootChord
+
+def _sketchPlanform(obj):
+    # Strip integration over the chords found in the sketch
+    chords = FinSketchShapeHandler(obj).findChords(obj.Profile.Shape)
+    z = np.array([chord[0].z for chord in chords])
+    fore = np.array([max(point.x for point in chord) for chord in chords])
+    aft = np.array([min(point.x for point in chord) for chord in chords])
+    chord = fore - aft
+
+    area = _integrate(chord, z)
+    span = z[-1] - z[0]
+    if area <= 0.0 or span <= 0.0:
+        return None
+    meanChord = _integrate(chord * chord, z) / area
+    meanLeadingEdge = _integrate(fore * chord, z) / area
+    midChord = math.hypot(span, (fore[-1] + aft[-1] - fore[0] - aft[0]) / 2.0)
+    return span, area, span / midChord, meanLeadingEdge - meanChord / 4.0, float(fore.max())
+
+def _finPlanform(obj):
+    if obj.FinType == FIN_TYPE_TRAPEZOID:
+        return _trapezoidPlanform(float(obj.RootChord), float(obj.TipChord), float(obj.SweepLength), float(obj.Height))
+    if obj.FinType == FIN_TYPE_ELLIPSE:
+        return _ellipsePlanform(float(obj.RootChord), float(obj.Height))
+    if obj.FinType == FIN_TYPE_SKETCH and obj.Profile is not None:
+        return _sketchPlanform(obj)
+    return None
+
+class Barrowman:
+    """ Barrowman center of pressure for the rocket in a document.
+
+        The rocket is assumed to lie along the x axis with the nose pointing towards +x. Positions
+        are x coordinates in mm, and the normal force coefficient slope is per radian using the
+        largest body diameter as the reference.
+
+        Each component's contribution is cached along with the parameters it was calculated from,
+        and is only recalculated when one of those parameters changes. Mach number and fin count
+        are applied when evaluating, and may be numpy arrays for design sweeps """
+
+    def __init__(self, doc):
+        self._doc = doc
+        self._cache = {}
+
+        self.recalculated = 0 # Number of component contributions calculated
+
+    def _placementX(self, obj):
+        return float(obj.getGlobalPlacement().Base.x)
+
+    def _key(self, obj):
+        # The parameters that affect each component's contribution
+        proxy = obj.Proxy
+        x = self._placementX(obj)
+        if isinstance(proxy, ShapeNoseCone):
+            return (obj.NoseType, float(obj.Length), float(obj.Diameter), float(obj.Coefficient),
+                    float(obj.OgiveDiameter), float(obj.BluntedDiameter), int(obj.Resolution), x)
+        if isinstance(proxy, ShapeTransition):
+            return (obj.TransitionType, float(obj.Length), float(obj.ForeDiameter), float(obj.AftDiameter),
+                    float(obj.Coefficient), bool(obj.Clipped), int(obj.Resolution), x)
+        if isinstance(proxy, ShapeLaunchLug):
+            return None
+        if isinstance(proxy, ShapeBodyTube):
+            return (float(obj.OuterDiameter), float(obj.Length), x)
+        if isinstance(proxy, ShapeFin):
+            key = (obj.FinType, float(obj.RootChord), float(obj.TipChord), float(obj.SweepLength), float(obj.Height), x)
+            if obj.FinType == FIN_TYPE_SKETCH and obj.Profile is not None:
+                key += (obj.Profile.Name, obj.Profile.Shape.hashCode())
+            if isinstance(proxy, ShapeFinCan):
+                key += (int(obj.FinCount), float(obj.OuterDiameter), float(obj.Length), float(obj.LeadingEdgeOffset))
+            else:
+                base = obj.getGlobalPlacement().Base
+                key += (base.y, base.z)
+            return key
+        return None
+
+    def _noseContributions(self, obj, x):
+        length = float(obj.Length)
+        radius = float(obj.Diameter) / 2.0
+        profile = noseProfile(obj.NoseType, STYLE_SOLID, length, radius, coefficient=float(obj.Coefficient),
+            ogiveRadius=float(obj.OgiveDiameter) / 2.0, noseRadius=float(obj.BluntedDiameter) / 2.0,
+            resolution=int(obj.Resolution))
+        if not profile.isValid():
+            return []
+        volume = profileMassProperties(profile.segments()).volume
+        return [_BodyContribution(x + length, x, 0.0, radius, volume)]
+
+    def _transitionContributions(self, obj, x):
+        length = float(obj.Length)
+        foreRadius = float(obj.ForeDiameter) / 2.0
+        aftRadius = float(obj.AftDiameter) / 2.0
+        profile = transitionProfile(obj.TransitionType, STYLE_SOLID, length, foreRadius, aftRadius,
+            coefficient=float(obj.Coefficient), resolution=int(obj.Resolution), clipped=bool(obj.Clipped))
+        if not profile.isValid():
+            return []
+        volume = profileMassProperties(profile.segments()).volume
+        return [_BodyContribution(x + length, x, foreRadius, aftRadius, volume)]
+
+    def _tubeContributions(self, obj, x):
+        radius = float(obj.OuterDiameter) / 2.0
+        return [_BodyContribution(x + float(obj.Length), x, radius, radius, math.pi * radius * radius * float(obj.Length))]
+
+    def _finContributions(self, obj, x):
+        planform = _finPlanform(obj)
+        if planform is None:
+            return []
+        span, area, midChordCos, center, fore = planform
+        if area <= 0.0 or span <= 0.0:
+            return []
+
+        if isinstance(obj.Proxy, ShapeFinCan):
+            # The fins are positioned relative to the forward end of the can
+            tube = self._tubeContributions(obj, x)
+            x += float(obj.Length) - float(obj.LeadingEdgeOffset) - fore
+            return tube + [_FinContribution(int(obj.FinCount), span, area, midChordCos, x + center, float(obj.OuterDiameter) / 2.0)]
+
+        return [_FinContribution(1, span, area, midChordCos, x + center)]
+
+    def _calculate(self, obj):
+        self.recalculated += 1
+        proxy = obj.Proxy
+        x = self._placementX(obj)
+        try:
+            if isinstance(proxy, ShapeNoseCone):
+                return self._noseContributions(obj, x)
+            if isinstance(proxy, ShapeTransition):
+                return self._transitionContributions(obj, x)
+            if isinstance(proxy, ShapeFin):
+                return self._finContributions(obj, x)
+            if isinstance(proxy, ShapeBodyTube):
+                return self._tubeContributions(obj, x)
+        except (ValueError, ZeroDivisionError):
+            pass
+        return []
+
+    def contributions(self):
+        """ The body and fin contributions of all the components, updating only those that have changed """
+        cache = {}
+        bodies = []
+        fins = []
+        for obj in self._doc.Objects:
+            if not hasattr(obj, 'Proxy'):
+                continue
+            key = self._key(obj)
+            if key is None:
+                continue
+
+            if obj.Name in self._cache and self._cache[obj.Name][0] == key:
+                cache[obj.Name] = self._cache[obj.Name]
+            else:
+                cache[obj.Name] = (key, self._calculate(obj))
+
+            for contribution in cache[obj.Name][1]:
+                if isinstance(contribution, _FinContribution):
+                    fins.append(contribution)
+                else:
+                    bodies.append(contribution)
+
+        self._cache = cache
+        return bodies, self._finSets(fins)
+
+    def _finSets(self, fins):
+        # Individual fins at the same station form a single fin set
+        sets = {}
+        for fin in fins:
+            key = (fin.span, fin.area, fin.midChordCos, fin.center, fin.bodyRadius)
+            if key in sets:
+                fin = _FinContribution(sets[key].count + fin.count, fin.span, fin.area, fin.midChordCos, fin.center, fin.bodyRadius)
+            sets[key] = fin
+        return list(sets.values())
+
+    def _bodyRadius(self, bodies, x):
+        radii = [radius for radius in [body.radiusAt(x) for body in bodies] if radius is not None]
+        if len(radii) > 0:
+            return max(radii)
+        return 0.0
+
+    def referenceDiameter(self, bodies=None):
+        if bodies is None:
+            bodies, fins = self.contributions()
+        radius = max([max(body.foreRadius, body.aftRadius) for body in bodies] + [0.0])
+        return 2.0 * radius
+
+    def noseTip(self, bodies=None):
+        """ The forward most position on the rocket """
+        if bodies is None:
+            bodies, fins = self.contributions()
+        if len(bodies) < 1:
+            return 0.0
+        return max([body.foreX for body in bodies])
+
+    def centerOfPressure(self, mach=0.0, finCount=None):
+        """ Returns the normal force coefficient slope and the center of pressure position.
+
+            Mach corrections use the Prandtl-Glauert factor and are only valid subsonically.
+            When finCount is given it replaces the fin count of every fin set """
+        bodies, fins = self.contributions()
+        diameter = self.referenceDiameter(bodies)
+        if diameter <= 0.0:
+            raise ValueError("The rocket has no body components")
+
+        with np.errstate(invalid='ignore'):
+            beta = np.sqrt(1.0 - np.square(np.asarray(mach, dtype=float)))
+
+        normalForce = np.zeros(())
+        moment = np.zeros(())
+        for body in bodies:
+            normalForce += body.normalForceArea
+            moment += body.normalForceArea * body.center
+
+        for fin in fins:
+            count = np.asarray(fin.count if finCount is None else finCount, dtype=int)
+            radius = fin.bodyRadius
+            if radius is None:
+                radius = self._bodyRadius(bodies, fin.center)
+
+            interference = 1.0 + radius / (fin.span + radius)
+            efficiency = _FIN_EFFICIENCY[np.clip(count, 0, len(_FIN_EFFICIENCY) - 1)]
+            ratio = beta * fin.span * fin.span / (fin.area * fin.midChordCos)
+            finNormalForce = math.pi * fin.span * fin.span * interference * efficiency * count / (1.0 + np.sqrt(1.0 + ratio * ratio))
+
+            normalForce = normalForce + finNormalForce
+            moment = moment + finNormalForce * fin.center
+
+        referenceArea = math.pi * diameter * diameter / 4.0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return normalForce / referenceArea, moment / normalForce
+
+    def staticMargin(self, centerOfGravity, mach=0.0, finCount=None):
+        """ Static margin in calibers. Positive values are stable """
+        normalForce, center = self.centerOfPressure(mach, finCount)
+        return (centerOfGravity - center) / self.referenceDiameter()
+
+def getBarrowman(doc):
+    if doc.Name not in _engines:
+        _engines[doc.Name] = Barrowman(doc)
+    return _engines[doc.Name]
@@ -27,35 +27,48 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import Part
 
+from App.Geometry.MassProperties import cylinderMassProperties
+from App.ShapeHandler import ShapeHandler
 from App.Utilities import _err
 from DraftTools import translate
 
-class BodyTubeShapeHandler():
-    def __init__(self, obj):
-
-        # This gets changed when redrawn so it's very important to save a copy
-        self._placement = obj.Placement
+class BodyTubeShapeHandler(ShapeHandler):
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
         self._ID = float(obj.InnerDiameter)
         self._OD = float(obj.OuterDiameter)
         self._length = float(obj.Length)
-        self._obj = obj
 
-    def isValidShape(self):
-        
-        # Perform some general validations
+    def _validate(self):
+        # Returns an error message if the parameters don't produce a valid shape
         if self._ID < 0:
-            _err(translate('Rocket', "Body tube inner diameter must be greater than zero"))
-            return False
+            return translate('Rocket', "Body tube inner diameter must be greater than zero")
         if self._OD <= self._ID:
-            _err(translate('Rocket', "Body tube outer diameter must be greater than the inner"))
-            return False
+            return translate('Rocket', "Body tube outer diameter must be greater than the inner")
         if self._length < 0:
-            _err(translate('Rocket', "Body tube length must be greater than zero"))
+            return translate('Rocket', "Body tube length must be greater than zero")
+
+        return None
+
+    def isValidShape(self):
+        
+        # Perform some general validations
+        message = self._validate()
+        if message is not None:
+            _err(message)
             return False
 
         return True
 
+    def massProperties(self):
+        """ Mass properties per unit density, or None if the shape is invalid """
+        if self._validate() is not None:
+            return None
+
+        center = (self._length / 2.0, 0.0, 0.0)
+        return cylinderMassProperties(self._OD / 2.0, self._length, center) - cylinderMassProperties(self._ID / 2.0, self._length, center)
+
     def _drawTubeEdges(self):
         innerRadius = self._ID / 2.0
         outerRadius = self._OD / 2.0
@@ -67,26 +80,13 @@ class BodyTubeShapeHandler():
 
         return [line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape()]
         
-    def draw(self):
-        if not self.isValidShape():
-            return
-
-        edges = None
+    def _drawTube(self, edges):
+        wire = Part.Wire(edges)
+        face = Part.Face(wire)
+        return face.revolve(FreeCAD.Vector(0, 0, 0),FreeCAD.Vector(1, 0, 0), 360)
 
-        try:
-            edges = self._drawTubeEdges()
-        except (ZeroDivisionError, Part.OCCError):
-            _err(translate('Rocket', "Body tube parameters produce an invalid shape"))
-            return
+    def _invalidShape(self):
+        _err(translate('Rocket', "Body tube parameters produce an invalid shape"))
 
-        if edges is not None:
-            try:
-                wire = Part.Wire(edges)
-                face = Part.Face(wire)
-                self._obj.Shape = face.revolve(FreeCAD.Vector(0, 0, 0),FreeCAD.Vector(1, 0, 0), 360)
-                self._obj.Placement = self._placement
-            except Part.OCCError:
-                _err(translate('Rocket', "Body tube parameters produce an invalid shape"))
-                return
-        else:
-            _err(translate('Rocket', "Body tube parameters produce an invalid shape"))
+    def build(self):
+        return self._drawTube(self._drawTubeEdges())
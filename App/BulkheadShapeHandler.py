@@ -28,14 +28,14 @@ import FreeCAD
 import Part
 import math
 
+from App.Geometry.MassProperties import cylinderMassProperties
+from App.ShapeHandler import ShapeHandler
 from App.Utilities import _err
 from DraftTools import translate
 
-class BulkheadShapeHandler():
-    def __init__(self, obj):
-
-        # This gets changed when redrawn so it's very important to save a copy
-        self._placement = obj.Placement
+class BulkheadShapeHandler(ShapeHandler):
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
         self._diameter = float(obj.Diameter)
         self._thickness = float(obj.Thickness)
@@ -48,65 +48,130 @@ class BulkheadShapeHandler():
         self._holeCount = int(obj.HoleCount)
         self._holeOffset = float(obj.HoleOffset)
 
-        self._obj = obj
-
-    def isValidShape(self):
-        # Perform some general validations
+    def _validate(self):
+        # Returns an error message if the parameters don't produce a valid shape
         if self._diameter <= 0:
-            _err(translate('Rocket', "Outer diameter must be greater than zero"))
-            return False
+            return translate('Rocket', "Outer diameter must be greater than zero")
 
         if self._step:
             if self._stepDiameter <= 0:
-                _err(translate('Rocket', "Step diameter must be greater than zero"))
-                return False
+                return translate('Rocket', "Step diameter must be greater than zero")
             if self._stepDiameter >= self._diameter:
-                _err(translate('Rocket', "Step diameter must less than the outer diameter"))
-                return False
+                return translate('Rocket', "Step diameter must less than the outer diameter")
 
         if self._holes:
             if self._holeDiameter <= 0:
-                _err(translate('Rocket', "Hole diameter must be greater than zero"))
-                return False
+                return translate('Rocket', "Hole diameter must be greater than zero")
             if self._holeCenter + (self._holeDiameter / 2.0) >= (self._diameter / 2.0):
-                _err(translate('Rocket', "Hole extends outside the outer diameter"))
-                return False
+                return translate('Rocket', "Hole extends outside the outer diameter")
             if self._step:
                 if self._holeCenter + (self._holeDiameter / 2.0) >= (self._stepDiameter / 2.0):
-                    _err(translate('Rocket', "Hole extends outside the step diameter"))
-                    return False
+                    return translate('Rocket', "Hole extends outside the step diameter")
+
+        return None
+
+    def isValidShape(self):
+        # Perform some general validations
+        message = self._validate()
+        if message is not None:
+            _err(message)
+            return False
 
         return True
 
+    def _holeCenters(self):
+        # (y, z) centers of the holes
+        centers = []
+        if self._holes:
+            for i in range(0, self._holeCount):
+                # Rotate around the centerline
+                angle = ((i * 2.0 *math.pi) / self._holeCount) + math.radians(self._holeOffset) + math.pi/2.0
+                centers.append((self._holeCenter * math.cos(angle), self._holeCenter * math.sin(angle)))
+        return centers
+
+    def _circle(self, radius, center = FreeCAD.Vector(0,0,0)):
+        # A circular face in the YZ plane
+        return Part.Face(Part.Wire(Part.makeCircle(radius, center, FreeCAD.Vector(1,0,0))))
+
+    def _holeTools(self):
+        # The hole pattern, in the YZ plane
+        tools = []
+        for y, z in self._holeCenters():
+            tools.append(self._circle(self._holeDiameter / 2.0, FreeCAD.Vector(0, y, z)))
+        return tools
+
+    def _crossSectionTools(self):
+        # Faces removed from the cross section, in the YZ plane. Draft shapes show the hole
+        # pattern as an overlay instead
+        if self._draft:
+            return []
+        return self._holeTools()
+
+    def _holeOverlay(self, start, length):
+        # Outlines of the hole pattern on both faces of a section
+        outlines = []
+        for face in self._holeTools():
+            for x in [start, start + length]:
+                outline = face.OuterWire.copy()
+                outline.translate(FreeCAD.Vector(x, 0, 0))
+                outlines.append(outline)
+        return outlines
+
+    def _removedMassProperties(self, radius, start, length):
+        # Mass properties of the cross section tools, extruded from start
+        removed = []
+        for y, z in self._holeCenters():
+            removed.append(cylinderMassProperties(self._holeDiameter / 2.0, length, (start + length / 2.0, y, z)))
+        return removed
+
+    def _sectionMassProperties(self, radius, start, length):
+        properties = cylinderMassProperties(radius, length, (start + length / 2.0, 0.0, 0.0))
+        for removed in self._removedMassProperties(radius, start, length):
+            properties -= removed
+        return properties
+
+    def massProperties(self):
+        """ Mass properties per unit density, or None if the shape is invalid """
+        if self._validate() is not None:
+            return None
+
+        properties = self._sectionMassProperties(self._diameter / 2.0, 0, self._thickness)
+        if self._step:
+            properties += self._sectionMassProperties(self._stepDiameter / 2.0, self._thickness, self._stepThickness)
+        return properties
+
+    def _crossSection(self, radius):
+        # All the tools are removed in a single 2D operation, avoiding a 3D boolean for each hole
+        face = self._circle(radius)
+        tools = self._crossSectionTools()
+        if len(tools) > 0:
+            face = face.cut(tools)
+        return face
+
+    def _extrude(self, face, start, length):
+        face.translate(FreeCAD.Vector(start, 0, 0))
+        solids = face.extrude(FreeCAD.Vector(length, 0, 0)).Solids
+        if len(solids) == 1:
+            return solids[0]
+        return Part.makeCompound(solids)
+
     def _drawBulkhead(self):
-        bulkhead = Part.makeCylinder(self._diameter / 2.0, self._thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
+        bulkhead = self._extrude(self._crossSection(self._diameter / 2.0), 0, self._thickness)
         if self._step:
-            step = Part.makeCylinder(self._stepDiameter / 2.0, self._stepThickness, FreeCAD.Vector(self._thickness,0,0), FreeCAD.Vector(1,0,0))
-            bulkhead = bulkhead.fuse(step)
+            step = self._extrude(self._crossSection(self._stepDiameter / 2.0), self._thickness, self._stepThickness)
+            bulkhead = bulkhead.fuse(step).removeSplitter()
 
-        # Add any holes
-        if self._holes:
-            thickness = self._thickness
+        if self._draft and self._holes:
+            # The holes go through the step as well, so outline them on its face
+            length = self._thickness
             if self._step:
-                thickness += self._stepDiameter
-            for i in range(0, self._holeCount):
-                hole = Part.makeCylinder(self._holeDiameter / 2.0, thickness, FreeCAD.Vector(0,self._holeCenter,0), FreeCAD.Vector(1,0,0))
-
-                # Rotate around the centerline
-                aTrsf=FreeCAD.Matrix()
-                aTrsf.rotateX(((i * 2.0 *math.pi) / self._holeCount) + math.radians(self._holeOffset) + math.pi/2.0)
-                hole.transformShape(aTrsf)
-                bulkhead = bulkhead.cut(hole)
+                length += self._stepThickness
+            bulkhead = Part.makeCompound([bulkhead] + self._holeOverlay(0, length))
 
         return bulkhead
         
-    def draw(self):
-        if not self.isValidShape():
-            return
-
-        try:
-            self._obj.Shape = self._drawBulkhead()
-            self._obj.Placement = self._placement
-        except (ZeroDivisionError, Part.OCCError):
-            _err(translate('Rocket', "Bulkhead parameters produce an invalid shape"))
-            return
+    def _invalidShape(self):
+        _err(translate('Rocket', "Bulkhead parameters produce an invalid shape"))
+
+    def build(self):
+        return self._drawBulkhead()
@@ -0,0 +1,260 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Generate 3D models for the parts database catalog"""
+
+__title__ = "FreeCAD Rocket Catalog Models"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+
+import FreeCAD
+
+from App.Constants import FEATURE_NOSE_CONE, FEATURE_TRANSITION, FEATURE_BODY_TUBE
+from App.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, \
+    TYPE_SECANT_OGIVE, TYPE_PARABOLA, TYPE_VON_KARMAN, TYPE_PARABOLIC, TYPE_POWER, TYPE_HAACK
+from App.ParametricSweep import buildVariants, writeOutputs, processCount, FORMAT_BREP
+from App.Parts.PartDatabase import PartDatabase
+from App.Parts.BodyTube import listBodyTubes, getBodyTube
+from App.Parts.NoseCone import listNoseCones, getNoseCone
+from App.Parts.Transition import listTransitions, getTransition
+
+# Increment when a change to a shape handler changes the geometry it generates for the same
+# dimensions. Cached models from older versions are then regenerated
+HANDLER_VERSIONS = {
+    FEATURE_NOSE_CONE : 1,
+    FEATURE_TRANSITION : 1,
+    FEATURE_BODY_TUBE : 1
+}
+
+INDEX = "catalog.json"
+
+# Catalog shape names are not always capitalized the same way as the workbench types
+_shapes = {shape.lower() : shape for shape in [TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, TYPE_OGIVE,
+    TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE, TYPE_PARABOLA, TYPE_VON_KARMAN, TYPE_PARABOLIC, TYPE_POWER, TYPE_HAACK]}
+
+def _mm(value, units):
+    # Normalized so that equivalent dimensions in different units hash the same
+    if not units:
+        return 0.0
+    return round(FreeCAD.Units.Quantity(str(value) + str(units)).Value, 6)
+
+def _shape(shape):
+    return _shapes.get(str(shape).lower(), str(shape))
+
+def noseParameters(row):
+    """ Object properties for a getNoseCone() record, as set by the nose cone database lookup """
+    thickness = _mm(row["thickness"], row["thickness_units"])
+    shoulderDiameter = _mm(row["shoulder_diameter"], row["shoulder_diameter_units"])
+    shoulderLength = _mm(row["shoulder_length"], row["shoulder_length_units"])
+    return {
+        "NoseType" : _shape(row["shape"]),
+        "NoseStyle" : str(row["style"]),
+        "Length" : _mm(row["length"], row["length_units"]),
+        "Diameter" : _mm(row["diameter"], row["diameter_units"]),
+        "BluntedDiameter" : 0.0,
+        "Thickness" : thickness,
+        "Shoulder" : (shoulderDiameter > 0.0) and (shoulderLength > 0.0),
+        "ShoulderDiameter" : shoulderDiameter,
+        "ShoulderLength" : shoulderLength,
+        "ShoulderThickness" : thickness,
+        "Coefficient" : 0.0,
+        "OgiveDiameter" : 120.0,
+        "Resolution" : 100
+    }
+
+def transitionParameters(row):
+    """ Object properties for a getTransition() record, as set by the transition database lookup """
+    thickness = _mm(row["thickness"], row["thickness_units"])
+    foreShoulderDiameter = _mm(row["fore_shoulder_diameter"], row["fore_shoulder_diameter_units"])
+    foreShoulderLength = _mm(row["fore_shoulder_length"], row["fore_shoulder_length_units"])
+    aftShoulderDiameter = _mm(row["aft_shoulder_diameter"], row["aft_shoulder_diameter_units"])
+    aftShoulderLength = _mm(row["aft_shoulder_length"], row["aft_shoulder_length_units"])
+    return {
+        "TransitionType" : _shape(row["shape"]),
+        "TransitionStyle" : str(row["style"]),
+        "Length" : _mm(row["length"], row["length_units"]),
+        "ForeDiameter" : _mm(row["fore_outside_diameter"], row["fore_outside_diameter_units"]),
+        "AftDiameter" : _mm(row["aft_outside_diameter"], row["aft_outside_diameter_units"]),
+        "CoreDiameter" : 0.0,
+        "Thickness" : thickness,
+        "Coefficient" : 0.0,
+        "Clipped" : True,
+        "ForeShoulder" : (foreShoulderDiameter > 0.0) and (foreShoulderLength > 0.0),
+        "ForeShoulderDiameter" : foreShoulderDiameter,
+        "ForeShoulderLength" : foreShoulderLength,
+        "ForeShoulderThickness" : thickness,
+        "AftShoulder" : (aftShoulderDiameter > 0.0) and (aftShoulderLength > 0.0),
+        "AftShoulderDiameter" : aftShoulderDiameter,
+        "AftShoulderLength" : aftShoulderLength,
+        "AftShoulderThickness" : thickness
+    }
+
+def bodyTubeParameters(row):
+    """ Object properties for a getBodyTube() record, as set by the body tube database lookup """
+    return {
+        "InnerDiameter" : _mm(row["inner_diameter"], row["inner_diameter_units"]),
+        "OuterDiameter" : _mm(row["outer_diameter"], row["outer_diameter_units"]),
+        "Length" : _mm(row["length"], row["length_units"])
+    }
+
+def modelHash(feature, parameters):
+    """ Content address of the model generated for the parameters """
+    content = json.dumps({
+        "feature" : feature,
+        "version" : HANDLER_VERSIONS[feature],
+        "parameters" : parameters
+    }, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+def catalogRecords(connection):
+    """ Returns (record key, feature, record, parameters) for every nose cone, transition and tube """
+    records = []
+    for row in listNoseCones(connection):
+        record = getNoseCone(connection, row["nose_index"])
+        records.append(("%s:%d" % (FEATURE_NOSE_CONE, row["nose_index"]), FEATURE_NOSE_CONE, record, noseParameters(record)))
+    for row in listTransitions(connection):
+        record = getTransition(connection, row["transition_index"])
+        records.append(("%s:%d" % (FEATURE_TRANSITION, row["transition_index"]), FEATURE_TRANSITION, record, transitionParameters(record)))
+    for row in listBodyTubes(connection):
+        record = getBodyTube(connection, row["body_tube_index"])
+        records.append(("%s:%d" % (FEATURE_BODY_TUBE, row["body_tube_index"]), FEATURE_BODY_TUBE, record, bodyTubeParameters(record)))
+    return records
+
+def _cachePath(cacheDir, digest):
+    # Spread the models over subdirectories to keep the directories small
+    return os.path.join(cacheDir, digest[:2], digest)
+
+def _existingFiles(cacheDir, entry):
+    return [name for name in entry["files"] if os.path.exists(os.path.join(cacheDir, name))]
+
+def _fileFormats(files):
+    return set([os.path.splitext(name)[1][1:] for name in files])
+
+def _isCached(cacheDir, entry, formats):
+    # Models that failed to build aren't retried until the parameters change
+    if entry["error"] is not None:
+        return True
+    files = _existingFiles(cacheDir, entry)
+    return len(files) == len(entry["files"]) and _fileFormats(files) >= set(formats)
+
+def _convertCached(cacheDir, digest, entry, formats):
+    """ Write the formats missing from a cached model from its BREP file. Returns False if there's
+        no BREP file to convert from """
+    files = _existingFiles(cacheDir, entry)
+    breps = [name for name in files if name.endswith("." + FORMAT_BREP)]
+    if len(breps) == 0:
+        return False
+
+    with open(os.path.join(cacheDir, breps[0])) as brepFile:
+        brep = brepFile.read()
+    missing = [format for format in formats if format not in _fileFormats(files)]
+    written = [os.path.join(digest[:2], name) for name in writeOutputs(brep, _cachePath(cacheDir, digest), missing)]
+    entry["files"] = files + written
+    return True
+
+def _readIndex(cacheDir):
+    try:
+        with open(os.path.join(cacheDir, INDEX)) as indexFile:
+            return json.load(indexFile)
+    except (OSError, ValueError):
+        return {"records" : {}}
+
+def generateCatalogModels(cacheDir, formats=(FORMAT_BREP,), processes=None, rootFolder=None):
+    """ Generate models for the catalog records whose content hash isn't already in the cache.
+        Returns the updated index, which maps each record to its hash and model files """
+    if rootFolder is None:
+        rootFolder = FreeCAD.getUserAppDataDir() + "Mod/Rocket/"
+    connection = PartDatabase(rootFolder).getConnection()
+    connection.row_factory = sqlite3.Row
+    try:
+        records = catalogRecords(connection)
+    finally:
+        connection.close()
+
+    previous = _readIndex(cacheDir)
+    built = {}
+    for entry in previous["records"].values():
+        built[entry["hash"]] = entry
+
+    # Records with the same dimensions share a model, so only build each hash once
+    tasks = []
+    queued = set()
+    hashes = {}
+    for key, feature, record, parameters in records:
+        digest = modelHash(feature, parameters)
+        hashes[key] = digest
+        cached = built.get(digest)
+        if cached is not None and digest not in queued:
+            if _isCached(cacheDir, cached, formats) or _convertCached(cacheDir, digest, cached, formats):
+                continue
+        if digest not in queued:
+            queued.add(digest)
+            tasks.append((digest, feature, parameters))
+
+    start = time.perf_counter()
+    for result in buildVariants(tasks, processes):
+        digest = result["index"]
+        files = []
+        if result["brep"] is not None:
+            path = _cachePath(cacheDir, digest)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            files = [os.path.join(digest[:2], name) for name in writeOutputs(result["brep"], path, formats)]
+
+            # Keep any other formats written by earlier runs
+            earlier = built.get(digest)
+            if earlier is not None:
+                files += [name for name in _existingFiles(cacheDir, earlier) if name not in files]
+        built[digest] = {
+            "hash" : digest,
+            "volume" : result["volume"],
+            "build" : result["build"],
+            "files" : files,
+            "error" : result["error"]
+        }
+
+    index = {
+        "formats" : list(formats),
+        "processes" : processCount(processes),
+        "generated" : len(tasks),
+        "elapsed" : time.perf_counter() - start,
+        "records" : {}
+    }
+    for key, feature, record, parameters in records:
+        entry = dict(built[hashes[key]])
+        entry.update({
+            "feature" : feature,
+            "manufacturer" : record["manufacturer"],
+            "part_number" : record["part_number"],
+            "description" : record["description"],
+            "parameters" : parameters
+        })
+        index["records"][key] = entry
+
+    os.makedirs(cacheDir, exist_ok=True)
+    with open(os.path.join(cacheDir, INDEX), "w") as indexFile:
+        json.dump(index, indexFile, indent=2)
+
+    return index
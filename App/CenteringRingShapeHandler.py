@@ -30,11 +30,13 @@ import Part
 from DraftTools import translate
 
 from App.BulkheadShapeHandler import BulkheadShapeHandler
+from App.Geometry.MassProperties import cylinderMassProperties, notchMassProperties, \
+    notchHoleMassProperties
 from App.Utilities import _err
 
 class CenteringRingShapeHandler(BulkheadShapeHandler):
-    def __init__(self, obj):
-        super().__init__(obj)
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
         self._centerDiameter = float(obj.CenterDiameter)
 
@@ -42,67 +44,76 @@ class CenteringRingShapeHandler(BulkheadShapeHandler):
         self._notchWidth = float(obj.NotchWidth)
         self._notchHeight = float(obj.NotchHeight)
 
-    def isValidShape(self):
-        if not super().isValidShape():
-            return
+    def _validate(self):
+        message = super()._validate()
+        if message is not None:
+            return message
 
         # Perform some general validations
         if self._centerDiameter <= 0:
-            _err(translate('Rocket', "Centering ring center diameter must be greater than zero"))
-            return False
+            return translate('Rocket', "Centering ring center diameter must be greater than zero")
 
         if self._centerDiameter >= self._diameter:
-            _err(translate('Rocket', "Centering ring center diameter must be less than the outer diameter"))
-            return False
+            return translate('Rocket', "Centering ring center diameter must be less than the outer diameter")
 
         if self._step:
             if self._centerDiameter >= self._stepDiameter:
-                _err(translate('Rocket', "Centering ring center diameter must be less than the step diameter"))
-                return False
+                return translate('Rocket', "Centering ring center diameter must be less than the step diameter")
 
         if self._notched:
             if self._notchWidth > self._centerDiameter:
-                _err(translate('Rocket', "The notch width must be less than or equal to the center diameter"))
-                return False
+                return translate('Rocket', "The notch width must be less than or equal to the center diameter")
             if self._notchWidth <= 0:
-                _err(translate('Rocket', "The notch width must be greater than zero"))
-                return False
+                return translate('Rocket', "The notch width must be greater than zero")
             if self._notchHeight <= 0:
-                _err(translate('Rocket', "The notch height must be greater than zero"))
-                return False
+                return translate('Rocket', "The notch height must be greater than zero")
 
         if self._holes:
             if self._holeCenter - (self._holeDiameter / 2.0) <= (self._centerDiameter / 2.0):
-                _err(translate('Rocket', "Hole extends inside the center diameter"))
-                return False
+                return translate('Rocket', "Hole extends inside the center diameter")
 
-        return True
+        return None
 
-    def _drawCenteringRing(self):
-        bulkhead = self._drawBulkhead()
+    def _crossSectionTools(self):
+        tools = super()._crossSectionTools()
 
         # Add CR hole
-        thickness = self._thickness
-        if self._step:
-            thickness += self._stepDiameter
         centerRadius = self._centerDiameter / 2.0
+        tools.append(self._circle(centerRadius))
+
+        if self._notched:
+            halfWidth = self._notchWidth / 2.0
+            top = self._notchHeight + centerRadius
+            notch = Part.makePolygon([FreeCAD.Vector(0, halfWidth, 0), FreeCAD.Vector(0, halfWidth, top),
+                                      FreeCAD.Vector(0, -halfWidth, top), FreeCAD.Vector(0, -halfWidth, 0),
+                                      FreeCAD.Vector(0, halfWidth, 0)])
+            tools.append(Part.Face(notch))
+
+        return tools
 
-        hole = Part.makeCylinder(centerRadius, thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
-        cr = bulkhead.cut(hole)
+    def _removedMassProperties(self, radius, start, length):
+        removed = super()._removedMassProperties(radius, start, length)
+
+        centerRadius = self._centerDiameter / 2.0
+        removed.append(cylinderMassProperties(centerRadius, length, (start + length / 2.0, 0.0, 0.0)))
 
         if self._notched:
-            hole = Part.makeBox(self._notchHeight + centerRadius, self._notchWidth, thickness, FreeCAD.Vector(0,self._notchWidth / 2,0), FreeCAD.Vector(1,0,0))
-            cr = cr.cut(hole)
+            top = self._notchHeight + centerRadius
+            removed.append(notchMassProperties(self._notchWidth, top, centerRadius, radius, start, length))
+
+            # Holes that run into the notch would otherwise have their overlap removed twice
+            for center in self._holeCenters():
+                overlap = notchHoleMassProperties(self._notchWidth, top, self._holeDiameter / 2.0, center, start, length)
+                if overlap.volume > 0:
+                    removed.append(-overlap)
+
+        return removed
 
-        return cr
+    def _drawCenteringRing(self):
+        return self._drawBulkhead()
         
-    def draw(self):
-        if not self.isValidShape():
-            return
-
-        try:
-            self._obj.Shape = self._drawCenteringRing()
-            self._obj.Placement = self._placement
-        except (ZeroDivisionError, Part.OCCError):
-            _err(translate('Rocket', "Centering ring parameters produce an invalid shape"))
-            return
+    def _invalidShape(self):
+        _err(translate('Rocket', "Centering ring parameters produce an invalid shape"))
+
+    def build(self):
+        return self._drawCenteringRing()
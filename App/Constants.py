@@ -32,6 +32,7 @@ FEATURE_BULKHEAD = "RocketBulkhead"
 FEATURE_BODY_TUBE = "RocketBodyTube"
 FEATURE_CENTERING_RING = "RocketCenteringRing"
 FEATURE_FIN = "RocketFin"
+FEATURE_FIN_CAN = "RocketFinCan"
 FEATURE_NOSE_CONE = "RocketNoseCone"
 FEATURE_TRANSITION = "RocketTransition"
 FEATURE_LAUNCH_LUG = "RocketLaunchLug"
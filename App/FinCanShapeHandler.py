@@ -0,0 +1,130 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for drawing fin cans"""
+
+__title__ = "FreeCAD Fin Can Handler"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+import FreeCAD
+import Part
+import math
+
+from DraftTools import translate
+
+from App.BodyTubeShapeHandler import BodyTubeShapeHandler
+from App.ShapeHandler import ShapeHandler, BoundedCache
+from App.Utilities import _err
+
+# Fins are cached by their parameters so that changing the fin count or the sleeve
+# doesn't regenerate the fin lofts
+FIN_CACHE_SIZE = 16
+_finCache = BoundedCache(FIN_CACHE_SIZE)
+
+def clearFinCache():
+    _finCache.clear()
+
+class FinCanShapeHandler(ShapeHandler):
+    def __init__(self, obj, finHandler, draft=False):
+        super().__init__(obj, draft)
+
+        self._finHandler = finHandler
+        self._tubeHandler = BodyTubeShapeHandler(obj)
+
+        self._finCount = int(obj.FinCount)
+        self._ID = float(obj.InnerDiameter)
+        self._OD = float(obj.OuterDiameter)
+        self._length = float(obj.Length)
+        self._leadingEdgeOffset = float(obj.LeadingEdgeOffset)
+        self._parameters = finHandler._parameters
+
+    def isValidShape(self):
+        if not self._tubeHandler.isValidShape():
+            return False
+        if not self._finHandler.isValidShape():
+            return False
+
+        if self._finCount < 1:
+            _err(translate('Rocket', "Fin count must be at least 1"))
+            return False
+        if self._leadingEdgeOffset >= self._length:
+            _err(translate('Rocket', "Fin leading edge offset must be less than the fin can length"))
+            return False
+        if self._parameters.Ttw and float(self._parameters.TtwHeight) > (self._OD - self._ID) / 2.0:
+            _err(translate('Rocket', "Ttw height must not be greater than the fin can wall thickness"))
+            return False
+
+        return True
+
+    def _fin(self):
+        key = self._finHandler._shapeKey()
+        if key is not None:
+            fin = _finCache.get(key)
+            if fin is not None:
+                return fin
+
+        fin = self._finHandler._drawFin()
+        if fin is not None and key is not None:
+            _finCache.put(key, fin)
+        return fin
+
+    def _rootDepth(self):
+        # Sink the fin root far enough that its corners meet the curved sleeve surface
+        radius = self._OD / 2.0
+        halfThickness = float(self._parameters.RootThickness) / 2.0
+        if halfThickness >= radius:
+            return radius
+        return radius - math.sqrt(radius * radius - halfThickness * halfThickness)
+
+    def _drawFins(self, fin):
+        box = fin.BoundBox
+        if box.XLength > (self._length - self._leadingEdgeOffset):
+            _err(translate('Rocket', "Fins extend past the aft end of the fin can"))
+            return None
+
+        x = self._length - self._leadingEdgeOffset - box.XMax
+        z = self._OD / 2.0 - self._rootDepth()
+
+        fins = []
+        for i in range(self._finCount):
+            copy = fin.copy()
+            copy.translate(FreeCAD.Vector(x, 0, z))
+            copy.rotate(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1, 0, 0), i * 360.0 / self._finCount)
+            fins.append(copy)
+        return fins
+
+    def _invalidShape(self):
+        _err(translate('Rocket', "Fin can parameters produce an invalid shape"))
+
+    def build(self):
+        fin = self._fin()
+        if fin is None:
+            _err(translate('Rocket', "Fin parameters produce an invalid shape"))
+            return None
+
+        fins = self._drawFins(fin)
+        if fins is None:
+            return None
+
+        # A single general fuse of the sleeve and all fins is much faster than fusing
+        # each fin in turn, as the intersections are only computed once
+        tube = self._tubeHandler._drawTube(self._tubeHandler._drawTubeEdges())
+        return tube.multiFuse(fins).removeSplitter()
@@ -32,13 +32,16 @@ from App.Constants import FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL,
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LETE
 
 from App.FinShapeHandler import FinShapeHandler
+from App.ShapeHandler import DRAFT_CROSS_SECTIONS
 
-CROSS_SECTIONS = 100  # Number of cross sections for the ellipse
+CROSS_SECTIONS = 100  # Maximum number of cross sections for the ellipse
+MIN_CROSS_SECTIONS = 4
+ELLIPSE_TOLERANCE = 0.1 # Maximum deviation in mm of the section outline from the true ellipse
 
 class FinEllipseShapeHandler(FinShapeHandler):
 
-    def __init__(self, obj):
-        super().__init__(obj)
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
     def _radiusAt(self, chord, height, x):
         major = height
@@ -46,6 +49,25 @@ class FinEllipseShapeHandler(FinShapeHandler):
         y = (minor / major) * math.sqrt(major * major - x * x)
         return y
 
+    def _crossSections(self):
+        # The number of sections needed to keep the chordal deviation of the sections from the planform
+        # within tolerance, when spaced evenly around the ellipse
+        a = max(float(self._parameters.RootChord) / 2.0, float(self._parameters.Height))
+        if a <= ELLIPSE_TOLERANCE:
+            return MIN_CROSS_SECTIONS
+        step = math.sqrt(8.0 * ELLIPSE_TOLERANCE / a)
+        count = int(math.ceil((math.pi / 2.0) / step))
+        if self._draft:
+            count = min(count, DRAFT_CROSS_SECTIONS)
+        return max(MIN_CROSS_SECTIONS, min(CROSS_SECTIONS, count))
+
+    def _sectionHeights(self):
+        # Sections are spaced evenly in the ellipse parameter rather than in height, putting more of
+        # them near the tip where the chord changes fastest. The tip is not included
+        count = self._crossSections()
+        height = float(self._parameters.Height)
+        return [height * math.sin(i * (math.pi / 2.0) / count) for i in range(count)]
+
     def _halfEllipse(self, major, minor, thickness, midChord):
         if major > minor:
             ellipse = Part.Ellipse(FreeCAD.Vector(midChord, thickness, major), 
@@ -65,17 +87,17 @@ class FinEllipseShapeHandler(FinShapeHandler):
 
     def _taperedEllipse(self):
         # The loft is 3 ellipses, center and both sides
-        midChord = float(self._obj.RootChord) / 2.0
-        height = float(self._obj.Height)
+        midChord = float(self._parameters.RootChord) / 2.0
+        height = float(self._parameters.Height)
         center = self._halfEllipse(height, midChord, 0, midChord)
 
-        halfThickness = float(self._obj.RootThickness) / 2.0
-        if self._obj.RootPerCent:
-            length = float(self._obj.RootChord) * (float(self._obj.RootLength1) / 100.0)
+        halfThickness = float(self._parameters.RootThickness) / 2.0
+        if self._parameters.RootPerCent:
+            length = float(self._parameters.RootChord) * (float(self._parameters.RootLength1) / 100.0)
         else:
-            length = float(self._obj.RootLength1)
+            length = float(self._parameters.RootLength1)
         radius = midChord - length
-        height = float(self._obj.Height) - length
+        height = float(self._parameters.Height) - length
         side1 = self._halfEllipse(height, radius, -halfThickness, midChord)
         side2 = self._halfEllipse(height, radius,  halfThickness, midChord)
 
@@ -83,9 +105,9 @@ class FinEllipseShapeHandler(FinShapeHandler):
 
     def _squareEllipse(self):
         # The loft is 3 ellipses, center and both sides
-        midChord = float(self._obj.RootChord) / 2.0
-        height = float(self._obj.Height)
-        halfThickness = float(self._obj.RootThickness) / 2.0
+        midChord = float(self._parameters.RootChord) / 2.0
+        height = float(self._parameters.Height)
+        halfThickness = float(self._parameters.RootThickness) / 2.0
 
         side1 = self._halfEllipse(height, midChord, -halfThickness, midChord)
         side2 = self._halfEllipse(height, midChord,  halfThickness, midChord)
@@ -93,51 +115,50 @@ class FinEllipseShapeHandler(FinShapeHandler):
         return [side1, side2]
 
     def _makeProfiles(self):
-        if self._obj.RootCrossSection == FIN_CROSS_TAPER_LETE:
+        if self._parameters.RootCrossSection == FIN_CROSS_TAPER_LETE:
             return self._taperedEllipse()
-        if self._obj.RootCrossSection == FIN_CROSS_SQUARE:
+        if self._parameters.RootCrossSection == FIN_CROSS_SQUARE:
             return self._squareEllipse()
 
         ellipses = []
-        midChord = float(self._obj.RootChord) / 2.0
-        tapered = self._obj.RootCrossSection in [FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND]
-        if self._obj.RootPerCent:
-            rootLength2 = float(self._obj.RootLength2)
+        midChord = float(self._parameters.RootChord) / 2.0
+        tapered = self._parameters.RootCrossSection in [FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND]
+        if self._parameters.RootPerCent:
+            rootLength2 = float(self._parameters.RootLength2)
         else:
-            rootLength2 = float(self._obj.RootChord) - float(self._obj.RootLength2)
-        for i in range(CROSS_SECTIONS):
-            height = i * float(self._obj.Height) / float(CROSS_SECTIONS)
-            radius = self._radiusAt(float(self._obj.RootChord), float(self._obj.Height), height)
+            rootLength2 = float(self._parameters.RootChord) - float(self._parameters.RootLength2)
+        for height in self._sectionHeights():
+            radius = self._radiusAt(float(self._parameters.RootChord), float(self._parameters.Height), height)
             if tapered:
-                thickness = 2.0 * self._radiusAt(float(self._obj.RootThickness) / 2.0, float(self._obj.Height), height)
+                thickness = 2.0 * self._radiusAt(float(self._parameters.RootThickness) / 2.0, float(self._parameters.Height), height)
             else:
-                thickness = float(self._obj.RootThickness)
+                thickness = float(self._parameters.RootThickness)
             # print("%d:(%f,%f)" % (i, height, radius))
-            ellipses.append(self._makeChordProfile(self._obj.RootCrossSection,
+            ellipses.append(self._makeChordProfile(self._parameters.RootCrossSection,
                 midChord + radius,
                 radius * 2.0,
-                thickness, #float(self._obj.RootThickness), # need to fix this
+                thickness, #float(self._parameters.RootThickness), # need to fix this
                 height,
-                self._obj.RootPerCent,
-                float(self._obj.RootLength1),
+                self._parameters.RootPerCent,
+                float(self._parameters.RootLength1),
                 rootLength2,
                 midChordLimit = True
             ))
 
         # The tip is a special case
         radius = 1e-6 # Really small radius
-        # print("last:(%f,%f)" % (float(self._obj.Height), radius))
+        # print("last:(%f,%f)" % (float(self._parameters.Height), radius))
         if tapered:
             thickness = radius
         else:
-            thickness = float(self._obj.RootThickness)
-        ellipses.append(self._makeChordProfile(self._obj.RootCrossSection,
+            thickness = float(self._parameters.RootThickness)
+        ellipses.append(self._makeChordProfile(self._parameters.RootCrossSection,
             midChord + radius,
             radius * 2.0,
             thickness, # need to fix this
-            float(self._obj.Height),
-            self._obj.RootPerCent,
-            float(self._obj.RootLength1),
+            float(self._parameters.Height),
+            self._parameters.RootPerCent,
+            float(self._parameters.RootLength1),
             rootLength2,
             midChordLimit = True
         ))
@@ -26,241 +26,76 @@ __url__ = "https://www.davesrocketshop.com"
     
 import FreeCAD
 import Part
-import math
 
 from DraftTools import translate
 
-from App.Constants import FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, \
-    FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE
+from App.Constants import FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL
 
+from App.FinTemplates import crossSectionTemplate, airfoilFileTemplate, airfoilFileHash
+from App.ShapeHandler import ShapeHandler, ParameterSnapshot
 from App.Utilities import _err
 
-class FinShapeHandler:
+FUZZY_TOLERANCE = 1e-5 # Fuzzy value in mm used when fusing lofts
 
-    def __init__(self, obj):
-        self._obj = obj
+class FinShapeHandler(ShapeHandler):
 
-        # This gets changed when redrawn so it's very important to save a copy
-        self._placement = obj.Placement
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
-    def _makeChordProfileSquare(self, foreX, chord, thickness, height):
-        # Create the root rectangle
-        chordFore = foreX
-        chordAft = foreX - chord
-        halfThickness = thickness / 2
-        v1 = FreeCAD.Vector(chordFore, halfThickness, height)
-        v2 = FreeCAD.Vector(chordFore, -halfThickness, height)
-        v3 = FreeCAD.Vector(chordAft, -halfThickness, height)
-        v4 = FreeCAD.Vector(chordAft, halfThickness, height)
-        line1 = Part.LineSegment(v1, v2)
-        line2 = Part.LineSegment(v2, v3)
-        line3 = Part.LineSegment(v3, v4)
-        line4 = Part.LineSegment(v4, v1)
-        
-        wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape()])
-        return wire
+        # The fin parameters are read while building, so they're taken from a copy
+        self._parameters = ParameterSnapshot(obj)
 
     def _makeChordProfileRound(self, foreX, chord, thickness, height):
         # For now, rounded is an ellipse shape
         ellipse = Part.Ellipse(FreeCAD.Vector(foreX - (chord / 2.0), 0, height), chord / 2.0, thickness / 2.0)
         wire = Part.Wire([ellipse.toShape()])
         return wire
-            
-    def _airfoilY(self, x, maxThickness):
-        # NACA symmetrical airfoil https://en.wikipedia.org/wiki/NACA_airfoil
-        # y = 5 * maxThickness * ((0.2969 * math.sqrt(x)) - (0.1260 * x) - (0.3516 * x * x) + (0.2843 * x * x * x) - (0.1015 * x * x * x * x))
-
-        # Apply Horner's rule
-        y = 5 * maxThickness * (0.2969 * math.sqrt(x) + x * (-0.1260 +  x * (-0.3516 + x * (0.2843 - x * 0.1015))))
-        return y
-
-    def _airfoilCurve(self, foreX, chord, thickness, height, resolution):
-        points = []
-        for i in range(0, resolution):
-            
-            x = float(i) / float(resolution)
-            y = self._airfoilY(x, thickness)
-            points.append(FreeCAD.Vector(foreX - (x * chord), y, height))
-
-        points.append(FreeCAD.Vector(foreX - chord, 0.0, height))
-
-        # Circle back for the other side of the airfoil
-        for i in range(0, resolution):
-            vector = points[resolution - i]
-            points.append(FreeCAD.Vector(vector.x, -vector.y, vector.z))
-        points.append(FreeCAD.Vector(foreX, 0.0, height))
-
-        return points 
-
-    def _makeSpline(self, points):
-        spline = Part.BSplineCurve()
-        spline.buildFromPoles(points)
-        return spline
-
-    def _midForeChordLimit(self, chord, value, midChordLimit):
-        if midChordLimit and value > (chord / 2.0):
-            return chord / 2.0
-        return value
-
-    def _midAftChordLimit(self, chord, value, midChordLimit):
-        if midChordLimit and value > (chord / 2.0):
-            return chord / 2.0
-        return value
 
-    def _makeChordProfileAirfoil(self, foreX, chord, thickness, height):
-        # Standard NACA 4 digit symmetrical airfoil
-
-        points = self._airfoilCurve(foreX, chord, thickness, height, 100)
-        spline = self._makeSpline(points)
-
-        wire = Part.Wire([spline.toShape()])
-        return wire
-
-    def _makeChordProfileWedge(self, foreX, chord, thickness, height):
-        # Create the root rectangle
-        chordFore = foreX
-        chordAft = foreX - chord
-        halfThickness = thickness / 2
-        v1 = FreeCAD.Vector(chordFore, 0.0, height)
-        v2 = FreeCAD.Vector(chordAft, -halfThickness, height)
-        v3 = FreeCAD.Vector(chordAft, halfThickness, height)
-        line1 = Part.LineSegment(v1, v2)
-        line2 = Part.LineSegment(v1, v3)
-        line3 = Part.LineSegment(v2, v3)
-        
-        wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape()])
-        return wire
-
-    def _makeChordProfileDiamond(self, foreX, chord, thickness, height, maxChord):
-        chordFore = foreX
-        chordMid = foreX - maxChord
-        chordAft = foreX - chord
-        halfThickness = thickness / 2
-        v1 = FreeCAD.Vector(chordFore, 0.0, height)
-        v2 = FreeCAD.Vector(chordMid, halfThickness, height)
-        v3 = FreeCAD.Vector(chordMid, -halfThickness, height)
-        v4 = FreeCAD.Vector(chordAft, 0.0, height)
-        line1 = Part.LineSegment(v1, v2)
-        line2 = Part.LineSegment(v2, v4)
-        line3 = Part.LineSegment(v4, v3)
-        line4 = Part.LineSegment(v3, v1)
-        
-        wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape()])
-        return wire
-
-    def _makeChordProfileTaperLE(self, foreX, chord, thickness, height, maxChord):
-        chordFore = foreX
-        chordMid = foreX - maxChord
-        chordAft = foreX - chord
-        halfThickness = thickness / 2
-        v1 = FreeCAD.Vector(chordFore, 0.0, height)
-        v2 = FreeCAD.Vector(chordMid, halfThickness, height)
-        v3 = FreeCAD.Vector(chordMid, -halfThickness, height)
-        v4 = FreeCAD.Vector(chordAft, halfThickness, height)
-        v5 = FreeCAD.Vector(chordAft, -halfThickness, height)
-        line1 = Part.LineSegment(v1, v2)
-        line2 = Part.LineSegment(v2, v4)
-        line3 = Part.LineSegment(v4, v5)
-        line4 = Part.LineSegment(v5, v3)
-        line5 = Part.LineSegment(v3, v1)
-        
-        wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape(), line5.toShape()])
-        return wire
-
-    def _makeChordProfileTaperTE(self, foreX, chord, thickness, height, maxChord):
-        chordFore = foreX
-        chordMid = foreX - chord + maxChord
-        chordAft = foreX - chord
-        halfThickness = thickness / 2
-        v1 = FreeCAD.Vector(chordAft, 0.0, height)
-        v2 = FreeCAD.Vector(chordMid, halfThickness, height)
-        v3 = FreeCAD.Vector(chordMid, -halfThickness, height)
-        v4 = FreeCAD.Vector(chordFore, halfThickness, height)
-        v5 = FreeCAD.Vector(chordFore, -halfThickness, height)
-        line1 = Part.LineSegment(v1, v2)
-        line2 = Part.LineSegment(v2, v4)
-        line3 = Part.LineSegment(v4, v5)
-        line4 = Part.LineSegment(v5, v3)
-        line5 = Part.LineSegment(v3, v1)
-        
-        wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape(), line5.toShape()])
-        return wire
-
-    def _makeChordProfileTaperLETE(self, foreX, chord, thickness, height, foreChord, aftChord, midChordLimit):
-        chordFore = foreX
-        chordFore1 = foreX - self._midForeChordLimit(chord, foreChord, midChordLimit)
-        chordAft1 = foreX - chord + self._midAftChordLimit(chord, aftChord, midChordLimit)
-        chordAft = foreX - chord
-        halfThickness = thickness / 2
-
-        v1 = FreeCAD.Vector(chordFore, 0.0, height)
-        v2 = FreeCAD.Vector(chordFore1, halfThickness, height)
-        v3 = FreeCAD.Vector(chordFore1, -halfThickness, height)
-        v4 = FreeCAD.Vector(chordAft1, halfThickness, height)
-        v5 = FreeCAD.Vector(chordAft1, -halfThickness, height)
-        v6 = FreeCAD.Vector(chordAft, 0, height)
-        if chordFore1 == chordAft1:
-            line1 = Part.LineSegment(v1, v2)
-            line2 = Part.LineSegment(v2, v6)
-            line3 = Part.LineSegment(v6, v3)
-            line4 = Part.LineSegment(v3, v1)
-
-            wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape()])
-        else:
-            line1 = Part.LineSegment(v1, v2)
-            line2 = Part.LineSegment(v2, v4)
-            line3 = Part.LineSegment(v4, v6)
-            line4 = Part.LineSegment(v6, v5)
-            line5 = Part.LineSegment(v5, v3)
-            line6 = Part.LineSegment(v3, v1)
-
-            wire = Part.Wire([line1.toShape(), line2.toShape(), line3.toShape(), line4.toShape(), line5.toShape(), line6.toShape()])
-        return wire
+    def _template(self, crossSection, fore, aft, midChordLimit):
+        if crossSection == FIN_CROSS_AIRFOIL and hasattr(self._parameters, "AirfoilFile") and self._parameters.AirfoilFile:
+            template = airfoilFileTemplate(self._parameters.AirfoilFile)
+            if template is not None:
+                return template
+        return crossSectionTemplate(crossSection, fore, aft, midChordLimit)
 
     def _makeChordProfile(self, crossSection, foreX, chord, thickness, height, lengthPerCent, length1, length2, midChordLimit = True):
-        l1 = length1
-        l2 = length2
+        if crossSection == FIN_CROSS_ROUND:
+            return self._makeChordProfileRound(foreX, chord, thickness, height)
+
+        # The unit templates use lengths as fractions of the chord
+        fore = 0.0
+        aft = 0.0
         if lengthPerCent:
-            l1 = chord * (length1 / 100.0)
-            l2 = chord * ((100.0 - length2) / 100.0)
+            fore = length1 / 100.0
+            aft = (100.0 - length2) / 100.0
+        elif chord > 0:
+            fore = length1 / chord
+            aft = length2 / chord
 
-        if crossSection == FIN_CROSS_SQUARE:
-            return self._makeChordProfileSquare(foreX, chord, thickness, height)
-        elif crossSection == FIN_CROSS_ROUND:
-            return self._makeChordProfileRound(foreX, chord, thickness, height)
-        elif crossSection == FIN_CROSS_AIRFOIL:
-            return self._makeChordProfileAirfoil(foreX, chord, thickness, height)
-        elif crossSection == FIN_CROSS_WEDGE:
-            return self._makeChordProfileWedge(foreX, chord, thickness, height)
-        elif crossSection == FIN_CROSS_DIAMOND:
-            return self._makeChordProfileDiamond(foreX, chord, thickness, height, l1)
-        elif crossSection == FIN_CROSS_TAPER_LE:
-            return self._makeChordProfileTaperLE(foreX, chord, thickness, height, l1)
-        elif crossSection == FIN_CROSS_TAPER_TE:
-            return self._makeChordProfileTaperTE(foreX, chord, thickness, height, l1)
-        elif crossSection == FIN_CROSS_TAPER_LETE:
-            return self._makeChordProfileTaperLETE(foreX, chord, thickness, height, l1, l2, midChordLimit)
+        template = self._template(crossSection, fore, aft, midChordLimit)
+        if template is not None:
+            return template.wire(foreX, chord, thickness, height)
 
         return None
 
     def _makeTtw(self):
         # Create the Ttw tab
-        origin = FreeCAD.Vector(self._obj.RootChord - self._obj.TtwOffset - self._obj.TtwLength, -0.5 * self._obj.TtwThickness, -1.0 * self._obj.TtwHeight)
-        return Part.makeBox(self._obj.TtwLength, self._obj.TtwThickness, self._obj.TtwHeight, origin)
+        origin = FreeCAD.Vector(self._parameters.RootChord - self._parameters.TtwOffset - self._parameters.TtwLength, -0.5 * self._parameters.TtwThickness, -1.0 * self._parameters.TtwHeight)
+        return Part.makeBox(self._parameters.TtwLength, self._parameters.TtwThickness, self._parameters.TtwHeight, origin)
 
     def isValidShape(self):
         # Add error checking here
-        if self._obj.Ttw:
-            if self._obj.TtwOffset >= self._obj.RootChord:
+        if self._parameters.Ttw:
+            if self._parameters.TtwOffset >= self._parameters.RootChord:
                 _err(translate('Rocket', "Ttw offset must be less than the root chord"))
                 return False
-            if self._obj.TtwLength <= 0:
+            if self._parameters.TtwLength <= 0:
                 _err(translate('Rocket', "Ttw length must be greater than 0"))
                 return False
-            if self._obj.TtwHeight <= 0:
+            if self._parameters.TtwHeight <= 0:
                 _err(translate('Rocket', "Ttw height must be greater than 0"))
                 return False
-            if self._obj.TtwThickness <= 0:
+            if self._parameters.TtwThickness <= 0:
                 _err(translate('Rocket', "Ttw thickness must be greater than 0"))
                 return False
         return True
@@ -273,39 +108,58 @@ class FinShapeHandler:
         # Override this id we have a "masking" shape
         return None
 
-    def draw(self):
-        
-        if not self.isValidShape():
-            return
-
-        try:
-            profiles = self._makeProfiles()
-            if profiles is not None and len(profiles) > 0:
-                if isinstance(profiles[0], list):
-                    # Using a compound instead of a fuse makes drawing much faster, but also leads to
-                    # a number of 'BOPAlgo SelfIntersect' errors. Se we stick with the fuse
-
-                    loft = None
-                    for profile in profiles:
-                        if loft is None:
-                            loft = Part.makeLoft(profile, True)
-                        else:
-                            loft = loft.fuse(Part.makeLoft(profile, True))
-                else:
-                    loft = Part.makeLoft(profiles, True)
-
-                if loft is not None:
-                    mask = self._makeCommon()
-                    if mask is not None:
-                        loft = loft.common(mask)
-
-                    if self._obj.Ttw:
-                        ttw = self._makeTtw()
-                        if ttw:
-                            loft = loft.fuse(ttw)
-
-                    self._obj.Shape = loft
-            self._obj.Placement = self._placement
-        except (ZeroDivisionError, Part.OCCError):
-            _err(translate('Rocket', "Fin parameters produce an invalid shape"))
-            return
+    def _airfoilKey(self):
+        # The airfoil file can be edited, so it's identified by its contents
+        obj = self._parameters
+        if FIN_CROSS_AIRFOIL not in [obj.RootCrossSection, obj.TipCrossSection]:
+            return None
+        if not hasattr(obj, "AirfoilFile") or not obj.AirfoilFile:
+            return None
+        return airfoilFileHash(obj.AirfoilFile)
+
+    def _shapeKey(self):
+        # Parameters that completely determine the fin shape, used to cache shapes. Returning
+        # None disables caching
+        obj = self._parameters
+        return (self.__class__.__name__, obj.RootCrossSection, float(obj.RootChord), float(obj.RootThickness),
+                obj.RootPerCent, float(obj.RootLength1), float(obj.RootLength2),
+                obj.TipCrossSection, float(obj.TipChord), float(obj.TipThickness),
+                obj.TipPerCent, float(obj.TipLength1), float(obj.TipLength2),
+                float(obj.Height), float(obj.SweepLength), float(obj.SweepAngle),
+                obj.Ttw, float(obj.TtwOffset), float(obj.TtwLength), float(obj.TtwHeight), float(obj.TtwThickness),
+                self._airfoilKey(), self._draft)
+
+    def _drawFin(self):
+        # Returns the fin shape without assigning it. OCC errors are left to the caller
+        loft = None
+        profiles = self._makeProfiles()
+        if profiles is not None and len(profiles) > 0:
+            if isinstance(profiles[0], list):
+                # Using a compound instead of a fuse makes drawing much faster, but also leads to
+                # a number of 'BOPAlgo SelfIntersect' errors. Instead, all lofts are merged in a
+                # single general fuse. The lofts share their boundary profiles, so a fuzzy value
+                # absorbs the small gaps between the approximated surfaces
+                lofts = [Part.makeLoft(profile, True) for profile in profiles]
+                loft = lofts[0]
+                if len(lofts) > 1:
+                    loft = loft.multiFuse(lofts[1:], FUZZY_TOLERANCE).removeSplitter()
+            else:
+                loft = Part.makeLoft(profiles, True)
+
+            if loft is not None:
+                mask = self._makeCommon()
+                if mask is not None:
+                    loft = loft.common(mask)
+
+                if self._parameters.Ttw and not self._draft:
+                    ttw = self._makeTtw()
+                    if ttw:
+                        loft = loft.fuse(ttw)
+
+        return loft
+
+    def _invalidShape(self):
+        _err(translate('Rocket', "Fin parameters produce an invalid shape"))
+
+    def build(self):
+        return self._drawFin()
@@ -26,6 +26,8 @@ __url__ = "https://www.davesrocketshop.com"
     
 import FreeCAD
 import Part
+import heapq
+import hashlib
 
 from DraftTools import translate
 
@@ -33,12 +35,19 @@ from App.Constants import FIN_CROSS_SQUARE, FIN_CROSS_WEDGE, \
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE
 
 from App.FinShapeHandler import FinShapeHandler
+from App.ShapeHandler import BoundedCache
 from App.Utilities import _err
 
+SKETCH_TOLERANCE = 0.05 # Maximum chord error in mm when discretizing curved sketch edges
+
+# Discretized sketch outlines, keyed by the geometry hash of the sketch
+SEGMENT_CACHE_SIZE = 16
+_segmentCache = BoundedCache(SEGMENT_CACHE_SIZE)
+
 class FinSketchShapeHandler(FinShapeHandler):
 
-    def __init__(self, obj):
-        super().__init__(obj)
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
     def verifyShape(self, shape):
         if shape is None:
@@ -62,72 +71,85 @@ class FinSketchShapeHandler(FinShapeHandler):
                 return True
         return False
 
-    def _pointOnLine(self, z, zmin, zmax):
-        return (zmin <= z) and (zmax >= z)
-
-    def _xOnLine(self, z, vertex1, vertex2):
-        try:
-            zRange = (z - vertex1.Point.z) / (vertex2.Point.z - vertex1.Point.z)
-
-            x = (vertex2.Point.x - vertex1.Point.x) * zRange + vertex1.Point.x
-        except ZeroDivisionError as ex:
-            x = vertex1.Point.x
-        return x
-
-    def _zInVertex(self, z, vertexes, tolerance):
-        if len(vertexes) != 2:
-            _err(translate('Rocket', "Unable to handle shapes other than lines"))
-            return False
+    def _geometryHash(self, shape):
+        return hashlib.sha1(shape.exportBrepToString().encode()).hexdigest()
 
-        return self._pointOnLine(z, vertexes[0].Point.z - tolerance, vertexes[1].Point.z + tolerance) or \
-                self._pointOnLine(z, vertexes[1].Point.z - tolerance, vertexes[0].Point.z + tolerance)
+    def _segments(self, shape):
+        # Read the edge end points once as (x1, z1, x2, z2) tuples. Curved edges are discretized
+        # so that no chord deviates from the curve by more than the tolerance
+        key = (self._geometryHash(shape), SKETCH_TOLERANCE)
+        segments = _segmentCache.get(key)
+        if segments is not None:
+            return segments
 
-    def findChords(self, shape):
-        zArray = []
-
-        tolerance = shape.getTolerance(1, Part.Shape) # Maximum tolerance
-        for v in shape.Vertexes:
-            if len(zArray) < 1:
-                zArray.append(v.Point.z)
+        segments = []
+        for edge in shape.Edges:
+            if issubclass(type(edge.Curve), Part.Line):
+                points = [vertex.Point for vertex in edge.Vertexes]
             else:
-                found = False
-                for existing in zArray:
-                    if abs(existing - v.Point.z) <= tolerance:
-                        found = True
-                        break
+                points = edge.discretize(Deflection=SKETCH_TOLERANCE)
+            for i in range(len(points) - 1):
+                segments.append((points[i].x, points[i].z, points[i + 1].x, points[i + 1].z))
+
+        _segmentCache.put(key, segments)
+        return segments
+
+    def _xOnLine(self, z, segment):
+        x1, z1, x2, z2 = segment
+        if z2 == z1:
+            return x1
+        return (x2 - x1) * ((z - z1) / (z2 - z1)) + x1
+
+    def _zLevels(self, segments, tolerance):
+        # Sort the vertex heights and merge those within tolerance
+        zValues = []
+        for segment in segments:
+            zValues.append(segment[1])
+            zValues.append(segment[3])
+        zValues.sort()
 
-                if not found:
-                    zArray.append(v.Point.z)
+        zArray = []
+        for z in zValues:
+            if len(zArray) < 1 or (z - zArray[-1]) > tolerance:
+                zArray.append(z)
+        return zArray
 
-        zArray.sort()
+    def _findEnds(self, segments, zArray, tolerance):
+        # Sweep up through the z levels, keeping the edges that span the current level in a heap
+        # ordered by their top, so each level only looks at the edges that cross it
+        bySpan = sorted([(min(s[1], s[3]) - tolerance, max(s[1], s[3]) + tolerance, s) for s in segments],
+                        key=lambda span: span[0])
 
-        # Find all x's associated with all z's
-        index = 0
         endArray = []
+        active = []
+        nextEvent = 0
         for z in zArray:
-            # Find the endpoints for z
-            ends = []
-            for edge in shape.Edges:
-                if self._zInVertex(z, edge.Vertexes, tolerance):
-                    # Get the x,y for z
-                    x = self._xOnLine(z, edge.Vertexes[0], edge.Vertexes[1])
-                    ends.append(FreeCAD.Vector(x, 0, z))
+            while nextEvent < len(bySpan) and bySpan[nextEvent][0] <= z:
+                heapq.heappush(active, (bySpan[nextEvent][1], nextEvent, bySpan[nextEvent][2]))
+                nextEvent += 1
+            while len(active) > 0 and active[0][0] < z:
+                heapq.heappop(active)
 
+            ends = []
+            for zmax, index, segment in active:
+                if zmax >= z:
+                    ends.append(self._xOnLine(z, segment))
             endArray.append(ends)
 
-            index += 1
+        return endArray
+
+    def findChords(self, shape):
+        tolerance = shape.getTolerance(1, Part.Shape) # Maximum tolerance
+        segments = self._segments(shape)
+        zArray = self._zLevels(segments, tolerance)
 
         # Use the x's to find the chords
         chords = []
-        for ends in endArray:
-            xmin = ends[0].x
-            xmax = ends[0].x
-            z = ends[0].z
-            for point in ends:
-                if xmin > point.x:
-                    xmin = point.x
-                elif xmax < point.x:
-                    xmax = point.x
+        for z, ends in zip(zArray, self._findEnds(segments, zArray, tolerance)):
+            if len(ends) < 1:
+                continue
+            xmin = min(ends)
+            xmax = max(ends)
             if xmin == xmax:
                 chords.append([FreeCAD.Vector(xmin, 0, z)])
             else:
@@ -138,27 +160,12 @@ class FinSketchShapeHandler(FinShapeHandler):
     def findRootChord(self, shape):
         tolerance = shape.getTolerance(1, Part.Shape) # Maximum tolerance
 
-        # Find all x's associated with all z's
-        ends = []
-        z = 0.0
-        for edge in shape.Edges:
-            if self._zInVertex(z, edge.Vertexes, tolerance):
-                # Get the x,y for z
-                x = self._xOnLine(z, edge.Vertexes[0], edge.Vertexes[1])
-                ends.append(x)
-
-        # Use the x's to find the chord
-        xmin = ends[0]
-        xmax = ends[0]
-        for x in ends:
-            if xmin > x:
-                xmin = x
-            elif xmax < x:
-                xmax = x
-        return (xmin, xmax)
+        # Find all x's associated with the root
+        ends = self._findEnds(self._segments(shape), [0.0], tolerance)[0]
+        return (min(ends), max(ends))
 
     def getFace(self):
-        profile = self._obj.Profile
+        profile = self._parameters.Profile
         # print("Fully constrained %s" % str(profile.FullyConstrained)) # Issue a warning?
         shape = profile.Shape
 
@@ -168,7 +175,7 @@ class FinSketchShapeHandler(FinShapeHandler):
             return Part.Wire(shape)
 
     def getOffsetFace(self):
-        profile = self._obj.Profile
+        profile = self._parameters.Profile
         shape = profile.Shape
 
         if not self.verifyShape(shape):
@@ -181,7 +188,7 @@ class FinSketchShapeHandler(FinShapeHandler):
             return Part.Wire(shape)
 
     def curvedProfiles(self, shape):
-        halfThickness = float(self._obj.RootThickness) / 2.0
+        halfThickness = float(self._parameters.RootThickness) / 2.0
 
         face1 = shape.copy()
         if face1 is not None:
@@ -201,11 +208,11 @@ class FinSketchShapeHandler(FinShapeHandler):
         if len(chord) > 1:
             chordLength = float(chord[1].x - chord[0].x)
             offset = float(chord[1].x)
-            profile = self._makeChordProfile(self._obj.RootCrossSection, offset, chordLength, float(self._obj.RootThickness), height, self._obj.RootPerCent, float(self._obj.RootLength1), rootLength2)
-        elif self._obj.RootCrossSection in [FIN_CROSS_SQUARE, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE]:
+            profile = self._makeChordProfile(self._parameters.RootCrossSection, offset, chordLength, float(self._parameters.RootThickness), height, self._parameters.RootPerCent, float(self._parameters.RootLength1), rootLength2)
+        elif self._parameters.RootCrossSection in [FIN_CROSS_SQUARE, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE]:
             chordLength = 1e-6  # Very small chord length
             offset = float(chord[0].x)
-            profile = self._makeChordProfile(self._obj.RootCrossSection, offset, chordLength, float(self._obj.RootThickness), height, self._obj.RootPerCent, float(self._obj.RootLength1), rootLength2)
+            profile = self._makeChordProfile(self._parameters.RootCrossSection, offset, chordLength, float(self._parameters.RootThickness), height, self._parameters.RootPerCent, float(self._parameters.RootLength1), rootLength2)
         else:
             profile = Part.Vertex(FreeCAD.Vector(float(chord[0].x), 0.0, float(chord[0].z)))
 
@@ -214,7 +221,7 @@ class FinSketchShapeHandler(FinShapeHandler):
     def straightProfiles(self, shape):
         chords = self.findChords(shape)
         profiles = []
-        rootLength2 = float(self._obj.RootLength2)
+        rootLength2 = float(self._parameters.RootLength2)
 
         for index in range(len(chords) - 1):
             profile1 = self._makeChord(chords[index], rootLength2)
@@ -223,12 +230,21 @@ class FinSketchShapeHandler(FinShapeHandler):
 
         return profiles
 
+    def _shapeKey(self):
+        # The sketch can change without any of our properties changing
+        shape = self.getFace()
+        if shape is None:
+            return None
+        return super()._shapeKey() + (self._geometryHash(shape),)
+
     def _makeProfiles(self):
         shape = self.getFace()
         if shape is None:
             return []
 
-        if self.isCurved(shape):
+        # Square cross sections can use the exact outline. Others use chords from the discretized
+        # outline, and the mask trims the result back to the exact curve
+        if self.isCurved(shape) and self._parameters.RootCrossSection == FIN_CROSS_SQUARE:
             return self.curvedProfiles(shape)
         return self.straightProfiles(shape)
 
@@ -237,12 +253,12 @@ class FinSketchShapeHandler(FinShapeHandler):
         shape = self.getOffsetFace()
         tolerance = 10 * shape.getTolerance(1, Part.Shape)
 
-        half = float(self._obj.RootThickness) / 2.0
+        half = float(self._parameters.RootThickness) / 2.0
 
         face = Part.Shape(shape) # Make copies
         face.translate(FreeCAD.Vector(0, -half - tolerance, 0))
 
-        mask = Part.Face(face).extrude(FreeCAD.Vector(0, float(self._obj.RootThickness) + (2.0 * tolerance), 0))
+        mask = Part.Face(face).extrude(FreeCAD.Vector(0, float(self._parameters.RootThickness) + (2.0 * tolerance), 0))
         return mask
 
     def _makeTtw(self):
@@ -253,5 +269,5 @@ class FinSketchShapeHandler(FinShapeHandler):
 
         xmin, xmax = self.findRootChord(shape)
 
-        origin = FreeCAD.Vector(float(xmax) - float(self._obj.TtwOffset) - float(self._obj.TtwLength), -0.5 * self._obj.TtwThickness, -1.0 * self._obj.TtwHeight)
-        return Part.makeBox(self._obj.TtwLength, self._obj.TtwThickness, self._obj.TtwHeight, origin)
+        origin = FreeCAD.Vector(float(xmax) - float(self._parameters.TtwOffset) - float(self._parameters.TtwLength), -0.5 * self._parameters.TtwThickness, -1.0 * self._parameters.TtwHeight)
+        return Part.makeBox(self._parameters.TtwLength, self._parameters.TtwThickness, self._parameters.TtwHeight, origin)
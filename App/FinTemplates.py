@@ -0,0 +1,204 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Unit cross section templates for fin profiles"""
+
+__title__ = "FreeCAD Fin Cross Section Templates"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import Part
+import hashlib
+import numpy as np
+
+from DraftTools import translate
+
+from App.Constants import FIN_CROSS_SQUARE, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, \
+    FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE
+
+from App.ShapeHandler import BoundedCache
+from App.Utilities import _err
+
+AIRFOIL_RESOLUTION = 100
+
+# Templates are computed once and reused for every profile. Fractional templates depend
+# on the chord lengths, so they are kept in a bounded cache
+TEMPLATE_CACHE_SIZE = 64
+_templateCache = BoundedCache(TEMPLATE_CACHE_SIZE)
+
+# Coordinates read from airfoil files, keyed by the hash of the file contents
+AIRFOIL_FILE_CACHE_SIZE = 16
+_airfoilFileCache = BoundedCache(AIRFOIL_FILE_CACHE_SIZE)
+
+class CrossSectionTemplate():
+    """ A cross section with a unit chord running aft from the leading edge at u = 0, and a unit
+        thickness. Edges are either the closed spline through all the points, or lines between the
+        listed pairs of point indexes in the order the wire expects them """
+
+    def __init__(self, points, segments = None):
+        self._points = np.array(points, dtype=float)
+        self._segments = segments
+
+    def _vectors(self, foreX, chord, thickness, height):
+        x = foreX - self._points[:, 0] * chord
+        y = self._points[:, 1] * thickness
+        return [FreeCAD.Vector(px, py, height) for px, py in zip(x.tolist(), y.tolist())]
+
+    def wire(self, foreX, chord, thickness, height):
+        vectors = self._vectors(foreX, chord, thickness, height)
+        if self._segments is None:
+            spline = Part.BSplineCurve()
+            spline.buildFromPoles(vectors)
+            return Part.Wire([spline.toShape()])
+
+        edges = []
+        for start, end in self._segments:
+            edges.append(Part.LineSegment(vectors[start], vectors[end]).toShape())
+        return Part.Wire(edges)
+
+def _nacaTemplate(resolution):
+    # Standard NACA 4 digit symmetrical airfoil https://en.wikipedia.org/wiki/NACA_airfoil
+    x = np.arange(resolution, dtype=float) / float(resolution)
+
+    # Apply Horner's rule
+    y = 5 * (0.2969 * np.sqrt(x) + x * (-0.1260 +  x * (-0.3516 + x * (0.2843 - x * 0.1015))))
+
+    # Circle back for the other side of the airfoil
+    upper = np.column_stack((np.append(x, 1.0), np.append(y, 0.0)))
+    lower = upper[::-1][:-1] * np.array([1.0, -1.0])
+    return CrossSectionTemplate(np.vstack((upper, lower, [[0.0, 0.0]])))
+
+def _readAirfoilCoordinates(text):
+    points = []
+    for line in text.splitlines()[1:]: # The first line is the airfoil name
+        values = line.split()
+        if len(values) != 2:
+            if len(points) > 0 and len(values) > 0:
+                raise ValueError()
+            continue
+        points.append((float(values[0]), float(values[1])))
+
+    if len(points) < 3:
+        raise ValueError()
+
+    if points[0][0] > 1.0 and points[0][1] > 1.0:
+        # Lednicer format. The first line gives the point counts, followed by the upper
+        # then the lower surface, both from the leading edge
+        upperCount = int(points[0][0])
+        upper = points[1:upperCount + 1]
+        lower = points[upperCount + 1:]
+        points = list(reversed(upper)) + lower[1:]
+
+    # Selig format runs from the trailing edge over the upper surface and back along the lower
+    coordinates = np.array(points, dtype=float)
+    leadingEdge = int(np.argmin(coordinates[:, 0]))
+    upper = coordinates[leadingEdge::-1]
+    lower = coordinates[:leadingEdge:-1]
+    loop = np.vstack((upper, lower, upper[:1]))
+
+    # Normalize to a unit chord and unit maximum thickness, with the leading edge at the origin
+    xmin = loop[:, 0].min()
+    chord = loop[:, 0].max() - xmin
+    thickness = loop[:, 1].max() - loop[:, 1].min()
+    if chord <= 0 or thickness <= 0:
+        raise ValueError()
+    loop[:, 0] = (loop[:, 0] - xmin) / chord
+    loop[:, 1] = (loop[:, 1] - loop[0, 1]) / thickness
+    return CrossSectionTemplate(loop)
+
+def _readAirfoilFile(filename):
+    with open(filename, "rb") as airfoil:
+        return airfoil.read()
+
+def airfoilFileHash(filename):
+    """ Hash of the contents of an airfoil coordinate file, or None if it can't be read """
+    try:
+        return hashlib.sha1(_readAirfoilFile(filename)).hexdigest()
+    except OSError:
+        return None
+
+def airfoilFileTemplate(filename):
+    """ Template for a Selig or Lednicer format airfoil coordinate file, or None if it can't be read """
+    try:
+        content = _readAirfoilFile(filename)
+    except OSError:
+        _err(translate('Rocket', "Unable to open the airfoil file '%s'") % filename)
+        return None
+
+    key = hashlib.sha1(content).hexdigest()
+    coordinates = _airfoilFileCache.get(key)
+    if coordinates is None:
+        try:
+            coordinates = _readAirfoilCoordinates(content.decode(errors='replace'))
+        except (ValueError, IndexError):
+            _err(translate('Rocket', "Unable to read the airfoil coordinates in '%s'") % filename)
+            return None
+        _airfoilFileCache.put(key, coordinates)
+    return coordinates
+
+def _midChordLimit(value, midChordLimit):
+    if midChordLimit and value > 0.5:
+        return 0.5
+    return value
+
+def _makeTemplate(crossSection, fore, aft, midChordLimit):
+    if crossSection == FIN_CROSS_SQUARE:
+        return CrossSectionTemplate([(0, 0.5), (0, -0.5), (1, -0.5), (1, 0.5)],
+                                    [(0, 1), (1, 2), (2, 3), (3, 0)])
+    elif crossSection == FIN_CROSS_AIRFOIL:
+        return _nacaTemplate(AIRFOIL_RESOLUTION)
+    elif crossSection == FIN_CROSS_WEDGE:
+        return CrossSectionTemplate([(0, 0), (1, -0.5), (1, 0.5)],
+                                    [(0, 1), (0, 2), (1, 2)])
+    elif crossSection == FIN_CROSS_DIAMOND:
+        return CrossSectionTemplate([(0, 0), (fore, 0.5), (fore, -0.5), (1, 0)],
+                                    [(0, 1), (1, 3), (3, 2), (2, 0)])
+    elif crossSection == FIN_CROSS_TAPER_LE:
+        return CrossSectionTemplate([(0, 0), (fore, 0.5), (fore, -0.5), (1, 0.5), (1, -0.5)],
+                                    [(0, 1), (1, 3), (3, 4), (4, 2), (2, 0)])
+    elif crossSection == FIN_CROSS_TAPER_TE:
+        return CrossSectionTemplate([(1, 0), (1 - fore, 0.5), (1 - fore, -0.5), (0, 0.5), (0, -0.5)],
+                                    [(0, 1), (1, 3), (3, 4), (4, 2), (2, 0)])
+    elif crossSection == FIN_CROSS_TAPER_LETE:
+        fore = _midChordLimit(fore, midChordLimit)
+        aft = 1 - _midChordLimit(aft, midChordLimit)
+        points = [(0, 0), (fore, 0.5), (fore, -0.5), (aft, 0.5), (aft, -0.5), (1, 0)]
+        if fore == aft:
+            return CrossSectionTemplate(points, [(0, 1), (1, 5), (5, 2), (2, 0)])
+        return CrossSectionTemplate(points, [(0, 1), (1, 3), (3, 5), (5, 4), (4, 2), (2, 0)])
+    return None
+
+def crossSectionTemplate(crossSection, fore = 0.0, aft = 0.0, midChordLimit = True):
+    """ Unit template for the cross section. fore and aft are the fractions of the chord used
+        by the diamond and tapered sections """
+    if crossSection not in [FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE]:
+        fore = aft = 0.0
+    if crossSection != FIN_CROSS_TAPER_LETE:
+        aft = 0.0
+        midChordLimit = False
+    key = (crossSection, fore, aft, midChordLimit)
+    template = _templateCache.get(key)
+    if template is None:
+        template = _makeTemplate(crossSection, fore, aft, midChordLimit)
+        if template is None:
+            return None
+        _templateCache.put(key, template)
+    return template
@@ -30,27 +30,27 @@ from App.FinShapeHandler import FinShapeHandler
 
 class FinTrapezoidShapeHandler(FinShapeHandler):
 
-    def __init__(self, obj):
-        super().__init__(obj)
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
     def _makeRootProfile(self):
         # Create the root profile, casting everything to float to avoid typing issues
-        if self._obj.RootPerCent:
-            rootLength2 = float(self._obj.RootLength2)
+        if self._parameters.RootPerCent:
+            rootLength2 = float(self._parameters.RootLength2)
         else:
-            rootLength2 = float(self._obj.RootChord) - float(self._obj.RootLength2)
-        return self._makeChordProfile(self._obj.RootCrossSection, float(self._obj.RootChord), float(self._obj.RootChord), float(self._obj.RootThickness), 0.0, self._obj.RootPerCent, float(self._obj.RootLength1), rootLength2)
+            rootLength2 = float(self._parameters.RootChord) - float(self._parameters.RootLength2)
+        return self._makeChordProfile(self._parameters.RootCrossSection, float(self._parameters.RootChord), float(self._parameters.RootChord), float(self._parameters.RootThickness), 0.0, self._parameters.RootPerCent, float(self._parameters.RootLength1), rootLength2)
 
     def _makeTipProfile(self):
         # Create the tip profile, casting everything to float to avoid typing issues
-        crossSection = self._obj.TipCrossSection
+        crossSection = self._parameters.TipCrossSection
         if crossSection == FIN_CROSS_SAME:
-            crossSection = self._obj.RootCrossSection
-        if self._obj.TipPerCent:
-            tipLength2 = float(self._obj.TipLength2)
+            crossSection = self._parameters.RootCrossSection
+        if self._parameters.TipPerCent:
+            tipLength2 = float(self._parameters.TipLength2)
         else:
-            tipLength2 = float(self._obj.TipChord) - float(self._obj.TipLength2)
-        return self._makeChordProfile(crossSection, float(self._obj.RootChord - self._obj.SweepLength), float(self._obj.TipChord), float(self._obj.TipThickness), float(self._obj.Height), self._obj.TipPerCent, float(self._obj.TipLength1), tipLength2)
+            tipLength2 = float(self._parameters.TipChord) - float(self._parameters.TipLength2)
+        return self._makeChordProfile(crossSection, float(self._parameters.RootChord - self._parameters.SweepLength), float(self._parameters.TipChord), float(self._parameters.TipThickness), float(self._parameters.Height), self._parameters.TipPerCent, float(self._parameters.TipLength1), tipLength2)
 
     def _makeProfiles(self):
         profiles = []
@@ -0,0 +1,269 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Mass properties of revolved and extruded components"""
+
+__title__ = "FreeCAD Rocket Workbench Mass Properties"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+import numpy as np
+
+from App.Geometry.Profile import SEGMENT_LINE, SEGMENT_SPLINE, SEGMENT_ARC, SEGMENT_ELLIPSE
+
+# Number of points used when approximating curved profile segments by a polygon
+SPLINE_SAMPLES = 8      # per pole
+ARC_SAMPLES = 64
+ELLIPSE_SAMPLES = 256
+
+# Gauss-Legendre points on [0, 1]. Three points integrate the polynomials along each polygon edge exactly
+_GAUSS_POINTS, _GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(3)
+_GAUSS_POINTS = (_GAUSS_POINTS + 1.0) / 2.0
+_GAUSS_WEIGHTS = _GAUSS_WEIGHTS / 2.0
+
+class MassProperties():
+    """ Volume, center of mass and the inertia tensor about the center of mass, all per unit density.
+        The rocket axis is along x """
+
+    def __init__(self, volume=0.0, center=(0.0, 0.0, 0.0), inertia=None):
+        self.volume = float(volume)
+        self.center = np.array(center, dtype=float)
+        if inertia is None:
+            self.inertia = np.zeros((3, 3))
+        else:
+            self.inertia = np.array(inertia, dtype=float)
+
+    def inertiaAbout(self, point):
+        """ Inertia tensor about the given point, using the parallel axis theorem """
+        d = self.center - np.asarray(point, dtype=float)
+        return self.inertia + self.volume * (np.dot(d, d) * np.eye(3) - np.outer(d, d))
+
+    def __add__(self, other):
+        volume = self.volume + other.volume
+        if volume == 0.0:
+            return MassProperties()
+        center = (self.volume * self.center + other.volume * other.center) / volume
+        return MassProperties(volume, center, self.inertiaAbout(center) + other.inertiaAbout(center))
+
+    def __neg__(self):
+        return MassProperties(-self.volume, self.center, -self.inertia)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def scaled(self, density):
+        """ Mass properties for the given density. The volume becomes the mass """
+        return MassProperties(self.volume * density, self.center, self.inertia * density)
+
+    def transformed(self, matrix):
+        """ Mass properties after applying a 4x4 homogeneous transformation without scaling """
+        matrix = np.asarray(matrix, dtype=float)
+        rotation = matrix[:3, :3]
+        center = rotation @ self.center + matrix[:3, 3]
+        return MassProperties(self.volume, center, rotation @ self.inertia @ rotation.T)
+
+    @property
+    def axialInertia(self):
+        return self.inertia[0, 0]
+
+    @property
+    def transverseInertia(self):
+        # The mean of the two transverse axes. They are equal for axially symmetric parts
+        return (self.inertia[1, 1] + self.inertia[2, 2]) / 2.0
+
+def _bsplineBasis(knots, degree, u):
+    # Cox-de Boor recursion, evaluated for all the parameters at once
+    basis = ((knots[:-1] <= u[:, None]) & (u[:, None] < knots[1:])).astype(float)
+    lastSpan = np.nonzero(np.diff(knots) > 0)[0][-1]
+    basis[u >= knots[-1], lastSpan] = 1.0
+    for p in range(1, degree + 1):
+        count = len(knots) - p - 1
+        d1 = knots[p:p + count] - knots[:count]
+        d2 = knots[p + 1:p + 1 + count] - knots[1:1 + count]
+        a = np.divide(u[:, None] - knots[:count], d1, out=np.zeros((len(u), count)), where=(d1 > 0))
+        b = np.divide(knots[p + 1:p + 1 + count] - u[:, None], d2, out=np.zeros((len(u), count)), where=(d2 > 0))
+        basis = a * basis[:, :count] + b * basis[:, 1:count + 1]
+    return basis
+
+def _splinePoints(poles):
+    # Matches Part.BSplineCurve.buildFromPoles(), a clamped cubic with uniform knots
+    count = len(poles)
+    degree = min(3, count - 1)
+    knots = np.concatenate((np.zeros(degree), np.linspace(0.0, 1.0, count - degree + 1), np.ones(degree)))
+    u = np.linspace(0.0, 1.0, SPLINE_SAMPLES * count)
+    return _bsplineBasis(knots, degree, u) @ poles
+
+def _arcPoints(start, middle, end):
+    (ax, ay), (bx, by), (cx, cy) = start, middle, end
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    ux = ((ax*ax + ay*ay) * (by - cy) + (bx*bx + by*by) * (cy - ay) + (cx*cx + cy*cy) * (ay - by)) / d
+    uy = ((ax*ax + ay*ay) * (cx - bx) + (bx*bx + by*by) * (ax - cx) + (cx*cx + cy*cy) * (bx - ax)) / d
+    radius = math.hypot(ax - ux, ay - uy)
+
+    first = math.atan2(ay - uy, ax - ux)
+    sweep = (math.atan2(cy - uy, cx - ux) - first) % (2.0 * math.pi)
+    if (math.atan2(by - uy, bx - ux) - first) % (2.0 * math.pi) > sweep:
+        sweep -= 2.0 * math.pi
+    angles = first + np.linspace(0.0, sweep, ARC_SAMPLES)
+    return np.column_stack((ux + radius * np.cos(angles), uy + radius * np.sin(angles)))
+
+def _ellipsePoints(center, major, minor, first, last):
+    angles = np.linspace(first, last, ELLIPSE_SAMPLES)
+    return np.column_stack((center[0] + major * np.cos(angles), center[1] + minor * np.sin(angles)))
+
+def _segmentPoints(segment):
+    kind = segment[0]
+    if kind == SEGMENT_LINE:
+        return np.array(segment[1:], dtype=float)
+    if kind == SEGMENT_SPLINE:
+        return _splinePoints(segment[1])
+    if kind == SEGMENT_ARC:
+        return _arcPoints(*segment[1:])
+    if kind == SEGMENT_ELLIPSE:
+        return _ellipsePoints(*segment[1:])
+    raise ValueError("Unknown profile segment '%s'" % kind)
+
+def profilePolygon(segments):
+    """ Chain the profile segments end to end into a closed polygon """
+    polylines = []
+    for segment in segments:
+        points = _segmentPoints(segment)
+        # Some profiles list an edge twice
+        if not any(points.shape == other.shape and np.array_equal(points, other) for other in polylines):
+            polylines.append(points)
+
+    polygon = [polylines.pop(0)]
+    while len(polylines) > 0:
+        end = polygon[-1][-1]
+        distances = [min(np.linalg.norm(points[0] - end), np.linalg.norm(points[-1] - end)) for points in polylines]
+        points = polylines.pop(int(np.argmin(distances)))
+        if np.linalg.norm(points[-1] - end) < np.linalg.norm(points[0] - end):
+            points = points[::-1]
+        polygon.append(points)
+    return np.vstack(polygon)
+
+def _polygonMoments(polygon, powers):
+    # Green's theorem: the integral of x^p r^q over the polygon is -(1 / (q + 1)) times the
+    # contour integral of x^p r^(q + 1) dx
+    start = polygon
+    end = np.roll(polygon, -1, axis=0)
+    dx = end[:, 0] - start[:, 0]
+    x = start[:, 0, None] + (end[:, 0] - start[:, 0])[:, None] * _GAUSS_POINTS
+    r = start[:, 1, None] + (end[:, 1] - start[:, 1])[:, None] * _GAUSS_POINTS
+    moments = []
+    for p, q in powers:
+        integral = (np.power(x, p) * np.power(r, q + 1)) @ _GAUSS_WEIGHTS
+        moments.append(-np.dot(dx, integral) / (q + 1))
+    return moments
+
+def revolvedMassProperties(polygon):
+    """ Mass properties of the closed (x, r) polygon revolved 360 degrees about the x axis """
+    area, m01, m11, m03, m21 = _polygonMoments(polygon, [(0, 0), (0, 1), (1, 1), (0, 3), (2, 1)])
+    if area < 0:
+        # Clockwise polygon
+        m01, m11, m03, m21 = -m01, -m11, -m03, -m21
+
+    # Pappus' theorem, with r dtheta dA as the volume element
+    volume = 2.0 * math.pi * m01
+    if volume <= 0:
+        return MassProperties()
+    x = 2.0 * math.pi * m11 / volume
+    axial = 2.0 * math.pi * m03
+    transverse = 2.0 * math.pi * m21 + math.pi * m03 - volume * x * x
+    return MassProperties(volume, (x, 0.0, 0.0), np.diag((axial, transverse, transverse)))
+
+def profileMassProperties(segments):
+    return revolvedMassProperties(profilePolygon(segments))
+
+def cylinderMassProperties(radius, length, center=(0.0, 0.0, 0.0)):
+    """ A solid cylinder along the x axis """
+    volume = math.pi * radius * radius * length
+    transverse = volume * (radius * radius / 4.0 + length * length / 12.0)
+    return MassProperties(volume, center, np.diag((volume * radius * radius / 2.0, transverse, transverse)))
+
+def _stripPoints(breaks, count):
+    # Gauss-Legendre points and weights across y, split at the breaks where the bounds have corners
+    points, weights = np.polynomial.legendre.leggauss(count)
+    y = np.concatenate([(a + b) / 2.0 + points * (b - a) / 2.0 for a, b in zip(breaks[:-1], breaks[1:])])
+    w = np.concatenate([weights * (b - a) / 2.0 for a, b in zip(breaks[:-1], breaks[1:])])
+    return y, w
+
+def _stripMassProperties(y, w, zLow, zHigh, start, length):
+    # The region between zLow and zHigh at each y, extruded along x from start. Integrate across
+    # y, the z integrals are exact
+    z0 = np.dot(w, zHigh - zLow)
+    z1 = np.dot(w, (zHigh ** 2 - zLow ** 2) / 2.0)
+    z2 = np.dot(w, (zHigh ** 3 - zLow ** 3) / 3.0)
+    yz1 = np.dot(w * y, (zHigh ** 2 - zLow ** 2) / 2.0)
+    y1 = np.dot(w * y, zHigh - zLow)
+    y2 = np.dot(w * y * y, zHigh - zLow)
+    if z0 <= 0:
+        return MassProperties()
+
+    volume = z0 * length
+    origin = (start + length / 2.0, 0.0, 0.0)
+    inertia = np.array([[length * (y2 + z2), 0.0, 0.0],
+                        [0.0, length * z2 + volume * length * length / 12.0, -length * yz1],
+                        [0.0, -length * yz1, length * y2 + volume * length * length / 12.0]])
+    properties = MassProperties(volume, (origin[0], y1 / z0, z1 / z0))
+
+    # Move the inertia from the origin to the center of mass. inertiaAbout() only returns the
+    # parallel axis term while the inertia is zero
+    properties.inertia = inertia - properties.inertiaAbout(origin)
+    return properties
+
+def notchMassProperties(width, top, innerRadius, outerRadius, start, length, count=16):
+    """ The part of an annulus inside a notch of the given width, reaching from the axis to top
+        in the z direction, extruded along x from start """
+    halfWidth = width / 2.0
+    breaks = [-halfWidth, halfWidth]
+    if top < outerRadius:
+        corner = math.sqrt(outerRadius * outerRadius - top * top)
+        if corner < halfWidth:
+            breaks += [-corner, corner]
+
+    y, w = _stripPoints(sorted(breaks), count)
+    zLow = np.sqrt(np.maximum(innerRadius * innerRadius - y * y, 0.0))
+    zHigh = np.maximum(np.minimum(top, np.sqrt(outerRadius * outerRadius - y * y)), zLow)
+    return _stripMassProperties(y, w, zLow, zHigh, start, length)
+
+def notchHoleMassProperties(width, top, radius, center, start, length, count=16):
+    """ The part of a hole of the given radius and (y, z) center inside a notch of the given width,
+        reaching from the axis to top in the z direction, extruded along x from start """
+    holeY, holeZ = center
+    halfWidth = width / 2.0
+    first = max(-halfWidth, holeY - radius)
+    last = min(halfWidth, holeY + radius)
+    if first >= last:
+        return MassProperties()
+
+    breaks = [first, last]
+    for edge in (0.0, top):
+        # Where the hole crosses the bottom and top of the notch
+        if abs(edge - holeZ) < radius:
+            offset = math.sqrt(radius * radius - (edge - holeZ) * (edge - holeZ))
+            breaks += [value for value in (holeY - offset, holeY + offset) if first < value < last]
+
+    y, w = _stripPoints(sorted(breaks), count)
+    half = np.sqrt(np.maximum(radius * radius - (y - holeY) * (y - holeY), 0.0))
+    zLow = np.maximum(holeZ - half, 0.0)
+    zHigh = np.maximum(np.minimum(top, holeZ + half), zLow)
+    return _stripMassProperties(y, w, zLow, zHigh, start, length)
@@ -0,0 +1,610 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Nose cone profiles"""
+
+__title__ = "FreeCAD Rocket Workbench Nose Cone Profiles"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+from abc import abstractmethod
+
+import numpy as np
+
+from App.Constants import QT_TRANSLATE_NOOP
+from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID
+from App.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, \
+    TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER, TYPE_HAACK
+
+from App.Geometry.Profile import Profile, line, spline, arc, ellipse, curvePoints
+
+class NoseProfile(Profile):
+    """ Nose cone profile with the tip at x = length and the base at x = 0 """
+
+    NOSE_TYPE = None
+
+    def __init__(self, style, length, radius, thickness=0.0, shoulder=False, shoulderLength=0.0, shoulderRadius=0.0,
+            shoulderThickness=0.0, noseRadius=0.0, coefficient=0.0, ogiveRadius=0.0, resolution=100, noseType=None):
+        self._type = noseType or self.NOSE_TYPE
+        self._style = style
+        self._thickness = float(thickness)
+
+        self._shoulder = bool(shoulder)
+        self._shoulderLength = float(shoulderLength)
+        self._shoulderRadius = float(shoulderRadius)
+        self._shoulderThickness = float(shoulderThickness)
+
+        self._length = float(length)
+        self._radius = float(radius)
+        self._noseRadius = float(noseRadius)
+        self._coefficient = float(coefficient)
+        self._ogiveRadius = float(ogiveRadius)
+        self._resolution = int(resolution)
+
+    def validate(self):
+        # Perform some general validations
+        if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
+            if self._thickness <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "For %s nose cones thickness must be > 0"), (self._style,))
+            if self._thickness >= self._radius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Nose cones thickness must be less than the nose cone radius"), ())
+        if self._type in [TYPE_BLUNTED_CONE, TYPE_BLUNTED_OGIVE]:
+            if self._noseRadius >= self._radius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Nose diameter must be less than the base diameter"), ())
+            if self._noseRadius <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Nose diameter must be greater than zero"), ())
+        if self._type == TYPE_SECANT_OGIVE:
+            minDiameter = math.sqrt(self._length * self._length + self._radius * self._radius)
+            if self._ogiveRadius < (minDiameter / 2.0):
+                return (QT_TRANSLATE_NOOP('Rocket', "Ogive diameter must be greater than %f (sqrt(length^2 + radius^2))"), (minDiameter,))
+        if self._shoulder:
+            if self._shoulderLength <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Shoulder length must be > 0"), ())
+            if self._shoulderRadius <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Shoulder diameter must be > 0"), ())
+            if self._shoulderRadius > self._radius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Shoulder diameter can not exceed the nose cone diameter"), ())
+            if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
+                if self._shoulderThickness <= 0:
+                    return (QT_TRANSLATE_NOOP('Rocket', "For %s nose cones with a shoulder, shoulder thickness must be > 0"), (self._style,))
+                if self._shoulderThickness >= self._shoulderRadius:
+                    return (QT_TRANSLATE_NOOP('Rocket', "Shoulder thickness must be less than the shoulder radius"), ())
+
+        return None
+
+    def _segments(self):
+        if self._style == STYLE_SOLID:
+            if self._shoulder:
+                return self.solidShoulderLines(self.outerCurve())
+            return self.solidLines(self.outerCurve())
+
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            last, inner = self.innerHollowCurve()
+            return self.hollowLines(last, self.outerCurve(), inner)
+
+        last, minor_y, inner = self.innerCurve()
+        if self._style == STYLE_HOLLOW:
+            return self.hollowShoulderLines(last, minor_y, self.outerCurve(), inner)
+        if self._shoulder:
+            return self.cappedShoulderLines(last, minor_y, self.outerCurve(), inner)
+        return self.cappedLines(last, minor_y, self.outerCurve(), inner)
+
+    @abstractmethod
+    def outerCurve(self):
+        """ The outside of the nose from the tip to the base, as a list of segments """
+
+    @abstractmethod
+    def innerHollowCurve(self):
+        """ Returns (tip x, segments) for the inside of a hollow nose without a shoulder """
+
+    @abstractmethod
+    def innerCurve(self):
+        """ Returns (tip x, base radius, segments) for the inside of a nose with a shoulder or cap """
+
+    def solidLines(self, outer):
+        center = (0.0, 0.0)
+        major = (self._length, 0.0)
+        minor = (0.0, self._radius)
+
+        return outer + [line(center, major), line(center, minor)]
+
+    def solidShoulderLines(self, outer):
+        major = (self._length, 0)
+        minor = (0, self._radius)
+
+        return outer + [line(major,                                             (-self._shoulderLength, 0)),
+                        line((-self._shoulderLength, 0),                        (-self._shoulderLength, self._shoulderRadius)),
+                        line((-self._shoulderLength, self._shoulderRadius),     (0, self._shoulderRadius)),
+                        line((0, self._shoulderRadius),                         minor)]
+
+    def hollowLines(self, max_x, outer, inner):
+        major = (self._length, 0)
+        minor = (0, self._radius)
+
+        innerMajor = (max_x, 0)
+        innerMinor = (0, self._radius - self._thickness)
+
+        return outer + [line(major, innerMajor), line(minor, innerMinor)] + inner
+
+    def hollowShoulderLines(self, max_x, minor_y, outer, inner):
+        major = (self._length, 0)
+        minor = (0, self._radius)
+
+        innerMajor = (max_x, 0)
+        innerMinor = (self._thickness, minor_y)
+
+        end2 = (0,                       self._shoulderRadius)
+        end3 = (-self._shoulderLength,   self._shoulderRadius)
+        end4 = (-self._shoulderLength,   self._shoulderRadius - self._shoulderThickness)
+        end5 = (self._thickness,         self._shoulderRadius - self._shoulderThickness)
+        return outer + [line(major, innerMajor),
+                        line(minor, end2),
+                        line(end2,  end3),
+                        line(end3,  end4),
+                        line(end4,  end5),
+                        line(end5,  innerMinor)] + inner
+
+    def cappedLines(self, max_x, minor_y, outer, inner):
+        center = (0, 0)
+        major = (self._length, 0)
+        minor = (0, self._radius)
+
+        innerMajor = (max_x, 0)
+        innerMinor = (self._thickness, minor_y)
+
+        return outer + [line(major, innerMajor),
+                        line(minor, center),
+                        line(center, (self._thickness, 0)),
+                        line((self._thickness, 0), innerMinor)] + inner
+
+    def cappedShoulderLines(self, max_x, minor_y, outer, inner):
+        major = (self._length, 0)
+        minor = (0, self._radius)
+
+        innerMajor = (max_x, 0)
+        innerMinor = (self._thickness, minor_y)
+
+        end2 = (0,                                            self._shoulderRadius)
+        end3 = (-self._shoulderLength,                        self._shoulderRadius)
+        end4 = (-self._shoulderLength,                        0)
+        end5 = (self._shoulderThickness-self._shoulderLength, 0)
+        end6 = (self._shoulderThickness-self._shoulderLength, self._shoulderRadius-self._shoulderThickness)
+        end7 = (self._thickness,                              self._shoulderRadius-self._shoulderThickness)
+        return outer + [line(major, innerMajor),
+                        line(minor, end2),
+                        line(end2,  end3),
+                        line(end3,  end4),
+                        line(end4,  end5),
+                        line(end5,  end6),
+                        line(end6,  end7),
+                        line(end7,  innerMinor)] + inner
+
+class ConeNoseProfile(NoseProfile):
+
+    NOSE_TYPE = TYPE_CONE
+
+    def innerMinor(self, last):
+        intercept = self._radius - self._thickness
+        slope = intercept * -1 / (last - self._thickness)
+        inner_minor = self._thickness * slope + intercept
+        return inner_minor
+
+    def _last(self):
+        # Calculate the offset from the end to maintain the thickness
+        offset = self._length * self._thickness / self._radius
+        return self._length - offset
+
+    def outerCurve(self):
+        return [line((self._length, 0.0), (0.0, self._radius))]
+
+    def innerHollowCurve(self):
+        last = self._last()
+        return last, [line((last, 0.0), (0.0, self._radius - self._thickness))]
+
+    def innerCurve(self):
+        last = self._last()
+        minor_y = self.innerMinor(last)
+        return last, minor_y, [line((last, 0.0), (self._thickness, minor_y))]
+
+class EllipseNoseProfile(NoseProfile):
+
+    NOSE_TYPE = TYPE_ELLIPTICAL
+
+    def innerMinor(self, last):
+        a = last
+        b = self._radius - self._thickness
+        x = self._thickness
+
+        inner_minor = (b / a) * math.sqrt(a * a - x * x)
+        return inner_minor
+
+    def outerCurve(self):
+        return [ellipse((0, 0), self._length, self._radius, 0.0, math.pi/2)]
+
+    def innerHollowCurve(self):
+        last = self._length - self._thickness
+        return last, [ellipse((0, 0), last, self._radius - self._thickness, 0.0, math.pi/2)]
+
+    def innerCurve(self):
+        last = self._length - self._thickness
+        minor_y = self.innerMinor(last)
+        return last, minor_y, [ellipse((self._thickness, 0), last - self._thickness, minor_y, 0.0, math.pi/2)]
+
+class _SeriesNoseProfile(NoseProfile):
+    """ Nose cones described by a single function y(x), where x is the distance from the tip """
+
+    @abstractmethod
+    def _y(self, x, length, radius):
+        """ Radius of the nose at x from the tip. x may be an array """
+
+    def _innerLength(self, last):
+        return last - self._thickness
+
+    def innerMinor(self, last):
+        radius = self._radius - self._thickness
+        length = last
+
+        inner_minor = self._y(length - self._thickness, length, radius)
+        return inner_minor
+
+    def _curve(self, length, radius, min = 0):
+        x = np.arange(self._resolution) * ((length - min) / float(self._resolution))
+        return curvePoints(length - x, self._y(x, length, radius), (min, radius))
+
+    def _findY(self, thickness, length, radius):
+        min = 0
+        max = length
+        x = 0
+
+        # Do a binary search to see where f(x) = thickness, to 1 mm
+        while (max - min) > 0.1:
+            y = self._y(length - x, length, radius)
+            if (y == thickness):
+                return x
+            if (y > thickness):
+                min = x
+            else:
+                max = x
+            x = (max - min) / 2 + min
+        return x
+
+    def outerCurve(self):
+        return [spline(self._curve(self._length, self._radius))]
+
+    def innerHollowCurve(self):
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self._findY(self._thickness, self._length, self._radius)
+        return x, [spline(self._curve(x, self._radius - self._thickness))]
+
+    def innerCurve(self):
+        x = self._findY(self._thickness, self._length, self._radius)
+        minor_y = self.innerMinor(x)
+        return x, minor_y, [spline(self._curve(self._innerLength(x), minor_y, self._thickness))]
+
+class OgiveNoseProfile(_SeriesNoseProfile):
+
+    NOSE_TYPE = TYPE_OGIVE
+
+    def _y(self, x, length, radius):
+        rho = (radius * radius + length * length) / (2.0 * radius)
+        return np.sqrt(rho * rho - np.power(length - x, 2)) + radius - rho
+
+    def _innerLength(self, last):
+        return last
+
+class HaackNoseProfile(_SeriesNoseProfile):
+
+    NOSE_TYPE = TYPE_HAACK
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # The Von Karman shape is a Haack series with a coefficient of 0
+        if self._type == TYPE_VON_KARMAN:
+            self._coefficient = 0.0
+
+    def validate(self):
+        if self._coefficient < 0:
+            return (QT_TRANSLATE_NOOP('Rocket', "For %s nose cones the coefficient must be >= 0"), (self._type,))
+        return super().validate()
+
+    def _y(self, x, length, radius):
+        theta = np.arccos(1 - 2*x/length)
+        return  radius * np.sqrt(theta - np.sin(2 * theta)/2
+            + self._coefficient * np.power(np.sin(theta), 3)) / math.sqrt(math.pi)
+
+    def _curve(self, length, radius, min = 0):
+        x = np.arange(self._resolution) * (length / float(self._resolution))
+        x = x[(length - x) > min]
+        return curvePoints(length - x, self._y(x, length, radius), (min, radius))
+
+class PowerNoseProfile(_SeriesNoseProfile):
+
+    NOSE_TYPE = TYPE_POWER
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # The parabola is a power series with a coefficient of 0.5
+        if self._type == TYPE_PARABOLA:
+            self._coefficient = 0.5
+
+    def validate(self):
+        if self._coefficient <= 0 or self._coefficient > 1:
+            return (QT_TRANSLATE_NOOP('Rocket', "For %s nose cones the coefficient must be in the range (0 < coefficient <= 1)"), (self._type,))
+        return super().validate()
+
+    def _y(self, x, length, radius):
+        return radius * np.power((x / length), self._coefficient)
+
+class ParabolicNoseProfile(_SeriesNoseProfile):
+
+    NOSE_TYPE = TYPE_PARABOLIC
+
+    def validate(self):
+        if self._coefficient < 0 or self._coefficient > 1:
+            return (QT_TRANSLATE_NOOP('Rocket', "For %s nose cones the coefficient must be in the range (0 <= coefficient <= 1)"), (self._type,))
+        return super().validate()
+
+    def _y(self, x, length, radius):
+        ratio = x / length
+        return radius * ((2 * ratio) - (self._coefficient * ratio * ratio)) / (2 - self._coefficient)
+
+class SecantOgiveNoseProfile(NoseProfile):
+
+    NOSE_TYPE = TYPE_SECANT_OGIVE
+
+    def getRho(self):
+        # For a secant ogive, rho is user defined.
+        return self._ogiveRadius
+
+    def getAlpha(self, length, radius):
+        rho = self.getRho()
+        alpha = math.acos(math.sqrt(length * length + radius * radius) / (2.0 * rho)) - math.atan(radius / length)
+        return alpha
+
+    def ogive_y(self, x, length, rho, alpha):
+        return np.sqrt(rho * rho - np.power(rho * math.cos(alpha) - (length - x), 2)) - (rho * math.sin(alpha))
+
+    def innerMinor(self, last):
+        radius = self._radius - self._thickness
+        length = last
+        rho = self.getRho()
+        alpha = self.getAlpha(length, radius)
+
+        inner_minor = self.ogive_y(length - self._thickness, length, rho, alpha)
+        return inner_minor
+
+    def ogive_curve(self, length, radius, min = 0):
+        rho = self.getRho()
+        alpha = self.getAlpha(length, radius)
+
+        x = np.arange(self._resolution) * ((length - min) / float(self._resolution))
+        return curvePoints(length - x, self.ogive_y(length - x, length, rho, alpha), (min, radius))
+
+    def findOgiveY(self, thickness, length, radius):
+        rho = self.getRho()
+
+        min = 0
+        max = length
+        x = (max - min) / 2 + min
+
+        # Do a binary search to see where f(x) = thickness, to 1 mm
+        while (max - min) > 0.0001:
+            x = (max - min) / 2 + min
+            alpha = self.getAlpha(length - x, radius)
+            y = self.ogive_y(length - x, length, rho, alpha)
+            if (y == thickness):
+                return length - x
+            if (y < thickness):
+                min = x
+            else:
+                max = x
+        return length - x
+
+    def outerCurve(self):
+        return [spline(self.ogive_curve(self._length, self._radius))]
+
+    def innerHollowCurve(self):
+        # Find the point where the thickness matches the desired thickness, so we don't get too narrow at the tip
+        x = self.findOgiveY(self._thickness, self._length, self._radius)
+        return x, [spline(self.ogive_curve(x, self._radius - self._thickness))]
+
+    def innerCurve(self):
+        x = self.findOgiveY(self._thickness, self._length, self._radius)
+        minor_y = self.innerMinor(self._length - x)
+        return x, minor_y, [spline(self.ogive_curve(x, minor_y, self._thickness))]
+
+class BluntedConeNoseProfile(NoseProfile):
+
+    NOSE_TYPE = TYPE_BLUNTED_CONE
+
+    def getXt(self, length, radius, noseRadius):
+        return math.pow(length, 2) / radius * math.sqrt(math.pow(noseRadius, 2) / (math.pow(radius, 2) + math.pow(length, 2)))
+
+    def getYt(self, Xt, length, radius):
+        return (Xt * radius) / length
+
+    def getXo(self, Xt, Yt, noseRadius):
+        return Xt + math.sqrt(math.pow(noseRadius, 2) - math.pow(Yt, 2))
+
+    def getXa(self, Xo, noseRadius):
+        return Xo - noseRadius
+
+    def getLength(self, length, radius, noseRadius):
+
+        min = length - noseRadius
+        max = (-radius * length) / (noseRadius - radius)
+
+        # Do a binary search to 0.0001 mm
+        precision = 0.0001
+        while (max - min) > precision:
+            mid = (max + min) / 2.0
+            Xt = self.getXt(mid, radius, noseRadius)
+            Yt = self.getYt(Xt, mid, radius)
+            Xo = self.getXo(Xt, Yt, noseRadius)
+            Xa = self.getXa(Xo, noseRadius)
+            if (length + Xa) > mid:
+                min = mid
+            else:
+                max = mid
+
+        return (mid, Xt, Yt, Xo, Xa)
+
+    def getMidArc(self, Xo, Xt, radius):
+        x = math.fabs(Xt + radius - Xo) / 2.0
+        y = math.sqrt(radius * radius - x * x)
+        return (x + Xo, y)
+
+    def innerMinor(self, length, radius, offset):
+        intercept = radius
+        slope = intercept * -1 / (length)
+        inner_minor = offset * slope + intercept
+        return inner_minor
+
+    def getCurve(self, length, radius, noseRadius, offset=0.0):
+        """ Returns the blunted curve and its radius at the offset """
+        (vLength, Xt, Yt, Xo, Xa) = self.getLength(length, radius, noseRadius)
+
+        midX, midY = self.getMidArc(vLength - Xo, vLength - Xt, noseRadius)
+        blunt = arc((vLength - Xt, Yt), (midX, midY), (length, 0.0))
+
+        offsetRadius = radius
+        if offset > 0:
+            offsetRadius = self.innerMinor(vLength, radius, offset)
+        return [blunt, line((offset, offsetRadius), (vLength - Xt, Yt))], offsetRadius
+
+    def outerCurve(self):
+        return self.getCurve(self._length, self._radius, self._noseRadius)[0]
+
+    def innerHollowCurve(self):
+        last = self._length - self._thickness
+        return last, self.getCurve(last, self._radius - self._thickness, self._noseRadius - self._thickness)[0]
+
+    def innerCurve(self):
+        last = self._length - self._thickness
+        curve, minor_y = self.getCurve(last, self._radius - self._thickness, self._noseRadius - self._thickness, self._thickness)
+        return last, minor_y, curve
+
+class BluntedOgiveNoseProfile(NoseProfile):
+
+    NOSE_TYPE = TYPE_BLUNTED_OGIVE
+
+    def getRho(self, radius, length):
+        rho = (radius * radius + length * length) / (2.0 * radius)
+        return rho
+
+    def ogive_y(self, x, length, radius, rho):
+        return np.sqrt(rho * rho - np.power(length - x, 2)) + radius - rho
+
+    def innerMinor(self, length, radius, offset):
+        rho = self.getRho(radius - offset, length - offset)
+
+        inner_minor = self.ogive_y(length - offset, length, radius - offset, rho)
+        return inner_minor
+
+    def getXt(self, Xo, Yt, noseRadius):
+        return Xo - math.sqrt((noseRadius * noseRadius) - (Yt * Yt))
+
+    def getYt(self, rho, radius, noseRadius):
+        return (noseRadius * (rho - radius)) / (rho - noseRadius)
+
+    def getXo(self, rho, length, radius, noseRadius):
+        return length - math.sqrt(math.pow(rho - noseRadius, 2) - math.pow(rho - radius, 2))
+
+    def getXa(self, Xo, noseRadius):
+        return Xo - noseRadius
+
+    def getOgiveCurve(self, rho, length, vLength, radius, min = 0):
+        x = np.arange(self._resolution) * ((length - min) / float(self._resolution))
+        return curvePoints(length - x, self.ogive_y(x + (vLength - length), vLength, radius, rho), (min, radius))
+
+    def getLength(self, length, radius, noseRadius):
+
+        min = length - noseRadius
+        max = (-radius * length) / (noseRadius - radius)
+
+        # Do a binary search to 0.0001 mm
+        precision = 0.0001
+        while (max - min) > precision:
+            mid = (max + min) / 2.0
+            rho = self.getRho(radius, mid)
+            Xo = self.getXo(rho, mid, radius, noseRadius)
+            Yt = self.getYt(rho, radius, noseRadius)
+            Xt = self.getXt(Xo, Yt, noseRadius)
+            Xa = self.getXa(Xo, noseRadius)
+
+            if (length + Xa) > mid:
+                min = mid
+            else:
+                max = mid
+
+        return (rho, mid, Xt, Yt, Xo, Xa)
+
+    def getMidArc(self, Xo, Xt, radius):
+        x = math.fabs(Xt + radius - Xo) / 2.0
+        y = math.sqrt(radius * radius - x * x)
+        return (x + Xo, y)
+
+    def getCurve(self, length, radius, noseRadius, offset=0.0):
+        """ Returns the blunted curve and its radius at the offset """
+        (rho, vLength, Xt, Yt, Xo, Xa) = self.getLength(length, radius, noseRadius)
+
+        midX, midY = self.getMidArc(vLength - Xo, vLength - Xt, noseRadius)
+        blunt = arc((vLength - Xt, Yt), (midX, midY), (length, 0.0))
+
+        offsetRadius = radius
+        if offset > 0:
+            offsetRadius = self.innerMinor(vLength, radius, offset)
+
+        ogive = spline(self.getOgiveCurve(rho, vLength - Xt, vLength, radius, offset))
+        return [blunt, ogive], offsetRadius
+
+    def outerCurve(self):
+        return self.getCurve(self._length, self._radius, self._noseRadius)[0]
+
+    def innerHollowCurve(self):
+        last = self._length - self._thickness
+        return last, self.getCurve(self._length - self._thickness, self._radius - self._thickness, self._noseRadius - self._thickness)[0]
+
+    def innerCurve(self):
+        last = self._length - self._thickness
+        curve, minor_y = self.getCurve(self._length - self._thickness, self._radius - self._thickness, self._noseRadius - self._thickness, self._thickness)
+        return last, minor_y, curve
+
+_profiles = {
+    TYPE_CONE : ConeNoseProfile,
+    TYPE_BLUNTED_CONE : BluntedConeNoseProfile,
+    TYPE_SPHERICAL : EllipseNoseProfile,
+    TYPE_ELLIPTICAL : EllipseNoseProfile,
+    TYPE_OGIVE : OgiveNoseProfile,
+    TYPE_BLUNTED_OGIVE : BluntedOgiveNoseProfile,
+    TYPE_SECANT_OGIVE : SecantOgiveNoseProfile,
+    TYPE_VON_KARMAN : HaackNoseProfile,
+    TYPE_HAACK : HaackNoseProfile,
+    TYPE_PARABOLIC : ParabolicNoseProfile,
+    TYPE_PARABOLA : PowerNoseProfile,
+    TYPE_POWER : PowerNoseProfile
+}
+
+def noseProfile(noseType, style, length, radius, **kwargs):
+    """ Create the profile for the given nose type """
+    return _profiles[noseType](style, length, radius, noseType=noseType, **kwargs)
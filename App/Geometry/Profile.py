@@ -0,0 +1,88 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Meridian profile segments for revolved components"""
+
+__title__ = "FreeCAD Rocket Workbench Profiles"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# Profiles are drawn in the (x, r) meridian plane with the rocket axis along x. They are
+# described as a list of segments that are turned into edges and revolved by the shape handlers
+SEGMENT_LINE = "line"
+SEGMENT_SPLINE = "spline"       # B-spline through the given poles
+SEGMENT_ARC = "arc"             # Circular arc through three points
+SEGMENT_ELLIPSE = "ellipse"     # Elliptical arc, major axis along x
+
+def point(x, y):
+    x = float(x)
+    y = float(y)
+    if not (np.isfinite(x) and np.isfinite(y)):
+        raise ValueError("Profile point is not finite")
+    return (x, y)
+
+def line(start, end):
+    return (SEGMENT_LINE, point(*start), point(*end))
+
+def spline(poles):
+    poles = np.asarray(poles, dtype=float)
+    if not np.all(np.isfinite(poles)):
+        raise ValueError("Profile curve is not finite")
+    return (SEGMENT_SPLINE, poles)
+
+def arc(start, middle, end):
+    return (SEGMENT_ARC, point(*start), point(*middle), point(*end))
+
+def ellipse(center, major, minor, first, last):
+    return (SEGMENT_ELLIPSE, point(*center), float(major), float(minor), float(first), float(last))
+
+def curvePoints(x, y, end):
+    """ Combine arrays of x and y values into an array of points, finishing at the end point """
+    return np.vstack((np.column_stack((x, y)), [end]))
+
+class Profile(ABC):
+    """ Base class for the closed meridian profile of a revolved part """
+
+    def validate(self):
+        """ Returns None when the parameters describe a valid profile, otherwise a tuple of an
+            untranslated message and its format arguments """
+        return None
+
+    def isValid(self):
+        return self.validate() is None
+
+    def key(self):
+        """ Identifies the profile by its class and parameters. Take the key before calling
+            segments(), which may cache intermediate values on the profile """
+        return (type(self).__name__,) + tuple(sorted(vars(self).items()))
+
+    def segments(self):
+        """ Returns the profile as a list of segments. Raises ValueError or ZeroDivisionError
+            when the parameters produce an invalid shape """
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            return self._segments()
+
+    @abstractmethod
+    def _segments(self):
+        """ The profile segments, implemented by each kind of profile """
@@ -0,0 +1,656 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Transition profiles"""
+
+__title__ = "FreeCAD Rocket Workbench Transition Profiles"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+from abc import abstractmethod
+
+import numpy as np
+
+from App.Constants import QT_TRANSLATE_NOOP
+from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
+from App.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, \
+    TYPE_POWER, TYPE_HAACK
+
+from App.Geometry.Profile import Profile, line, spline, ellipse
+
+CLIP_PRECISION = 0.00001
+
+class TransitionProfile(Profile):
+    """ Transition profile with the fore end at x = length and the aft end at x = 0 """
+
+    TRANSITION_TYPE = None
+
+    def __init__(self, style, length, foreRadius, aftRadius, thickness=0.0, coreRadius=0.0, coefficient=0.0,
+            resolution=100, clipped=False, foreShoulder=False, foreShoulderLength=0.0, foreShoulderRadius=0.0,
+            foreShoulderThickness=0.0, aftShoulder=False, aftShoulderLength=0.0, aftShoulderRadius=0.0,
+            aftShoulderThickness=0.0, transitionType=None):
+        self._type = transitionType or self.TRANSITION_TYPE
+        self._style = style
+        self._thickness = float(thickness)
+
+        self._length = float(length)
+        self._foreRadius = float(foreRadius)
+        self._aftRadius = float(aftRadius)
+        self._coreRadius = float(coreRadius)
+        self._coefficient = float(coefficient)
+        self._resolution = int(resolution)
+
+        self._clipped = (bool(clipped) and self.isClippable())
+        self._clipLength = -1.0
+        self._clipR1 = -1.0
+        self._clipR2 = -1.0
+
+        self._foreShoulder = bool(foreShoulder)
+        self._foreShoulderLength = float(foreShoulderLength)
+        self._foreShoulderRadius = float(foreShoulderRadius)
+        self._foreShoulderThickness = float(foreShoulderThickness)
+
+        self._aftShoulder = bool(aftShoulder)
+        self._aftShoulderLength = float(aftShoulderLength)
+        self._aftShoulderRadius = float(aftShoulderRadius)
+        self._aftShoulderThickness = float(aftShoulderThickness)
+
+        self._shoulder = (self._foreShoulder or self._aftShoulder)
+
+        # Used to show the shape outline for debugging
+        self._debugShape = False
+
+    def isClippable(self):
+        return True # Override if the shape is not clippable
+
+    def validate(self):
+        #Perform some general validations
+        if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
+            if self._thickness <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "For %s transitions thickness must be > 0"), (self._style,))
+            if self._thickness >= self._foreRadius or self._thickness >= self._aftRadius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Transition thickness must be less than the front or back radius"), ())
+
+        elif self._style == STYLE_SOLID_CORE:
+            if self._coreRadius >= self._foreRadius or self._coreRadius >= self._aftRadius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Transition core must be less than the front or back diameter"), ())
+            if self._foreShoulder:
+                if self._coreRadius >= self._foreShoulderRadius:
+                    return (QT_TRANSLATE_NOOP('Rocket', "Transition core must be less than the shoulder diameter"), ())
+            if self._aftShoulder:
+                if self._coreRadius >= self._aftShoulderRadius:
+                    return (QT_TRANSLATE_NOOP('Rocket', "Transition core must be less than the shoulder diameter"), ())
+
+        if self._foreShoulder:
+            if self._foreShoulderLength <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Forward shoulder length must be > 0"), ())
+            if self._foreShoulderRadius <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Forward shoulder diameter must be > 0"), ())
+            if self._foreShoulderRadius > self._foreRadius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Forward shoulder diameter can not exceed the transition diameter at the shoulder"), ())
+            if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
+                if self._foreShoulderThickness <= 0:
+                    return (QT_TRANSLATE_NOOP('Rocket', "For %s transitions with a shoulder, shoulder thickness must be > 0"), (self._style,))
+                if self._foreShoulderThickness >= self._foreShoulderRadius:
+                    return (QT_TRANSLATE_NOOP('Rocket', "Shoulder thickness must be less than the shoulder radius"), ())
+
+        if self._aftShoulder:
+            if self._aftShoulderLength <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Aft shoulder length must be > 0"), ())
+            if self._aftShoulderRadius <= 0:
+                return (QT_TRANSLATE_NOOP('Rocket', "Aft shoulder diameter must be > 0"), ())
+            if self._aftShoulderRadius > self._aftRadius:
+                return (QT_TRANSLATE_NOOP('Rocket', "Aft shoulder diameter can not exceed the transition diameter at the shoulder"), ())
+            if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
+                if self._aftShoulderThickness <= 0:
+                    return (QT_TRANSLATE_NOOP('Rocket', "For %s transitions with a shoulder, shoulder thickness must be > 0"), (self._style,))
+                if self._aftShoulderThickness >= self._aftShoulderRadius:
+                    return (QT_TRANSLATE_NOOP('Rocket', "Shoulder thickness must be less than the shoulder radius"), ())
+
+        return None
+
+    @abstractmethod
+    def _radiusAt(self, r1, r2, length, pos):
+        """ Radius of the curve at pos, from r1 at x = length to r2 at x = 0. pos may be an array """
+
+    #
+    # Numerically solve clipLength from the equation
+    #     r1 == self._radiusAt(clipLength,r2,clipLength+length)
+    # using a binary search.  It assumes getOuterRadius() to be monotonically increasing.
+    #
+    def _calculateClip(self, r1, r2):
+
+        # check if already calculated
+        if self._clipR1 == r1 and self._clipR2 == r2:
+            return
+        self._clipR1 = r1
+        self._clipR2 = r2
+
+        min = 0.0
+        max = self._length
+
+        if self._debugShape:
+            print("_calculateClip: r1 = %f, r2 = %f, length = %f" % (r1, r2, self._length))
+
+        if r1 >= r2:
+            tmp = r1
+            r1 = r2
+            r2 = tmp
+
+        #
+        # Keep increasing the length until our radius gets less than our target radius.
+        # This sets the min and max range to search
+        #
+        n = 0
+        rmax = self._radiusAt(0.0, r2, max, self._length)
+        while (rmax - r1) < 0:
+            min = max
+            max *= 2.0
+            n += 1
+            if n > 10:
+                break
+            rmax = self._radiusAt(0.0, r2, max, self._length)
+
+        # Do a binary search to see where we fit within tolerance
+        while True:
+            self._clipLength = (min + max) / 2.0
+            val = self._radiusAt(0.0, r2, self._clipLength, self._length)
+            err = (val - r1)
+            if not math.isfinite(err):
+                raise ValueError("Unable to calculate the clip length")
+            if math.fabs(err) < CLIP_PRECISION:
+                if self._debugShape:
+                   print("_calculateClip: r1 = %f, r2 = %f, clip length = %f, err = %f" % (r1, r2, self._clipLength, err))
+                return
+            if err > 0:
+                max = self._clipLength
+            else:
+                min = self._clipLength
+
+    def clipLength(self):
+        """ The length of the full curve that is clipped to fit the transition radii """
+        if not self._clipped:
+            return self._length
+        self._calculateClip(self._foreRadius, self._aftRadius)
+        return self._clipLength
+
+    def _segments(self):
+        if self._style == STYLE_SOLID:
+            if self._shoulder:
+                return self._solidShoulderLines(self._curve())
+            return self._solidLines(self._curve())
+        if self._style == STYLE_SOLID_CORE:
+            if self._shoulder:
+                return self._solidShoulderCoreLines(self._curve())
+            return self._solidCoreLines(self._curve())
+        if self._style == STYLE_HOLLOW and not self._shoulder:
+            return self._hollowLines(self._curve(), self._curveInnerHollow())
+
+        if self._style == STYLE_HOLLOW:
+            innerForeX = self._length
+            if self._foreShoulder:
+                innerForeX = self._length - self._thickness
+
+            innerAftX = 0.0
+            if self._aftShoulder:
+                innerAftX = self._thickness
+        else:
+            innerForeX = self._length - self._thickness
+            innerAftX = self._thickness
+
+        innerForeY = self._clippedInnerRadius(self._foreRadius, self._aftRadius, innerForeX)
+        innerAftY = self._clippedInnerRadius(self._foreRadius, self._aftRadius, innerAftX)
+
+        outer_curve = self._curve()
+        inner_curve = self._curveInner(innerForeX, innerAftX, innerForeY, innerAftY)
+
+        if self._style == STYLE_HOLLOW:
+            return self._hollowShoulderLines(innerForeY, innerAftY, outer_curve, inner_curve)
+        if self._shoulder:
+            return self._cappedShoulderLines(innerForeY, innerAftY, outer_curve, inner_curve)
+        return self._cappedLines(innerForeY, innerAftY, outer_curve, inner_curve)
+
+    def _generateCurve(self, r1, r2, length, min = 0, max = 0.0):
+        if self._debugShape:
+            print("r1 = %f, r2 = %f, length = %f, min = %f, max = %f" % (r1, r2, length, min, max))
+        if max <= 0:
+            max = self._length
+
+        x = max - (np.arange(1, self._resolution) * ((max - min) / float(self._resolution)))
+        if self._clipped:
+            if r2 > r1: # 0
+                y = self._radiusAt(0.0, r2, length, x)
+                first = (max, r1)
+                last = (min, r2)
+            else: # 1
+                y = self._radiusAt(0.0, r1, length, x)
+                x = max + min - x
+                first = (min, r2)
+                last = (max, r1)
+        else:
+            # 2,3
+            y = self._radiusAt(r1, r2, length, x)
+            first = (max, r1)
+            last = (min, r2)
+
+        points = np.vstack(([first], np.column_stack((x, np.broadcast_to(y, x.shape))), [last]))
+
+        if self._debugShape:
+            for point in points:
+                print("x,y (%f,%f)" % (point[0], point[1]))
+
+        return spline(points)
+
+    def _getLength(self):
+        if self._clipped:
+            return self._clipLength
+        return self._length
+
+    def _curve(self):
+        if self._clipped:
+            self._calculateClip(self._foreRadius, self._aftRadius)
+
+        curve = self._generateCurve(self._foreRadius, self._aftRadius, self._getLength())
+        return curve
+
+    def _curveInnerHollow(self):
+        if self._clipped:
+            self._calculateClip(self._foreRadius - self._thickness, self._aftRadius - self._thickness)
+
+        curve = self._generateCurve(self._foreRadius - self._thickness, self._aftRadius - self._thickness, self._getLength())
+        return curve
+
+    def _curveInner(self, foreX, aftX, foreY, aftY):
+        if self._clipped:
+            self._calculateClip(foreY, aftY)
+
+        curve = self._generateCurve(foreY, aftY, self._getLength(), aftX, foreX)
+        return curve
+
+    def _clippedInnerRadius(self, r1, r2, pos):
+        r1 -= self._thickness
+        r2 -= self._thickness
+
+        if self._clipped:
+            self._calculateClip(r1, r2)
+            if r2 > r1:
+                return self._radiusAt(0.0, r2, self._clipLength, pos)
+            else:
+                return self._radiusAt(0.0, r1, self._clipLength, self._length - pos)
+        return self._radiusAt(r1, r2, self._length, pos)
+
+    def _solidLines(self, outerShape):
+
+        foreCenter = (self._length, 0.0)
+        aftCenter = (0.0, 0.0)
+
+        foreRadius = (self._length, self._foreRadius)
+        aftRadius = (0.0, self._aftRadius)
+
+        return [outerShape, line(foreRadius, foreCenter), line(foreCenter, aftCenter), line(aftCenter, aftRadius)]
+
+    def _solidShoulderLines(self, outerShape):
+        return self._solidShoulderCoreLines(outerShape, 0.0)
+
+    def _solidCoreLines(self, outerShape):
+
+        foreCenter = (self._length, self._coreRadius)
+        aftCenter = (0.0, self._coreRadius)
+
+        foreRadius = (self._length, self._foreRadius)
+        aftRadius = (0.0, self._aftRadius)
+
+        return [outerShape, line(foreRadius, foreCenter), line(foreCenter, aftCenter), line(aftCenter, aftRadius)]
+
+    def _solidShoulderCoreLines(self, outerShape, coreRadius=None):
+        if coreRadius is None:
+            coreRadius = self._coreRadius
+
+        front = []
+        back = []
+        if self._foreShoulder:
+            front = [line((self._length, self._foreRadius),                                          (self._length, self._foreShoulderRadius)),
+                     line((self._length, self._foreShoulderRadius),                                  (self._length + self._foreShoulderLength, self._foreShoulderRadius)),
+                     line((self._length + self._foreShoulderLength, self._foreShoulderRadius),       (self._length + self._foreShoulderLength, coreRadius))]
+            foreX = self._length + self._foreShoulderLength
+        else:
+            front = [line((self._length, self._foreRadius), (self._length, coreRadius))]
+            foreX = self._length
+
+        # Have to factor in an aft shoulder
+        if self._aftShoulder:
+            front.append(line((foreX, coreRadius), (-self._aftShoulderLength, coreRadius)))
+        else:
+            front.append(line((foreX, coreRadius), (0, coreRadius)))
+
+        if self._aftShoulder:
+            back = [line((0, self._aftRadius),                                      (0, self._aftShoulderRadius)),
+                    line((0, self._aftShoulderRadius),                              (-self._aftShoulderLength, self._aftShoulderRadius)),
+                    line((-self._aftShoulderLength, self._aftShoulderRadius),       (-self._aftShoulderLength, coreRadius))]
+        else:
+            back = [line((0, self._aftRadius), (0, coreRadius))]
+
+        return [outerShape] + front + back
+
+    def _hollowLines(self, outerShape, innerShape):
+
+        major = (0.0, self._aftRadius)
+        minor = (self._length, self._foreRadius)
+
+        innerMajor = (0.0, self._aftRadius - self._thickness)
+        innerMinor = (self._length, self._foreRadius - self._thickness)
+
+        return [outerShape, line(major, innerMajor), line(minor, innerMinor), innerShape]
+
+    def _hollowShoulderLines(self, foreY, aftY, outerShape, innerShape):
+
+        front = []
+        back = []
+        if self._foreShoulder:
+            front = [line((self._length, self._foreRadius),                                                                     (self._length, self._foreShoulderRadius)),
+                     line((self._length, self._foreShoulderRadius),                                                             (self._length + self._foreShoulderLength, self._foreShoulderRadius)),
+                     line((self._length + self._foreShoulderLength, self._foreShoulderRadius),                                  (self._length + self._foreShoulderLength, self._foreShoulderRadius - self._foreShoulderThickness)),
+                     line((self._length + self._foreShoulderLength, self._foreShoulderRadius - self._foreShoulderThickness),    (self._length - self._thickness, self._foreShoulderRadius - self._foreShoulderThickness)),
+                     line((self._length - self._thickness, self._foreShoulderRadius - self._foreShoulderThickness),             (self._length - self._thickness, foreY))]
+        else:
+            front = [line((self._length, self._foreRadius), (self._length, self._foreRadius - self._thickness))]
+
+        if self._aftShoulder:
+            back = [line((0.0, self._aftRadius),                                                                    (0.0, self._aftShoulderRadius)),
+                    line((0.0, self._aftShoulderRadius),                                                            (-self._aftShoulderLength, self._aftShoulderRadius)),
+                    line((-self._aftShoulderLength, self._aftShoulderRadius),                                       (-self._aftShoulderLength, self._aftShoulderRadius - self._aftShoulderThickness)),
+                    line((-self._aftShoulderLength, self._aftShoulderRadius - self._aftShoulderThickness),          (self._thickness, self._aftShoulderRadius - self._aftShoulderThickness)),
+                    line((self._thickness, self._aftShoulderRadius - self._aftShoulderThickness),                   (self._thickness, aftY))]
+        else:
+            back = [line((0.0, self._aftRadius), (0.0, self._aftRadius - self._thickness))]
+
+        return [outerShape] + front + back + [innerShape]
+
+    def _cappedLines(self, foreY, aftY, outerShape, innerShape):
+
+        fore = (self._length, self._foreRadius)
+        aft = (0.0, self._aftRadius)
+
+        foreInner = (self._length - self._thickness, foreY)
+        aftIinner = (self._thickness, aftY)
+
+        foreCenter = (self._length, 0)
+        aftCenter = (0, 0)
+
+        foreInnerCenter = (self._length - self._thickness, 0)
+        aftInnerCenter = (self._thickness, 0)
+
+        return [outerShape, line(fore, foreCenter), line(foreCenter, foreInnerCenter), line(foreInnerCenter, foreInner), innerShape,
+                line(aft, aftCenter), line(aftCenter, aftInnerCenter), line(aftInnerCenter, aftIinner), innerShape]
+
+    def _cappedShoulderLines(self, foreY, aftY, outerShape, innerShape):
+
+        front = []
+        back = []
+        if self._foreShoulder:
+            front = [line((self._length, self._foreRadius),                                                                                        (self._length, self._foreShoulderRadius)),
+                     line((self._length, self._foreShoulderRadius),                                                                                (self._length + self._foreShoulderLength, self._foreShoulderRadius)),
+                     line((self._length + self._foreShoulderLength, self._foreShoulderRadius),                                                     (self._length + self._foreShoulderLength, 0)),
+                     line((self._length + self._foreShoulderLength, 0),                                                                            (self._length + self._foreShoulderLength - self._foreShoulderThickness, 0)),
+                     line((self._length + self._foreShoulderLength - self._foreShoulderThickness, 0),                                              (self._length + self._foreShoulderLength - self._foreShoulderThickness, self._foreShoulderRadius - self._foreShoulderThickness)),
+                     line((self._length + self._foreShoulderLength - self._foreShoulderThickness, self._foreShoulderRadius - self._foreShoulderThickness),
+                                                                                                                                                   (self._length - self._thickness, self._foreShoulderRadius - self._foreShoulderThickness)),
+                     line((self._length - self._thickness, self._foreShoulderRadius - self._foreShoulderThickness),                                (self._length - self._thickness, foreY))]
+        else:
+            front = [line((self._length, self._foreRadius),             (self._length, 0)),
+                     line((self._length, 0),                            (self._length - self._thickness, 0)),
+                     line((self._length - self._thickness, 0),          (self._length - self._thickness, foreY))]
+
+        if self._aftShoulder:
+            back = [line((0, self._aftRadius),                                                                      (0, self._aftShoulderRadius)),
+                    line((0, self._aftShoulderRadius),                                                              (-self._aftShoulderLength, self._aftShoulderRadius)),
+                    line((-self._aftShoulderLength, self._aftShoulderRadius),                                       (-self._aftShoulderLength, 0)),
+                    line((-self._aftShoulderLength, 0),                                                             (-self._aftShoulderLength + self._aftShoulderThickness, 0)),
+                    line((-self._aftShoulderLength + self._aftShoulderThickness, 0),                                (-self._aftShoulderLength + self._aftShoulderThickness, self._aftShoulderRadius - self._aftShoulderThickness)),
+                    line((-self._aftShoulderLength + self._aftShoulderThickness, self._aftShoulderRadius - self._aftShoulderThickness),
+                                                                                                                    (self._thickness, self._aftShoulderRadius - self._aftShoulderThickness)),
+                    line((self._thickness, self._aftShoulderRadius - self._aftShoulderThickness),                   (self._thickness, aftY))]
+        else:
+            back = [line((0, self._aftRadius),      (0, 0)),
+                    line((0, 0),                    (self._thickness, 0)),
+                    line((self._thickness, 0),      (self._thickness, aftY))]
+
+        return [outerShape] + front + back + [innerShape]
+
+class ConeTransitionProfile(TransitionProfile):
+
+    TRANSITION_TYPE = TYPE_CONE
+
+    def isClippable(self):
+        # Clipped shape is the same as the unclipped
+        return False
+
+    def _radiusAt(self, r1, r2, length, pos):
+        if r1 > r2:
+            intercept = r1
+            x = length - pos
+            slope = (r2 - r1) / length
+        else:
+            intercept = r2
+            x = pos
+            slope = (r1 - r2) / length
+
+        y = x * slope + intercept
+        return y
+
+    # Override the default to use native shapes
+    def _generateCurve(self, r1, r2, length, min = 0, max = 0):
+        if max == 0.0:
+            max = length
+        return line((min, r2), (max, r1))
+
+class EllipseTransitionProfile(TransitionProfile):
+
+    TRANSITION_TYPE = TYPE_ELLIPTICAL
+
+    def _radiusAt(self, r1, r2, length, pos):
+        major = length
+        if r1 > r2:
+            minor = r1 - r2
+            center = r2
+            x = length - pos
+        else:
+            minor = r2 - r1
+            center = r1
+            x = pos
+
+        y = (minor / major) * np.sqrt(major * major - x * x)
+        return y + center
+
+    def _eTheta(self, major, minor, tanTheta):
+        #
+        # Adgusts the angle to account for the eccentric anomalies. Refer to
+        #  https://forum.freecadweb.org/viewtopic.php?f=22&t=55655
+        eTheta = math.atan(major / minor * tanTheta)
+        return eTheta
+
+    # Override the default to use native shapes
+    #
+    # Doesn't work at the moment due to the extreme precision required in calculating the angles. The math is right
+    # but the points are off by thousandths of a mm resulting in discontinuities. Kept here for further
+    # development if desired
+    def _generateClippedCurve(self, r1, r2, length, min = 0, max = 0):
+        if max == 0.0:
+            max = self._length
+
+        if r1 > r2:
+            major = length - min
+            minor = r1
+            if min <= 0:
+                theta1 = math.pi/2
+            else:
+                theta1 = self._eTheta(major, minor, (r1 / min))
+            theta2 = math.pi - self._eTheta(major, minor, (r2 / max))
+
+            return ellipse((max, 0.0), major, minor, theta1, theta2)
+
+        major = length - min
+        minor = r2
+        if min <= 0:
+            theta2 = math.pi/2
+        else:
+            theta2 = self._eTheta(major, minor, (r2 / min))
+        theta1 = self._eTheta(major, minor, (r1 / max))
+        return ellipse((min, 0.0), major, minor, theta1, theta2)
+
+    # Override the default to use native shapes
+    def _generateCurve(self, r1, r2, length, min = 0, max = 0):
+        if self._clipped:
+            return super()._generateCurve(r1, r2, length, min, max)
+
+        if self._debugShape:
+            print ("r1 = %f, r2 = %f, min = %f, max = %f, length = %f" % (r1, r2, min, max, length))
+        if max == 0.0:
+            max = length - min
+        if r1 > r2:
+            radius = r1 - r2
+            return ellipse((max, r2), max - min, radius, math.pi/2, math.pi)
+
+        radius = r2 - r1
+        return ellipse((min, r1), max - min, radius, 0.0, math.pi/2)
+
+class HaackTransitionProfile(TransitionProfile):
+
+    TRANSITION_TYPE = TYPE_HAACK
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # The Von Karman shape is a Haack series with a coefficient of 0
+        if self._type == TYPE_VON_KARMAN:
+            self._coefficient = 0.0
+
+    def validate(self):
+        if self._coefficient < 0:
+            return (QT_TRANSLATE_NOOP('Rocket', "For %s transitions the coefficient must be >= 0"), (self._type,))
+        return super().validate()
+
+    def _theta(self, x, length):
+        return np.arccos(1 - 2*x/length)
+
+    def _radiusAt(self, r1, r2, length, pos):
+        if r1 > r2:
+            radius = r1 - r2
+            center = r2
+            x = pos
+        else:
+            radius = r2 - r1
+            center = r1
+            x = length - pos
+
+        theta = self._theta(x, length)
+        y = radius * np.sqrt(theta - np.sin(2 * theta)/2
+            + self._coefficient * np.power(np.sin(theta), 3)) / math.sqrt(math.pi)
+        return y + center
+
+class OgiveTransitionProfile(TransitionProfile):
+
+    TRANSITION_TYPE = TYPE_OGIVE
+
+    def isClippable(self):
+        # Clipped shape is the same as the unclipped
+        return False
+
+    def _radiusAt(self, r1, r2, length, pos):
+        if r1 > r2:
+            radius = r1 - r2
+            center = r2
+            x = length - pos
+        else:
+            radius = r2 - r1
+            center = r1
+            x = pos
+        rho = (radius * radius + length * length) / (2.0 * radius)
+
+        y = np.sqrt(rho * rho - np.power(x, 2)) + radius - rho
+        return y + center
+
+class ParabolicTransitionProfile(TransitionProfile):
+
+    TRANSITION_TYPE = TYPE_PARABOLIC
+
+    def validate(self):
+        if self._coefficient < 0 or self._coefficient > 1:
+            return (QT_TRANSLATE_NOOP('Rocket', "For %s transitions the coefficient must be in the range (0 <= coefficient <= 1)"), (self._type,))
+        return super().validate()
+
+    def _radiusAt(self, r1, r2, length, pos):
+        if r1 > r2:
+            radius = r1 - r2
+            center = r2
+            x = pos
+        else:
+            radius = r2 - r1
+            center = r1
+            x = length - pos
+
+        ratio = x / length
+        y = radius * ((2 * ratio) - (self._coefficient * ratio * ratio)) / (2 - self._coefficient)
+        return y + center
+
+class PowerTransitionProfile(TransitionProfile):
+
+    TRANSITION_TYPE = TYPE_POWER
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # The parabola is a power series with a coefficient of 0.5
+        if self._type == TYPE_PARABOLA:
+            self._coefficient = 0.5
+
+    def validate(self):
+        if self._coefficient <= 0 or self._coefficient > 1:
+            return (QT_TRANSLATE_NOOP('Rocket', "For %s transitions the coefficient must be in the range (0 < coefficient <= 1)"), (self._type,))
+        return super().validate()
+
+    def _radiusAt(self, r1, r2, length, pos):
+        if r1 > r2:
+            radius = r1 - r2
+            center = r2
+            x = pos
+        else:
+            radius = r2 - r1
+            center = r1
+            x = length - pos
+
+        y = radius * np.power((x / length), self._coefficient)
+        return y + center
+
+_profiles = {
+    TYPE_CONE : ConeTransitionProfile,
+    TYPE_ELLIPTICAL : EllipseTransitionProfile,
+    TYPE_OGIVE : OgiveTransitionProfile,
+    TYPE_VON_KARMAN : HaackTransitionProfile,
+    TYPE_HAACK : HaackTransitionProfile,
+    TYPE_PARABOLIC : ParabolicTransitionProfile,
+    TYPE_PARABOLA : PowerTransitionProfile,
+    TYPE_POWER : PowerTransitionProfile
+}
+
+def transitionProfile(transitionType, style, length, foreRadius, aftRadius, **kwargs):
+    """ Create the profile for the given transition type """
+    return _profiles[transitionType](style, length, foreRadius, aftRadius, transitionType=transitionType, **kwargs)
@@ -0,0 +1,255 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Mass, center of gravity and inertia rollup for a rocket"""
+
+__title__ = "FreeCAD Rocket Mass Rollup"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sqlite3
+import numpy as np
+
+import FreeCAD
+
+from App.Constants import MATERIAL_TYPE_BULK
+from App.Geometry.MassProperties import MassProperties
+from App.Parts.PartDatabase import PartDatabase
+from App.Parts.Material import getMaterialDensity
+from App.Parts.Exceptions import MaterialNotFoundError
+from App.ShapeComponent import ShapeComponent, MASS_PROPERTIES
+
+# Changing any of these properties invalidates the cached mass of a part
+_MASS_DEPENDENT = MASS_PROPERTIES + ['Shape', 'Placement', 'Manufacturer', 'Material', 'ManufacturerMass']
+
+# Material densities are looked up once per session, keyed by (manufacturer, material)
+_densities = {}
+
+# Rollups by document name, then by the name of the root group
+_rollups = {}
+_observer = None
+
+def _matrix(placement):
+    return np.array(placement.toMatrix().A).reshape(4, 4)
+
+def _materialDensity(manufacturer, material):
+    """ Bulk material density in kg/mm^3, or 0 if it isn't in the parts database """
+    key = (manufacturer, material)
+    if key not in _densities:
+        density = 0.0
+        try:
+            connection = PartDatabase(FreeCAD.getUserAppDataDir() + "Mod/Rocket/").getConnection()
+            connection.row_factory = sqlite3.Row
+            try:
+                density = getMaterialDensity(connection, manufacturer, material, MATERIAL_TYPE_BULK) * 1e-9
+            finally:
+                connection.close()
+        except (MaterialNotFoundError, sqlite3.Error):
+            pass
+        _densities[key] = density
+    return _densities[key]
+
+def _isPart(obj):
+    return isinstance(getattr(obj, 'Proxy', None), ShapeComponent)
+
+class _MassNode:
+
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.part = None    # Mass properties of the part itself, relative to its placement
+        self.total = None   # Mass properties of the part and everything below it, relative to the parent
+
+class MassRollup:
+    """ Aggregates the mass properties of the parts in a document, or in a single group.
+
+        Each node in the document tree caches the aggregate of its subtree, in the coordinate
+        system of its parent. When a part or container changes only the nodes on the path from
+        it to the root are recalculated, summing the cached aggregates of their other children.
+        The properties of each part are cached relative to its own placement, so moving a part
+        or one of its containers, or moving it to another group, doesn't invalidate them.
+
+        Masses are in kg, lengths in mm and inertias in kg*mm^2 about the center of mass """
+
+    def __init__(self, doc, root=None):
+        self._doc = doc
+        self._rootName = None if root is None else root.Name
+        self._root = None
+        self._nodes = {}
+
+        self.recalculated = 0 # Number of subtree aggregates calculated
+
+    def invalidate(self, obj):
+        node = self._nodes.get(obj.Name)
+        if node is not None:
+            node.part = None
+            while node is not None:
+                node.total = None
+                node = node.parent
+
+    def invalidateStructure(self):
+        # The tree is rebuilt on the next request. Cached part properties are kept
+        self._root = None
+
+    def massProperties(self, obj=None):
+        """ Mass properties of the whole rocket, or of the subtree starting at obj """
+        if self._root is None:
+            self._build()
+
+        if obj is None:
+            node = self._root
+            obj = None if self._rootName is None else self._doc.getObject(self._rootName)
+        else:
+            node = self._nodes.get(obj.Name)
+        if node is None:
+            return MassProperties()
+
+        total = self._total(node)
+        if obj is not None:
+            # Relative to the parent, which may be placed within other containers
+            total = total.transformed(_matrix(self._parentPlacement(obj)))
+        return total
+
+    def mass(self, obj=None):
+        return self.massProperties(obj).volume
+
+    def _build(self):
+        parts = {name : node.part for name, node in self._nodes.items()}
+        self._nodes = {}
+
+        group = None if self._rootName is None else self._doc.getObject(self._rootName)
+        if group is not None:
+            self._root = self._addNode(group, None)
+        else:
+            self._root = _MassNode(None, None)
+            if self._rootName is None:
+                self._addChildren(self._root, [obj for obj in self._doc.Objects if obj.getParentGroup() is None])
+
+        for name, node in self._nodes.items():
+            node.part = parts.get(name)
+
+    def _addNode(self, obj, parent):
+        node = _MassNode(obj.Name, parent)
+        self._nodes[obj.Name] = node
+        self._addChildren(node, getattr(obj, 'Group', []))
+        return node
+
+    def _addChildren(self, node, children):
+        for child in children:
+            if (_isPart(child) or hasattr(child, 'Group')) and child.Name not in self._nodes:
+                node.children.append(self._addNode(child, node))
+
+    def _parentPlacement(self, obj):
+        # The global placement of the coordinate system obj is placed in
+        placement = obj.getGlobalPlacement()
+        if hasattr(obj, 'Placement'):
+            placement = placement.multiply(obj.Placement.inverse())
+        return placement
+
+    def _total(self, node):
+        if node.total is None:
+            total = self._part(node)
+            for child in node.children:
+                total = total + self._total(child)
+
+            obj = None if node.name is None else self._doc.getObject(node.name)
+            if obj is not None and hasattr(obj, 'Placement'):
+                total = total.transformed(_matrix(obj.Placement))
+            node.total = total
+            self.recalculated += 1
+        return node.total
+
+    def _part(self, node):
+        if node.part is None:
+            obj = None if node.name is None else self._doc.getObject(node.name)
+            if obj is None or not _isPart(obj):
+                node.part = MassProperties()
+            else:
+                node.part = self._partMassProperties(obj)
+        return node.part
+
+    def _localMassProperties(self, obj):
+        # Use the analytic properties where the component provides them
+        if hasattr(obj, 'Volume') and obj.Volume.Value > 0.0:
+            center = obj.CenterOfMass
+            inertia = np.diag([obj.AxialInertia, obj.TransverseInertia, obj.TransverseInertia])
+            return MassProperties(obj.Volume.Value, (center.x, center.y, center.z), inertia)
+
+        shape = obj.Shape
+        if shape.isNull() or shape.Volume <= 0.0:
+            return MassProperties()
+        center = shape.CenterOfMass
+        inertia = np.array(shape.MatrixOfInertia.A).reshape(4, 4)[:3, :3]
+        properties = MassProperties(shape.Volume, (center.x, center.y, center.z), inertia)
+
+        # The shape includes the object placement
+        return properties.transformed(_matrix(obj.Placement.inverse()))
+
+    def _partMassProperties(self, obj):
+        properties = self._localMassProperties(obj)
+        if properties.volume <= 0.0:
+            return MassProperties()
+
+        mass = getattr(obj, 'ManufacturerMass', 0.0)
+        if mass > 0.0:
+            density = mass / properties.volume
+        else:
+            density = _materialDensity(obj.Manufacturer, obj.Material)
+
+        return properties.scaled(density)
+
+class _MassRollupObserver:
+
+    def _rollups(self, obj):
+        return _rollups.get(obj.Document.Name, {}).values()
+
+    def slotChangedObject(self, obj, prop):
+        for rollup in self._rollups(obj):
+            if prop == 'Group':
+                rollup.invalidateStructure()
+            elif prop in _MASS_DEPENDENT:
+                rollup.invalidate(obj)
+
+    def slotCreatedObject(self, obj):
+        for rollup in self._rollups(obj):
+            rollup.invalidateStructure()
+
+    def slotDeletedObject(self, obj):
+        for rollup in self._rollups(obj):
+            rollup.invalidate(obj)
+            rollup.invalidateStructure()
+
+    def slotDeletedDocument(self, doc):
+        _rollups.pop(doc.Name, None)
+
+def getMassRollup(doc, root=None):
+    """ Returns the rollup for the document or group, kept current by a document observer """
+    global _observer
+
+    if _observer is None:
+        _observer = _MassRollupObserver()
+        FreeCAD.addDocumentObserver(_observer)
+
+    rollups = _rollups.setdefault(doc.Name, {})
+    key = None if root is None else root.Name
+    if key not in rollups:
+        rollups[key] = MassRollup(doc, root)
+    return rollups[key]
@@ -24,75 +24,9 @@ __title__ = "FreeCAD Conical Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
-import Part
-
 from App.NoseShapeHandler import NoseShapeHandler
-    
-    
-class NoseConeShapeHandler(NoseShapeHandler):
-
-    def innerMinor(self, last):
-        intercept = self._radius - self._thickness
-        slope = intercept * -1 / (last - self._thickness)
-        inner_minor = self._thickness * slope + intercept
-        return inner_minor
-
-    def drawSolid(self):
-        outer_curve = Part.LineSegment(FreeCAD.Vector(self._length, 0.0), FreeCAD.Vector(0.0, self._radius))
-
-        edges = self.solidLines(outer_curve)
-        return edges
-
-    def drawSolidShoulder(self):
-        outer_curve = Part.LineSegment(FreeCAD.Vector(self._length, 0.0), FreeCAD.Vector(0.0, self._radius))
-
-        edges = self.solidShoulderLines(outer_curve)
-        return edges
-
-    def drawHollow(self):
-        # Calculate the offset from the end to maintain the thickness
-        offset = self._length * self._thickness / self._radius
-        last = self._length - offset
+from App.Geometry.Nose import ConeNoseProfile
 
-        outer_curve = Part.LineSegment(FreeCAD.Vector(self._length, 0.0), FreeCAD.Vector(0.0, self._radius))
-        inner_curve = Part.LineSegment(FreeCAD.Vector(last, 0.0), FreeCAD.Vector(0.0, self._radius - self._thickness))
-
-        edges = self.hollowLines(last, outer_curve, inner_curve)
-        return edges
-
-    def drawHollowShoulder(self):
-        # Calculate the offset from the end to maintain the thickness
-        offset = self._length * self._thickness / self._radius
-        last = self._length - offset
-        minor_y = self.innerMinor(last)
-
-        outer_curve = Part.LineSegment(FreeCAD.Vector(self._length, 0.0), FreeCAD.Vector(0.0, self._radius))
-        inner_curve = Part.LineSegment(FreeCAD.Vector(last, 0.0), FreeCAD.Vector(self._thickness, minor_y))
-
-        edges = self.hollowShoulderLines(last, minor_y, outer_curve, inner_curve)
-        return edges
-
-    def drawCapped(self):
-        # Calculate the offset from the end to maintain the thickness
-        offset = self._length * self._thickness / self._radius
-        last = self._length - offset
-        minor_y = self.innerMinor(last)
-
-        outer_curve = Part.LineSegment(FreeCAD.Vector(self._length, 0.0), FreeCAD.Vector(0.0, self._radius))
-        inner_curve = Part.LineSegment(FreeCAD.Vector(last, 0.0), FreeCAD.Vector(self._thickness, minor_y))
-
-        edges = self.cappedLines(last, minor_y, outer_curve, inner_curve)
-        return edges
-
-    def drawCappedShoulder(self):
-        # Calculate the offset from the end to maintain the thickness
-        offset = self._length * self._thickness / self._radius
-        last = self._length - offset
-        minor_y = self.innerMinor(last)
-
-        outer_curve = Part.LineSegment(FreeCAD.Vector(self._length, 0.0), FreeCAD.Vector(0.0, self._radius))
-        inner_curve = Part.LineSegment(FreeCAD.Vector(last, 0.0), FreeCAD.Vector(self._thickness, minor_y))
+class NoseConeShapeHandler(NoseShapeHandler):
 
-        edges = self.cappedShoulderLines(last, minor_y, outer_curve, inner_curve)
-        return edges
+    _profileClass = ConeNoseProfile
@@ -24,70 +24,9 @@ __title__ = "FreeCAD Elliptical Nose Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
-import Part
-import math
-
 from App.NoseShapeHandler import NoseShapeHandler
-    
-    
-class NoseEllipseShapeHandler(NoseShapeHandler):
-
-    def innerMinor(self, last):
-        a = last
-        b = self._radius - self._thickness
-        x = self._thickness
-
-        inner_minor = (b / a) * math.sqrt(a * a - x * x)
-        return inner_minor
-
-    def drawSolid(self):
-        outer_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), self._length, self._radius), 0.0, math.pi/2)
-
-        edges = self.solidLines(outer_curve)
-        return edges
-
-    def drawSolidShoulder(self):
-        outer_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), self._length, self._radius), 0.0, math.pi/2)
-
-        edges = self.solidShoulderLines(outer_curve)
-        return edges
-
-    def drawHollow(self):
-        last = self._length - self._thickness
+from App.Geometry.Nose import EllipseNoseProfile
 
-        outer_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), self._length, self._radius), 0.0, math.pi/2)
-        inner_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), last, self._radius - self._thickness), 0.0, math.pi/2)
-
-        edges = self.hollowLines(last, outer_curve, inner_curve)
-        return edges
-
-    def drawHollowShoulder(self):
-        last = self._length - self._thickness
-        minor_y = self.innerMinor(last)
-
-        outer_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), self._length, self._radius), 0.0, math.pi/2)
-        inner_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(self._thickness, 0), last - self._thickness, minor_y), 0.0, math.pi/2)
-
-        edges = self.hollowShoulderLines(last, minor_y, outer_curve, inner_curve)
-        return edges
-
-    def drawCapped(self):
-        last = self._length - self._thickness
-        minor_y = self.innerMinor(last)
-
-        outer_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), self._length, self._radius), 0.0, math.pi/2)
-        inner_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(self._thickness, 0), last - self._thickness, minor_y), 0.0, math.pi/2)
-
-        edges = self.cappedLines(last, minor_y, outer_curve, inner_curve)
-        return edges
-
-    def drawCappedShoulder(self):
-        last = self._length - self._thickness
-        minor_y = self.innerMinor(last)
-
-        outer_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(0, 0), self._length, self._radius), 0.0, math.pi/2)
-        inner_curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(self._thickness, 0), last - self._thickness, minor_y), 0.0, math.pi/2)
+class NoseEllipseShapeHandler(NoseShapeHandler):
 
-        edges = self.cappedShoulderLines(last, minor_y, outer_curve, inner_curve)
-        return edges
+    _profileClass = EllipseNoseProfile
@@ -0,0 +1,216 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Headless parametric sweeps of rocket components"""
+
+__title__ = "FreeCAD Rocket Parametric Sweep"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import json
+import time
+import itertools
+import multiprocessing
+
+import FreeCAD
+import Part
+
+from App.Constants import FEATURE_NOSE_CONE, FEATURE_TRANSITION, FEATURE_BODY_TUBE
+from App.ShapeNoseCone import ShapeNoseCone
+from App.ShapeTransition import ShapeTransition
+from App.ShapeBodyTube import ShapeBodyTube
+
+FORMAT_BREP = "brep"
+FORMAT_STEP = "step"
+FORMAT_STL = "stl"
+
+MANIFEST = "manifest.json"
+
+# Components that can be swept
+_proxies = {
+    FEATURE_NOSE_CONE : ShapeNoseCone,
+    FEATURE_TRANSITION : ShapeTransition,
+    FEATURE_BODY_TUBE : ShapeBodyTube
+}
+
+# Per process worker state. Each worker keeps one document and one object per component type,
+# reused for every variant it builds, along with the default geometry of each object
+_document = None
+_objects = {}
+_defaults = {}
+
+def gridVariants(grid):
+    """ Every combination of the parameter values in the grid, a dictionary of property names
+        and lists of values """
+    names = list(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*[grid[name] for name in names])]
+
+def _initWorker():
+    global _document
+
+    _document = FreeCAD.newDocument("ParametricSweep")
+    _objects.clear()
+    _defaults.clear()
+
+def _sweepObject(feature):
+    if feature not in _objects:
+        obj = _document.addObject('Part::FeaturePython', feature)
+        _proxies[feature](obj)
+        _objects[feature] = obj
+        _defaults[feature] = {name : getattr(obj, name) for name in obj.Proxy._geometryProperties}
+    return _objects[feature]
+
+def buildVariant(task):
+    """ Build a single variant, returning its shape as a BREP string along with its volume and timings.
+        Runs in the worker processes """
+    index, feature, parameters = task
+
+    result = {
+        "index" : index,
+        "brep" : None,
+        "volume" : 0.0,
+        "build" : 0.0,
+        "serialize" : 0.0,
+        "error" : None
+    }
+    try:
+        start = time.perf_counter()
+        obj = _sweepObject(feature)
+
+        # Start from the defaults, so that properties the variant doesn't set, or that the
+        # handler adjusted for a previous variant, don't depend on what this worker built before
+        for name, value in _defaults[feature].items():
+            setattr(obj, name, value)
+        for name, value in parameters.items():
+            setattr(obj, name, value)
+
+        # Don't let an invalid variant report the shape of the previous one
+        obj.Shape = Part.Shape()
+
+        # Draw through the handler rather than execute(), which would read from and fill the
+        # user's shape cache
+        handler = obj.Proxy.shapeHandler(obj)
+        if handler is not None:
+            handler.draw()
+        result["build"] = time.perf_counter() - start
+
+        shape = obj.Shape
+        if shape.isNull():
+            result["error"] = "Invalid shape"
+            return result
+
+        start = time.perf_counter()
+        result["brep"] = shape.exportBrepToString()
+        result["serialize"] = time.perf_counter() - start
+        result["volume"] = shape.Volume
+    except Exception as ex:
+        # Report the failure in the manifest rather than stopping the sweep
+        result["error"] = str(ex)
+    return result
+
+def writeOutputs(brep, basename, formats):
+    """ Write the BREP string in each of the formats, returning the file names """
+    files = []
+    if FORMAT_BREP in formats:
+        with open(basename + ".brep", "w") as outputFile:
+            outputFile.write(brep)
+        files.append(basename + ".brep")
+
+    if FORMAT_STEP in formats or FORMAT_STL in formats:
+        shape = Part.Shape()
+        shape.importBrepFromString(brep)
+        if FORMAT_STEP in formats:
+            shape.exportStep(basename + ".step")
+            files.append(basename + ".step")
+        if FORMAT_STL in formats:
+            shape.exportStl(basename + ".stl")
+            files.append(basename + ".stl")
+
+    return [os.path.basename(name) for name in files]
+
+def processCount(processes=None):
+    """ The number of processes used to build the variants """
+    # Forked workers inherit the modules already loaded by FreeCADCmd, so they start in
+    # milliseconds. Without fork the variants are built in this process
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    return processes or os.cpu_count() or 1
+
+def buildVariants(tasks, processes=None):
+    """ Build the (index, feature, parameters) tasks, yielding the results as they complete """
+    count = processCount(processes)
+    if count == 1:
+        _initWorker()
+        try:
+            for task in tasks:
+                yield buildVariant(task)
+        finally:
+            FreeCAD.closeDocument(_document.Name)
+        return
+
+    pool = multiprocessing.get_context("fork").Pool(count, initializer=_initWorker)
+    try:
+        chunk = max(1, len(tasks) // (4 * count))
+        for result in pool.imap_unordered(buildVariant, tasks, chunk):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
+
+def sweep(feature, grid, outputDir, formats=(FORMAT_BREP,), processes=None):
+    """ Build every variant of the parameter grid for the component feature, writing the shapes
+        and a manifest of volumes and timings to the output directory. Returns the manifest """
+    if feature not in _proxies:
+        raise ValueError("Unsupported component '%s'" % feature)
+
+    os.makedirs(outputDir, exist_ok=True)
+    variants = gridVariants(grid)
+    tasks = [(index, feature, parameters) for index, parameters in enumerate(variants)]
+
+    start = time.perf_counter()
+    entries = [None] * len(tasks)
+    for result in buildVariants(tasks, processes):
+        index = result["index"]
+        files = []
+        if result["brep"] is not None:
+            files = writeOutputs(result["brep"], os.path.join(outputDir, "%s_%05d" % (feature, index)), formats)
+        entries[index] = {
+            "index" : index,
+            "parameters" : variants[index],
+            "volume" : result["volume"],
+            "build" : result["build"],
+            "serialize" : result["serialize"],
+            "files" : files,
+            "error" : result["error"]
+        }
+
+    manifest = {
+        "feature" : feature,
+        "grid" : grid,
+        "formats" : list(formats),
+        "processes" : processCount(processes),
+        "elapsed" : time.perf_counter() - start,
+        "variants" : entries
+    }
+    with open(os.path.join(outputDir, MANIFEST), "w") as manifestFile:
+        json.dump(manifest, manifestFile, indent=2)
+
+    return manifest
@@ -143,3 +143,23 @@ def getMaterialAnyType(connection, manufacturer, name):
             i += 1
 
     return rows[0]['material_index']
+
+def getMaterialDensity(connection, manufacturer, name, type=MATERIAL_TYPE_BULK):
+    """ Returns the density of the named material, preferring the manufacturer's own entry
+
+        Bulk densities are stored in kg/m^3 as imported from the component files, regardless
+        of the units column """
+    cursor = connection.cursor()
+
+    cursor.execute("""SELECT density FROM material WHERE material_name=:name COLLATE NOCASE AND type=:type
+                        ORDER BY manufacturer=:manufacturer DESC, material_index""", {
+                        "manufacturer" : manufacturer,
+                        "name" : name,
+                        "type" : type
+                    })
+
+    row = cursor.fetchone()
+    if row is None:
+        raise MaterialNotFoundError()
+
+    return row['density']
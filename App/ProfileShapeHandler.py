@@ -0,0 +1,100 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Base class for drawing components revolved from a meridian profile"""
+
+__title__ = "FreeCAD Profile Shape Handler"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import Part
+
+from DraftTools import translate
+
+from App.Geometry.Profile import SEGMENT_LINE, SEGMENT_SPLINE, SEGMENT_ARC, SEGMENT_ELLIPSE
+from App.Geometry.MassProperties import profileMassProperties
+from App.ShapeHandler import ShapeHandler, BoundedCache
+
+from App.Utilities import _err
+
+# Revolved shapes keyed by their profile. Components with identical profiles are given the same
+# underlying shape, so the triangulation OCC stores on it is only computed once
+SHAPE_CACHE_SIZE = 32
+_shapeCache = BoundedCache(SHAPE_CACHE_SIZE)
+
+def _vector(point):
+    return FreeCAD.Vector(point[0], point[1])
+
+def profileEdge(segment):
+    """ Convert an App.Geometry profile segment to an edge """
+    kind = segment[0]
+    if kind == SEGMENT_LINE:
+        return Part.LineSegment(_vector(segment[1]), _vector(segment[2])).toShape()
+    if kind == SEGMENT_SPLINE:
+        spline = Part.BSplineCurve()
+        spline.buildFromPoles([_vector(point) for point in segment[1]])
+        return spline.toShape()
+    if kind == SEGMENT_ARC:
+        return Part.Arc(_vector(segment[1]), _vector(segment[2]), _vector(segment[3])).toShape()
+    if kind == SEGMENT_ELLIPSE:
+        center, major, minor, first, last = segment[1:]
+        return Part.ArcOfEllipse(Part.Ellipse(_vector(center), major, minor), first, last).toShape()
+    raise ValueError("Unknown profile segment '%s'" % kind)
+
+def profileEdges(segments):
+    return [profileEdge(segment) for segment in segments]
+
+class ProfileShapeHandler(ShapeHandler):
+    """ The profile geometry is calculated by App.Geometry, this class only builds and revolves the edges """
+
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
+
+        self._profile = None
+
+    def isValidShape(self):
+        error = self._profile.validate()
+        if error is not None:
+            message, args = error
+            _err(translate('Rocket', message) % args)
+            return False
+        return True
+
+    def massProperties(self):
+        """ Mass properties per unit density calculated from the profile, or None if the shape is invalid """
+        if self._profile.validate() is not None:
+            return None
+        return profileMassProperties(self._profile.segments())
+
+    def build(self):
+        key = self._profile.key()
+        shape = _shapeCache.get(key)
+        if shape is None or self._debugShape:
+            edges = profileEdges(self._profile.segments())
+            if self._debugShape:
+                for edge in edges:
+                    Part.show(edge)
+            wire = Part.Wire(edges)
+            face = Part.Face(wire)
+            shape = face.revolve(FreeCAD.Vector(0, 0, 0),FreeCAD.Vector(1, 0, 0), 360)
+            _shapeCache.put(key, shape)
+
+        return shape
@@ -32,14 +32,13 @@ from App.Constants import RAIL_BUTTON_AIRFOIL
 from App.Constants import CONTERSINK_ANGLE_60, CONTERSINK_ANGLE_82, CONTERSINK_ANGLE_90, CONTERSINK_ANGLE_100, \
                             CONTERSINK_ANGLE_110, CONTERSINK_ANGLE_120
 
+from App.ShapeHandler import ShapeHandler
 from App.Utilities import _err
 from DraftTools import translate
 
-class RailButtonShapeHandler():
-    def __init__(self, obj):
-
-        # This gets changed when redrawn so it's very important to save a copy
-        self._placement = obj.Placement
+class RailButtonShapeHandler(ShapeHandler):
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
         self._railButtonType = obj.RailButtonType
 
@@ -58,8 +57,6 @@ class RailButtonShapeHandler():
         self._hasFillet = obj.FilletedTop
         self._filletRadius = float(obj.FilletRadius)
 
-        self._obj = obj
-
     def isValidShape(self):
         # Perform some general validations
         if self._outerDiameter <= 0:
@@ -84,6 +81,35 @@ class RailButtonShapeHandler():
             _err(translate('Rocket', "Top and base thickness can not excedd the total thickness"))
             return False
 
+        if self._hasFillet:
+            if self._filletRadius <= 0:
+                _err(translate('Rocket', "Fillet radius must be greater than zero"))
+                return False
+            if self._filletRadius >= self._topThickness:
+                _err(translate('Rocket', "Fillet radius must be less than the top thickness"))
+                return False
+
+        if self._hasFastener:
+            if self._shankDiameter <= 0:
+                _err(translate('Rocket', "Fastener shank diameter must be greater than zero"))
+                return False
+            if self._headDiameter <= self._shankDiameter:
+                _err(translate('Rocket', "Fastener head diameter must be greater than the shank diameter"))
+                return False
+            if self._railButtonType != RAIL_BUTTON_AIRFOIL:
+                if self._shankDiameter >= self._innerDiameter:
+                    _err(translate('Rocket', "Fastener shank diameter must be less than the inner diameter"))
+                    return False
+                if self._countersinkRadius(self._thickness - self._topThickness) >= (self._innerDiameter / 2.0):
+                    _err(translate('Rocket', "Fastener countersink extends outside the rail button"))
+                    return False
+                topRadius = self._outerDiameter / 2.0
+                if self._hasFillet:
+                    topRadius -= self._filletRadius
+                if self._headDiameter / 2.0 >= topRadius:
+                    _err(translate('Rocket', "Fastener head diameter must be less than the top of the rail button"))
+                    return False
+
         if self._railButtonType == RAIL_BUTTON_AIRFOIL:
             if self._length <= 0:
                 _err(translate('Rocket', "Length must be greater than zero for airfoil rail buttons"))
@@ -115,85 +141,121 @@ class RailButtonShapeHandler():
         
         return height
 
-    def _fastener(self):
-        fastener = Part.makeCone(self._headDiameter / 2.0, 0, self._fastenerCountersinkHeight(),
-                        FreeCAD.Vector(0,0,self._thickness),
-                        FreeCAD.Vector(0,0,-1))
-        shank = Part.makeCylinder(self._shankDiameter / 2.0, self._thickness)
+    def _countersinkRadius(self, z):
+        # Radius of the countersink cone at height z. The cone apex is below the head
+        height = self._fastenerCountersinkHeight()
+        headRadius = self._headDiameter / 2.0
+        return headRadius * (1.0 - (self._thickness - z) / height)
+
+    def _fastenerPoints(self):
+        # Fastener outline in the XZ plane, from the head down to the base
+        headRadius = self._headDiameter / 2.0
+        shankRadius = self._shankDiameter / 2.0
+        points = [FreeCAD.Vector(headRadius, 0, self._thickness)]
+
+        # Where the countersink meets the shank
+        z = self._thickness - self._fastenerCountersinkHeight() * (1.0 - shankRadius / headRadius)
+        if z > 0:
+            points.append(FreeCAD.Vector(shankRadius, 0, z))
+            points.append(FreeCAD.Vector(shankRadius, 0, 0))
+        else:
+            points.append(FreeCAD.Vector(self._countersinkRadius(0), 0, 0))
+        return points
+
+    def _revolve(self, edges):
+        face = Part.Face(Part.Wire(edges))
+        return face.revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)
+
+    def _lines(self, points):
+        edges = []
+        for i in range(len(points) - 1):
+            edges.append(Part.LineSegment(points[i], points[i + 1]).toShape())
+        return edges
 
-        fastener = fastener.fuse(shank)
-
-        return fastener
+    def _fastener(self):
+        points = [FreeCAD.Vector(0, 0, self._thickness)] + self._fastenerPoints() + [FreeCAD.Vector(0, 0, 0)]
+        points.append(points[0])
+        return self._revolve(self._lines(points))
 
     def _drawButton(self):
-        # For now, only round buttons
-        spool = Part.makeCylinder(self._innerDiameter / 2.0, self._thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(0,0,1))
+        # The button is a single revolved profile, including the fillet and the countersunk fastener hole
+        outerRadius = self._outerDiameter / 2.0
+        innerRadius = self._innerDiameter / 2.0
+        top = self._thickness - self._topThickness
+
+        if self._hasFastener and not self._draft:
+            inner = self._fastenerPoints()
+        else:
+            inner = [FreeCAD.Vector(0, 0, self._thickness), FreeCAD.Vector(0, 0, 0)]
+
+        points = [inner[-1],
+                  FreeCAD.Vector(outerRadius, 0, 0),
+                  FreeCAD.Vector(outerRadius, 0, self._baseThickness),
+                  FreeCAD.Vector(innerRadius, 0, self._baseThickness),
+                  FreeCAD.Vector(innerRadius, 0, top),
+                  FreeCAD.Vector(outerRadius, 0, top)]
 
-        spoolTop = Part.makeCylinder(self._outerDiameter / 2.0, self._topThickness, FreeCAD.Vector(0,0,self._thickness - self._topThickness), FreeCAD.Vector(0,0,1))
         if self._hasFillet:
-            spoolTop = spoolTop.makeFillet(self._filletRadius, [spoolTop.Edges[0]])
-        spool = spool.fuse(spoolTop)
-
-        # spoolBottom = Part.makeCylinder(self._outerDiameter / 2.0, self._thickness - self._topThickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
-        spoolBottom = Part.makeCylinder(self._outerDiameter / 2.0, self._baseThickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(0,0,1))
-        spool = spool.fuse(spoolBottom)
-
-        if self._hasFastener:
-            spool = spool.cut(self._fastener())
-
-        return spool
-
-    def _airfoil(self, base, thickness, diameter, length):
-        # Calculate the tangent points
+            radius = self._filletRadius
+            center = FreeCAD.Vector(outerRadius - radius, 0, self._thickness - radius)
+            start = FreeCAD.Vector(outerRadius, 0, self._thickness - radius)
+            end = FreeCAD.Vector(outerRadius - radius, 0, self._thickness)
+            middle = center + FreeCAD.Vector(radius * math.cos(math.pi / 4.0), 0, radius * math.sin(math.pi / 4.0))
+
+            points.append(start)
+            edges = self._lines(points)
+            edges.append(Part.Arc(start, middle, end).toShape())
+            points = [end]
+        else:
+            edges = []
+            points.append(FreeCAD.Vector(outerRadius, 0, self._thickness))
+
+        edges += self._lines(points + inner)
+
+        return self._revolve(edges)
+
+    def _airfoilFace(self, diameter, offset):
+        # Airfoil outline in the XY plane
         radius = diameter/2.0
-        theta = math.pi - math.atan2(length - radius, radius)
+        theta = math.pi - math.atan2(self._length - radius, radius)
         x = -(radius * math.cos(theta))
         y = radius * math.sin(theta)
 
-        v1 = FreeCAD.Vector(-x,y,base)
-        v2 = FreeCAD.Vector(-x,-y,base)
-        v3 = FreeCAD.Vector(radius,0,base)
-        v4 = FreeCAD.Vector(radius - length,0,base)
+        v1 = FreeCAD.Vector(offset - x,y,0)
+        v2 = FreeCAD.Vector(offset - x,-y,0)
+        v3 = FreeCAD.Vector(offset + radius,0,0)
+        v4 = FreeCAD.Vector(offset + radius - self._length,0,0)
 
         arc = Part.Arc(v1,v3,v2)
         line1 = Part.LineSegment(v1, v4)
         line2 = Part.LineSegment(v2, v4)
-        shape = Part.Shape([arc, line1, line2])
-        wire = Part.Wire(shape.Edges)
-        face = Part.Face(wire)
-        airfoil = face.extrude(FreeCAD.Vector(0, 0, thickness))
-
-        return airfoil
+        return Part.Face(Part.Wire([arc.toShape(), line1.toShape(), line2.toShape()]))
 
     def _drawAirfoil(self):
-        spool = self._airfoil(0.0, self._thickness, self._innerDiameter, self._length)
-        spool.translate(FreeCAD.Vector((self._outerDiameter - self._innerDiameter) / 2.0, 0, 0))
-        if self._hasFillet:
-            spool = spool.makeFillet(self._filletRadius, [spool.Edges[3], spool.Edges[6], spool.Edges[8]])
-
-        spoolTop = self._airfoil(self._thickness - self._topThickness, self._topThickness, self._outerDiameter, self._length)
+        # The outer airfoil is extruded once, then the groove and fastener removed in a single cut
+        spool = self._airfoilFace(self._outerDiameter, 0).extrude(FreeCAD.Vector(0, 0, self._thickness))
         if self._hasFillet:
-            spoolTop = spoolTop.makeFillet(self._filletRadius, [spoolTop.Edges[3], spoolTop.Edges[6], spoolTop.Edges[8]])
-        spool = spool.fuse(spoolTop)
-
-        spoolBottom = self._airfoil(0.0, self._baseThickness, self._outerDiameter, self._length)
-        spool = spool.fuse(spoolBottom)
-
-        if self._hasFastener:
-            spool = spool.cut(self._fastener())
-
-        return spool
+            edges = []
+            for edge in spool.Edges:
+                box = edge.BoundBox
+                if abs(box.ZMin - self._thickness) < 1e-7 and abs(box.ZMax - self._thickness) < 1e-7:
+                    edges.append(edge)
+            spool = spool.makeFillet(self._filletRadius, edges)
+
+        groove = self._airfoilFace(self._outerDiameter, 0).cut(
+                    self._airfoilFace(self._innerDiameter, (self._outerDiameter - self._innerDiameter) / 2.0))
+        groove.translate(FreeCAD.Vector(0, 0, self._baseThickness))
+        tools = [groove.extrude(FreeCAD.Vector(0, 0, self._thickness - self._topThickness - self._baseThickness))]
+
+        if self._hasFastener and not self._draft:
+            tools.append(self._fastener())
+
+        return spool.cut(tools)
         
-    def draw(self):
-        if not self.isValidShape():
-            return
-
-        try:
-            if self._railButtonType == RAIL_BUTTON_AIRFOIL:
-                self._obj.Shape = self._drawAirfoil()
-            else:
-                self._obj.Shape = self._drawButton()
-            self._obj.Placement = self._placement
-        except (ZeroDivisionError, Part.OCCError):
-            _err(translate('Rocket', "Rail button parameters produce an invalid shape"))
-            return
+    def _invalidShape(self):
+        _err(translate('Rocket', "Rail button parameters produce an invalid shape"))
+
+    def build(self):
+        if self._railButtonType == RAIL_BUTTON_AIRFOIL:
+            return self._drawAirfoil()
+        return self._drawButton()
@@ -30,16 +30,19 @@ import math
 
 from App.Constants import RAIL_GUIDE_BASE_CONFORMAL, RAIL_GUIDE_BASE_V
 
+from App.ShapeHandler import ShapeHandler, BoundedCache
 from App.Utilities import _err
 from DraftTools import translate
 
 TOLERANCE_OFFSET = 0.5     # Distance to offset a vertex
 
-class RailGuideShapeHandler():
-    def __init__(self, obj):
+# Guides are cached by their resolved parameters, so identical guides on an airframe are only built once
+GUIDE_CACHE_SIZE = 16
+_guideCache = BoundedCache(GUIDE_CACHE_SIZE)
 
-        # This gets changed when redrawn so it's very important to save a copy
-        self._placement = obj.Placement
+class RailGuideShapeHandler(ShapeHandler):
+    def __init__(self, obj, draft=False):
+        super().__init__(obj, draft)
 
         self._railGuideBaseType = obj.RailGuideBaseType
 
@@ -64,10 +67,6 @@ class RailGuideShapeHandler():
         self._notchWidth = float(obj.NotchWidth)
         self._notchDepth = float(obj.NotchDepth)
 
-        self._zMin = 0 # Used for rake
-
-        self._obj = obj
-
     def isValidShape(self):
         # Perform some general validations
         if self._middleWidth <= 0:
@@ -82,6 +81,16 @@ class RailGuideShapeHandler():
             _err(translate('Rocket', "Base width must be greater than the middle width"))
             return False
 
+        if self._railGuideBaseType == RAIL_GUIDE_BASE_CONFORMAL:
+            # The base follows the body tube, so it can't be wider than the tube
+            if self._diameter <= 0:
+                _err(translate('Rocket', "Diameter must be greater than zero for a conformal base"))
+                return False
+
+            if self._baseWidth >= self._diameter:
+                _err(translate('Rocket', "Base width must be less than the diameter for a conformal base"))
+                return False
+
         if self._topThickness <= 0:
             _err(translate('Rocket', "Top thickness must be greater than zero"))
             return False
@@ -127,78 +136,72 @@ class RailGuideShapeHandler():
 
         return True
 
-    def _drawBaseFlat(self):
-        base = Part.makeBox(self._length, self._baseWidth, self._baseThickness, FreeCAD.Vector(0,-self._baseWidth / 2.0,0), FreeCAD.Vector(0,0,1))
-        return base
-
-    def _drawBaseConformal(self):
-        # Calculate end points
-        radius = self._diameter / 2.0
-        theta = math.asin(self._baseWidth / (self._diameter))
-        a = math.cos(theta) * radius
-        z = -(radius - a)
-        y = self._baseWidth / 2.0
-
-        self._zMin = z
-
-        # draw end face
-        v1 = FreeCAD.Vector(0,-y, z)
-        v2 = FreeCAD.Vector(0,-y, z + self._baseThickness)
-        v3 = FreeCAD.Vector(0, y, z)
-        v4 = FreeCAD.Vector(0, y, z + self._baseThickness)
-        v5 = FreeCAD.Vector(0, 0, 0)
-        v6 = FreeCAD.Vector(0, 0, self._baseThickness)
-
-        arc1 = Part.Arc(v1,v5,v3)
-        arc2 = Part.Arc(v2,v6,v4)
-        line1 = Part.LineSegment(v1, v2)
-        line2 = Part.LineSegment(v3, v4)
-        shape = Part.Shape([arc1, line1, line2, arc2])
-        # Part.show(shape)
-        wire = Part.Wire(shape.Edges)
-        face = Part.Face(wire)
-        base = face.extrude(FreeCAD.Vector(self._length, 0, 0))
-
-        return base
-
-    def _drawBaseV(self):
-        # Calculate end points
-        theta = self._vAngle / 2.0
-        a = (self._baseWidth / 2.0) / math.fabs(math.tan(theta))
-        z = -a
-        y = self._baseWidth / 2.0
-
-        self._zMin = z
-
-        # draw end face
-        v1 = FreeCAD.Vector(0,-y, z)
-        v2 = FreeCAD.Vector(0,-y, z + self._baseThickness)
-        v3 = FreeCAD.Vector(0, y, z)
-        v4 = FreeCAD.Vector(0, y, z + self._baseThickness)
-        v5 = FreeCAD.Vector(0, 0, 0)
-        v6 = FreeCAD.Vector(0, 0, self._baseThickness)
-
-        line1 = Part.LineSegment(v1, v5)
-        line2 = Part.LineSegment(v5, v3)
-        line3 = Part.LineSegment(v3, v4)
-        line4 = Part.LineSegment(v4, v6)
-        line5 = Part.LineSegment(v6, v2)
-        line6 = Part.LineSegment(v1, v2)
-        shape = Part.Shape([line1, line2, line3, line4, line5, line6])
-        # Part.show(shape)
-        wire = Part.Wire(shape.Edges)
-        face = Part.Face(wire)
-        base = face.extrude(FreeCAD.Vector(self._length, 0, 0))
+    def _zMin(self):
+        # The lowest point of the base, used for rake
+        return self._baseZ(self._baseWidth / 2.0)
 
-        return base
-
-    def _drawBase(self):
+    def _baseZ(self, y):
+        # Height of the underside of the base at y
+        y = math.fabs(y)
         if self._railGuideBaseType == RAIL_GUIDE_BASE_CONFORMAL:
-            return self._drawBaseConformal()
+            radius = self._diameter / 2.0
+            return math.sqrt(radius * radius - y * y) - radius
         elif self._railGuideBaseType == RAIL_GUIDE_BASE_V:
-            return self._drawBaseV()
-        else:
-            return self._drawBaseFlat()
+            return -y / math.fabs(math.tan(self._vAngle / 2.0))
+        return 0.0
+
+    def _baseEdge(self, y1, y2, offset):
+        # The underside of the base between y1 and y2, raised by offset
+        v1 = FreeCAD.Vector(0, y1, self._baseZ(y1) + offset)
+        v2 = FreeCAD.Vector(0, y2, self._baseZ(y2) + offset)
+        if self._railGuideBaseType == RAIL_GUIDE_BASE_CONFORMAL:
+            y = (y1 + y2) / 2.0
+            return [Part.Arc(v1, FreeCAD.Vector(0, y, self._baseZ(y) + offset), v2).toShape()]
+        elif self._railGuideBaseType == RAIL_GUIDE_BASE_V and (y1 * y2) < 0:
+            # Goes through the point of the V
+            return self._polyline([v1, FreeCAD.Vector(0, 0, offset), v2])
+        return [Part.LineSegment(v1, v2).toShape()]
+
+    def _polyline(self, points):
+        edges = []
+        for i in range(len(points) - 1):
+            edges.append(Part.LineSegment(points[i], points[i + 1]).toShape())
+        return edges
+
+    def _drawCrossSection(self):
+        # The complete cross section in the YZ plane: base, web, top and notch. Essentially an I beam
+        base = self._baseWidth / 2.0
+        middle = self._middleWidth / 2.0
+        top = self._topWidth / 2.0
+        topZ = self._thickness - self._topThickness
+
+        edges = self._baseEdge(-base, base, 0.0)
+        edges += self._polyline([FreeCAD.Vector(0, base, self._baseZ(base)),
+                                 FreeCAD.Vector(0, base, self._baseZ(base) + self._baseThickness)])
+        edges += self._baseEdge(base, middle, self._baseThickness)
+
+        points = [FreeCAD.Vector(0, middle, self._baseZ(middle) + self._baseThickness),
+                  FreeCAD.Vector(0, middle, topZ),
+                  FreeCAD.Vector(0, top, topZ),
+                  FreeCAD.Vector(0, top, self._thickness)]
+        if self._notch:
+            notch = self._notchWidth / 2.0
+            notchZ = self._thickness - self._notchDepth
+            points += [FreeCAD.Vector(0, notch, self._thickness),
+                       FreeCAD.Vector(0, notch, notchZ),
+                       FreeCAD.Vector(0, -notch, notchZ),
+                       FreeCAD.Vector(0, -notch, self._thickness)]
+        points += [FreeCAD.Vector(0, -top, self._thickness),
+                   FreeCAD.Vector(0, -top, topZ),
+                   FreeCAD.Vector(0, -middle, topZ),
+                   FreeCAD.Vector(0, -middle, self._baseZ(middle) + self._baseThickness)]
+        edges += self._polyline(points)
+
+        edges += self._baseEdge(-middle, -base, self._baseThickness)
+        edges += self._polyline([FreeCAD.Vector(0, -base, self._baseZ(base) + self._baseThickness),
+                                 FreeCAD.Vector(0, -base, self._baseZ(base))])
+
+        return Part.Face(Part.Wire(edges))
 
     def rakeZ(self, x, slope, intercept):
         z = x * slope + intercept # In the (x,z) plane
@@ -206,9 +209,10 @@ class RailGuideShapeHandler():
 
     def _drawForwardSweep(self):
         # We need to calculate our vertices outside of the part to avoid OpenCASCADE's "too exact" problem
+        zMin = self._zMin()
         o = self._thickness * math.tan(self._forwardSweepAngle)
         slope = -self._thickness / o
-        intercept = self._zMin - (slope * self._length)
+        intercept = zMin - (slope * self._length)
 
         y = max(self._topWidth, self._middleWidth, self._baseWidth) / 2.0 + TOLERANCE_OFFSET
 
@@ -217,7 +221,7 @@ class RailGuideShapeHandler():
         v1 = FreeCAD.Vector(x1, y, z1)
 
         # x2 = self._length - (o + TOLERANCE_OFFSET)
-        x2 = self._length - (((self._thickness + math.fabs(self._zMin)) * math.tan(self._forwardSweepAngle)) + TOLERANCE_OFFSET)
+        x2 = self._length - (((self._thickness + math.fabs(zMin)) * math.tan(self._forwardSweepAngle)) + TOLERANCE_OFFSET)
         z2 = self.rakeZ(x2, slope, intercept)        
         v2 = FreeCAD.Vector(x2, y, z2)
 
@@ -236,18 +240,19 @@ class RailGuideShapeHandler():
 
     def _drawAftSweep(self):
         # We need to calculate our vertices outside of the part to avoid OpenCASCADE's "too exact" problem
+        zMin = self._zMin()
         o = self._thickness * math.tan(self._aftSweepAngle)
         slope = self._thickness / o
 
         y = max(self._topWidth, self._middleWidth, self._baseWidth) / 2.0 + TOLERANCE_OFFSET
 
         x1 = -TOLERANCE_OFFSET
-        z1 = self.rakeZ(x1, slope, self._zMin)        
+        z1 = self.rakeZ(x1, slope, zMin)        
         v1 = FreeCAD.Vector(x1, y, z1)
 
         # x2 = o + TOLERANCE_OFFSET
-        x2 = ((self._thickness + math.fabs(self._zMin)) * math.tan(self._aftSweepAngle)) + TOLERANCE_OFFSET
-        z2 = self.rakeZ(x2, slope, self._zMin)        
+        x2 = ((self._thickness + math.fabs(zMin)) * math.tan(self._aftSweepAngle)) + TOLERANCE_OFFSET
+        z2 = self.rakeZ(x2, slope, zMin)        
         v2 = FreeCAD.Vector(x2, y, z2)
 
         v3 = FreeCAD.Vector(x1, y, z2)
@@ -263,38 +268,43 @@ class RailGuideShapeHandler():
 
         return rake
 
-    def _drawNotch(self):
-        return Part.makeBox(self._length, self._notchWidth, self._notchDepth, FreeCAD.Vector(0,-self._notchWidth / 2.0, self._thickness - self._notchDepth), FreeCAD.Vector(0,0,1))
+    def _shapeKey(self):
+        key = (self._railGuideBaseType, self._topWidth, self._middleWidth, self._baseWidth, self._topThickness,
+               self._baseThickness, self._thickness, self._length)
+        if self._railGuideBaseType == RAIL_GUIDE_BASE_CONFORMAL:
+            key += (self._diameter,)
+        elif self._railGuideBaseType == RAIL_GUIDE_BASE_V:
+            key += (self._vAngle,)
+        if self._forwardSweep:
+            key += ('forward', self._forwardSweepAngle)
+        if self._aftSweep:
+            key += ('aft', self._aftSweepAngle)
+        if self._notch:
+            key += ('notch', self._notchWidth, self._notchDepth)
+        return key
 
     def _drawGuide(self):
-        # Essentially creating an I beam
-        guide = Part.makeBox(self._length, self._middleWidth, self._thickness, FreeCAD.Vector(0,-self._middleWidth / 2.0,0), FreeCAD.Vector(0,0,1))
-
-        guideTop = Part.makeBox(self._length, self._topWidth, self._topThickness, FreeCAD.Vector(0,-self._topWidth / 2.0,self._thickness - self._topThickness), FreeCAD.Vector(0,0,1))
-        guide = guide.fuse(guideTop)
+        key = self._shapeKey()
+        guide = _guideCache.get(key)
+        if guide is not None:
+            return guide
 
-        guideBottom = self._drawBase()
-        guide = guide.fuse(guideBottom)
+        guide = self._drawCrossSection().extrude(FreeCAD.Vector(self._length, 0, 0))
 
+        rakes = []
         if self._forwardSweep:
-            rake = self._drawForwardSweep()
-            guide = guide.cut(rake)
+            rakes.append(self._drawForwardSweep())
         if self._aftSweep:
-            rake = self._drawAftSweep()
-            guide = guide.cut(rake)
-        if self._notch:
-            notch = self._drawNotch()
-            guide = guide.cut(notch)
+            rakes.append(self._drawAftSweep())
+        if len(rakes) > 0:
+            guide = guide.cut(rakes)
+
+        _guideCache.put(key, guide)
 
         return guide
         
-    def draw(self):
-        if not self.isValidShape():
-            return
-
-        try:
-            self._obj.Shape = self._drawGuide()
-            self._obj.Placement = self._placement
-        except (ZeroDivisionError, Part.OCCError):
-            _err(translate('Rocket', "Rail Guide parameters produce an invalid shape"))
-            return
+    def _invalidShape(self):
+        _err(translate('Rocket', "Rail Guide parameters produce an invalid shape"))
+
+    def build(self):
+        return self._drawGuide()
@@ -0,0 +1,72 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Reposition components along the rocket axis"""
+
+__title__ = "FreeCAD Rocket Restack"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import time
+
+from App.ShapeComponent import ShapeComponent
+
+from DraftTools import translate
+
+def _isComponent(obj):
+    return isinstance(getattr(obj, 'Proxy', None), ShapeComponent)
+
+def restack(objects, start=None):
+    """ Place the components end to end along the rocket axis in the order given, front to back.
+        The nose points towards +x, so the front of the first component is at start and each
+        following component is placed behind the one before it, towards -x. Without a start, the
+        first component stays where it is. Only the placements
+        change so no shapes are rebuilt, and the whole operation is a single undo step with one
+        recompute. Returns the position of the back of the last component """
+    components = [obj for obj in objects if _isComponent(obj)]
+    if len(components) == 0:
+        return start
+
+    if start is None:
+        first = components[0]
+        start = first.Placement.Base.x + float(first.Proxy.getAxialLength())
+
+    begin = time.perf_counter()
+    doc = components[0].Document
+    doc.openTransaction(translate('Rocket', "Restack components"))
+    try:
+        position = float(start)
+        for obj in components:
+            # Components are drawn from their origin towards +x
+            length = float(obj.Proxy.getAxialLength())
+            placement = FreeCAD.Placement(obj.Placement)
+            if placement.Base.x != position - length:
+                placement.Base.x = position - length
+                obj.Placement = placement
+            position -= length
+        doc.recompute()
+    except Exception:
+        doc.abortTransaction()
+        raise
+    doc.commitTransaction()
+
+    FreeCAD.Console.PrintLog("Restacked %d components in %.1f ms\n" % (len(components), (time.perf_counter() - begin) * 1000.0))
+    return position
@@ -32,6 +32,8 @@ from DraftTools import translate
 
 class ShapeBodyTube(ShapeComponent):
 
+    _geometryProperties = ['InnerDiameter', 'OuterDiameter', 'Length']
+
     def __init__(self, obj):
         super().__init__(obj)
 
@@ -46,7 +48,17 @@ class ShapeBodyTube(ShapeComponent):
         if not hasattr(obj,"Shape"):
             obj.addProperty('Part::PropertyPartShape', 'Shape', 'BodyTube', translate('App::Property', 'Shape of the body tube'))
 
-    def execute(self, obj):
-        shape = BodyTubeShapeHandler(obj)
-        if shape is not None:
-            shape.draw()
+        self._addMassProperties(obj)
+
+    def _restoreProperties(self, obj):
+        self._addMassProperties(obj)
+
+    def _massProperties(self, obj):
+        return BodyTubeShapeHandler(obj).massProperties()
+
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return self._obj.Length
+
+    def shapeHandler(self, obj, draft=False):
+        return BodyTubeShapeHandler(obj, draft)
@@ -32,6 +32,9 @@ from DraftTools import translate
 
 class ShapeBulkhead(ShapeComponent):
 
+    _geometryProperties = ['Diameter', 'Thickness', 'Step', 'StepDiameter', 'StepThickness',
+                           'Holes', 'HoleDiameter', 'HoleCenter', 'HoleCount', 'HoleOffset']
+
     def __init__(self, obj):
         super().__init__(obj)
 
@@ -61,7 +64,19 @@ class ShapeBulkhead(ShapeComponent):
         if not hasattr(obj,"Shape"):
             obj.addProperty('Part::PropertyPartShape', 'Shape', 'Bulkhead', translate('App::Property', 'Shape of the bulkhead'))
 
-    def execute(self, obj):
-        shape = BulkheadShapeHandler(obj)
-        if shape is not None:
-            shape.draw()
+        self._addMassProperties(obj)
+
+    def _restoreProperties(self, obj):
+        self._addMassProperties(obj)
+
+    def _massProperties(self, obj):
+        return BulkheadShapeHandler(obj).massProperties()
+
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        if self._obj.Step:
+            return self._obj.Thickness + self._obj.StepThickness
+        return self._obj.Thickness
+
+    def shapeHandler(self, obj, draft=False):
+        return BulkheadShapeHandler(obj, draft)
@@ -0,0 +1,169 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Shapes saved to disk so they're shared between sessions"""
+
+__title__ = "FreeCAD Shape Cache"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+
+import FreeCAD
+import Part
+
+# Default size limit in MB. Configurable in the Rocket workbench parameters as ShapeCacheSize,
+# with 0 disabling the cache
+SHAPE_CACHE_SIZE = 256
+
+# Eviction removes entries until the cache is this fraction of its size limit
+_EVICTION_TARGET = 0.9
+
+_PARAMETER_PATH = "User parameter:BaseApp/Preferences/Mod/Rocket"
+
+class ShapeCache():
+    """ BREP files stored as <directory>/<handler class>/<geometry hash>.brep. The least recently
+        used files are removed when the cache grows past its size limit. Files are written under a
+        temporary name and renamed, so other sessions never read a partial file """
+
+    def __init__(self, directory, maxSize):
+        self._directory = directory
+        self._maxSize = maxSize
+        self._size = None # Calculated when first needed
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _path(self, handlerClass, geometry):
+        return os.path.join(self._directory, handlerClass, geometry + ".brep")
+
+    def _entries(self):
+        entries = []
+        if os.path.isdir(self._directory):
+            for folder in os.scandir(self._directory):
+                if folder.is_dir():
+                    for entry in os.scandir(folder.path):
+                        if entry.name.endswith(".brep"):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def size(self):
+        if self._size is None:
+            self._size = sum([size for mtime, size, path in self._entries()])
+        return self._size
+
+    def get(self, handlerClass, geometry):
+        """ Returns the cached shape, or None """
+        path = self._path(handlerClass, geometry)
+        if not os.path.isfile(path):
+            self.misses += 1
+            return None
+
+        try:
+            shape = Part.Shape()
+            shape.importBrep(path)
+            os.utime(path) # The modification time orders the entries for eviction
+        except (OSError, Part.OCCError):
+            self.misses += 1
+            return None
+
+        if shape.isNull():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return shape
+
+    def _fileSize(self, path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def put(self, handlerClass, geometry, shape):
+        path = self._path(handlerClass, geometry)
+        folder = os.path.dirname(path)
+        temporary = None
+        try:
+            os.makedirs(folder, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=folder)
+            os.close(handle)
+            shape.exportBrep(temporary)
+
+            # Sizes before the entry is written, so it's only counted once. Temporary files aren't
+            # counted. An existing entry is replaced, so only the difference is added
+            size = self.size()
+            previous = self._fileSize(path)
+            os.replace(temporary, path)
+        except (OSError, Part.OCCError) as ex:
+            FreeCAD.Console.PrintLog("Unable to cache shape '%s': %s\n" % (path, str(ex)))
+            if temporary is not None and os.path.exists(temporary):
+                os.remove(temporary)
+            return
+
+        self.writes += 1
+        self._size = size + self._fileSize(path) - previous
+        if self._size > self._maxSize:
+            self.evict()
+
+    def evict(self):
+        # Other sessions may share the cache, so the sizes are read again from the disk
+        entries = self._entries()
+        entries.sort()
+        size = sum([size for mtime, size, path in entries])
+        target = self._maxSize * _EVICTION_TARGET
+        for mtime, entrySize, path in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                size -= entrySize
+                self.evictions += 1
+            except OSError:
+                pass
+        self._size = size
+
+    def statistics(self):
+        return {
+            "hits" : self.hits,
+            "misses" : self.misses,
+            "writes" : self.writes,
+            "evictions" : self.evictions,
+            "size" : self.size()
+        }
+
+_cache = None
+
+def getShapeCache():
+    """ Returns the shared cache, or None if it's disabled """
+    global _cache
+
+    maxSize = FreeCAD.ParamGet(_PARAMETER_PATH).GetInt("ShapeCacheSize", SHAPE_CACHE_SIZE) * 1024 * 1024
+    if maxSize <= 0:
+        return None
+
+    if _cache is None:
+        _cache = ShapeCache(os.path.join(FreeCAD.getUserAppDataDir(), "Mod", "Rocket", "ShapeCache"), maxSize)
+    _cache._maxSize = maxSize
+    return _cache
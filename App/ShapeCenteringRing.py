@@ -35,6 +35,8 @@ from DraftTools import translate
 #
 class ShapeCenteringRing(ShapeBulkhead):
 
+    _geometryProperties = ShapeBulkhead._geometryProperties + ['CenterDiameter', 'Notched', 'NotchWidth', 'NotchHeight']
+
     def __init__(self, obj):
         super().__init__(obj)
 
@@ -55,7 +57,10 @@ class ShapeCenteringRing(ShapeBulkhead):
         obj.HoleDiameter = 2.0
         obj.HoleCenter = 7.0
 
-    def execute(self, obj):
-        shape = CenteringRingShapeHandler(obj)
-        if shape is not None:
-            shape.draw()
+        self._addMassProperties(obj)
+
+    def _massProperties(self, obj):
+        return CenteringRingShapeHandler(obj).massProperties()
+
+    def shapeHandler(self, obj, draft=False):
+        return CenteringRingShapeHandler(obj, draft)
@@ -24,12 +24,101 @@ __title__ = "FreeCAD Rocket Components"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
+import FreeCAD
+import hashlib
+import os
+import time
+
+from App.Constants import PROP_READONLY, PROP_OUTPUT, PROP_HIDDEN
+from App.Geometry.MassProperties import MassProperties
+from App.ShapeCache import getShapeCache
 from App.Utilities import _err
 
 from DraftTools import translate
 
+# Properties calculated from the component parameters
+MASS_PROPERTIES = ['Volume', 'CenterOfMass', 'AxialInertia', 'TransverseInertia']
+
+# Changing these properties doesn't change the mass properties
+_MASS_INDEPENDENT = ['Shape', 'Placement', 'Label', 'Label2', 'Visibility', 'Proxy', 'ExpressionEngine',
+                     'Manufacturer', 'PartNumber', 'Description', 'Material', 'ManufacturerMass', 'GeometryHash']
+
+# Shapes built, read from the shape cache, rebuilds skipped because the geometry was unchanged, and
+# components moved without rebuilding, for all components
+_rebuilds = {'built' : 0, 'cached' : 0, 'skipped' : 0, 'moved' : 0}
+
+def rebuildStatistics():
+    return dict(_rebuilds)
+
+def _fileHash(filename):
+    # Hash of the file contents, or None if it can't be read
+    try:
+        with open(filename, "rb") as geometryFile:
+            return hashlib.sha1(geometryFile.read()).hexdigest()
+    except OSError:
+        return None
+
+# Objects from older documents waiting to be migrated, by document name. They're migrated together
+# once the document has been restored
+_migrations = {}
+_observer = None
+
+def _applyMigrations(doc):
+    pending = _migrations.pop(doc.Name, [])
+    if len(pending) == 0:
+        return
+
+    frozen = doc.RecomputesFrozen
+    doc.RecomputesFrozen = True
+    try:
+        for obj in pending:
+            start = time.perf_counter()
+            obj.Proxy._migrate(obj)
+            obj.Proxy._restoreProperties(obj)
+            FreeCAD.Console.PrintLog("Migrated %s in %.1f ms\n" % (obj.Label, (time.perf_counter() - start) * 1000.0))
+    finally:
+        doc.RecomputesFrozen = frozen
+
+class _MigrationObserver:
+
+    def slotFinishRestoreDocument(self, doc):
+        _applyMigrations(doc)
+
+    def slotBeforeRecomputeDocument(self, doc):
+        # In case the document was restored without notifying the observer
+        _applyMigrations(doc)
+
+    def slotDeletedDocument(self, doc):
+        _migrations.pop(doc.Name, None)
+
+def _queueMigration(obj):
+    global _observer
+
+    if _observer is None:
+        _observer = _MigrationObserver()
+        FreeCAD.addDocumentObserver(_observer)
+
+    _migrations.setdefault(obj.Document.Name, []).append(obj)
+
 class ShapeComponent:
 
+    # Properties that change the generated shape, declared by each component
+    _geometryProperties = []
+
+    # Increase when a handler draws a different shape from the same parameters, so that shapes
+    # saved by earlier versions are rebuilt
+    _handlerVersion = 1
+
+    # Hash of the geometry properties, cleared whenever one of them changes, and the state of
+    # any files it was calculated from
+    _geometryHash = None
+    _geometryFiles = None
+
+    # The geometry, shape, and placement of the last build
+    _builtGeometry = None
+    _builtShape = None
+    _builtPlacement = None
+
     def __init__(self, obj):
         if not hasattr(obj, 'Manufacturer'):
             obj.addProperty('App::PropertyString', 'Manufacturer', 'RocketComponent', translate('App::Property', 'Component manufacturer')).Manufacturer = ""
@@ -39,6 +128,9 @@ class ShapeComponent:
             obj.addProperty('App::PropertyString', 'Description', 'RocketComponent', translate('App::Property', 'Component description')).Description = ""
         if not hasattr(obj, 'Material'):
             obj.addProperty('App::PropertyString', 'Material', 'RocketComponent', translate('App::Property', 'Component material')).Material = ""
+        if not hasattr(obj, 'ManufacturerMass'):
+            obj.addProperty('App::PropertyFloat', 'ManufacturerMass', 'RocketComponent', translate('App::Property', 'Component mass from the manufacturer (kg), or 0 to calculate it from the material')).ManufacturerMass = 0.0
+        self._addGeometryHash(obj)
 
         self._obj = obj
         obj.Proxy=self
@@ -52,6 +144,196 @@ class ShapeComponent:
             self.version = state
 
 
+    def _addGeometryHash(self, obj):
+        if not hasattr(obj, 'GeometryHash'):
+            obj.addProperty('App::PropertyString', 'GeometryHash', 'RocketComponent', translate('App::Property', 'Hash of the parameters the saved shape was built from'), PROP_HIDDEN | PROP_OUTPUT).GeometryHash = ""
+
+    # Components with properties added after the first release override this
+    def _restoreProperties(self, obj):
+        pass
+
+    # Components that can read documents from earlier versions override these
+    def _needsMigration(self, obj):
+        return False
+
+    def _migrate(self, obj):
+        pass
+
+    def onDocumentRestored(self, obj):
+        start = time.perf_counter()
+        self._obj = obj
+        self._addGeometryHash(obj)
+        if self._needsMigration(obj):
+            _queueMigration(obj)
+            status = "migration pending"
+        else:
+            self._restoreProperties(obj)
+            if self._restoreShape(obj):
+                status = "saved shape"
+            else:
+                status = "rebuild required"
+        FreeCAD.Console.PrintLog("Restored %s in %.1f ms, %s\n" % (obj.Label, (time.perf_counter() - start) * 1000.0, status))
+
+    def _restoreShape(self, obj):
+        # Trust the saved shape when it was built from the current parameters
+        geometry = self.geometryHash(obj)
+        if obj.GeometryHash != geometry or obj.Shape.isNull():
+            return False
+
+        self._builtGeometry = (geometry, self._linkedShapes(obj))
+        self._builtShape = obj.Shape
+        self._builtPlacement = FreeCAD.Placement(obj.Placement)
+        return True
+
+    def _addMassProperties(self, obj):
+        if not hasattr(obj, 'Volume'):
+            obj.addProperty('App::PropertyVolume', 'Volume', 'MassProperties', translate('App::Property', 'Volume of the component'), PROP_READONLY | PROP_OUTPUT)
+        if not hasattr(obj, 'CenterOfMass'):
+            obj.addProperty('App::PropertyVector', 'CenterOfMass', 'MassProperties', translate('App::Property', 'Center of mass relative to the component placement'), PROP_READONLY | PROP_OUTPUT)
+        if not hasattr(obj, 'AxialInertia'):
+            obj.addProperty('App::PropertyFloat', 'AxialInertia', 'MassProperties', translate('App::Property', 'Moment of inertia about the rocket axis through the center of mass, per unit density (mm^5)'), PROP_READONLY | PROP_OUTPUT)
+        if not hasattr(obj, 'TransverseInertia'):
+            obj.addProperty('App::PropertyFloat', 'TransverseInertia', 'MassProperties', translate('App::Property', 'Moment of inertia about a transverse axis through the center of mass, per unit density (mm^5)'), PROP_READONLY | PROP_OUTPUT)
+
+        self._updateMassProperties(obj)
+
+    # Components that can calculate their mass properties without drawing the shape override this
+    def _massProperties(self, obj):
+        return None
+
+    def _updateMassProperties(self, obj):
+        # Not all of the properties exist while the object is being created
+        for prop in self._geometryProperties:
+            if not hasattr(obj, prop):
+                return
+
+        try:
+            properties = self._massProperties(obj)
+        except (ValueError, ZeroDivisionError):
+            # Parameters that don't describe a shape have no mass properties
+            return
+
+        if properties is None:
+            properties = MassProperties()
+        obj.Volume = properties.volume
+        obj.CenterOfMass = FreeCAD.Vector(*[float(value) for value in properties.center])
+        obj.AxialInertia = float(properties.axialInertia)
+        obj.TransverseInertia = float(properties.transverseInertia)
+
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return 0.0
+
+    def _geometryFileStates(self, obj):
+        # Files such as airfoil coordinates can be edited without any property changing, so their
+        # modification time and size are checked each time
+        states = {}
+        for prop in self._geometryProperties:
+            if hasattr(obj, prop) and obj.getTypeIdOfProperty(prop) == 'App::PropertyFile':
+                try:
+                    info = os.stat(getattr(obj, prop))
+                    states[prop] = (info.st_mtime_ns, info.st_size)
+                except OSError:
+                    states[prop] = None
+        return states
+
+    def geometryHash(self, obj):
+        """ A hash of the properties that determine the shape, including the contents of any
+            files they name """
+        files = self._geometryFileStates(obj)
+        if self._geometryHash is None or files != self._geometryFiles:
+            values = [self.__class__.__name__, self._handlerVersion]
+            for prop in self._geometryProperties:
+                value = getattr(obj, prop, None)
+                if prop in files:
+                    value = (value, _fileHash(value))
+                elif hasattr(value, 'isDerivedFrom') and value.isDerivedFrom('App::DocumentObject'):
+                    value = value.Name
+                elif hasattr(value, 'Value'):
+                    value = value.Value
+                values.append((prop, value))
+            self._geometryHash = hashlib.sha1(repr(values).encode()).hexdigest()
+            self._geometryFiles = files
+        return self._geometryHash
+
+    def _linkedShapes(self, obj):
+        # Linked objects such as a fin profile sketch are recomputed without this object changing
+        shapes = []
+        for prop in self._geometryProperties:
+            value = getattr(obj, prop, None)
+            if hasattr(value, 'isDerivedFrom') and value.isDerivedFrom('App::DocumentObject') and hasattr(value, 'Shape'):
+                shapes.append(value.Shape)
+        return shapes
+
+    def _isBuilt(self, obj, geometry, linked):
+        # The current shape was built from this geometry, and isn't a draft preview
+        if self._builtGeometry is None or obj.Shape.isNull():
+            return False
+        builtGeometry, builtLinked = self._builtGeometry
+        if geometry != builtGeometry or len(linked) != len(builtLinked):
+            return False
+        for shape, built in zip(linked, builtLinked):
+            if not shape.isPartner(built):
+                return False
+        return obj.Shape.isPartner(self._builtShape)
+
+    def onChanged(self, obj, prop):
+        if prop in self._geometryProperties:
+            self._geometryHash = None
+
+        # The mass properties are calculated from the profile, so they stay current without a recompute
+        if prop in MASS_PROPERTIES or prop in _MASS_INDEPENDENT:
+            return
+        if hasattr(obj, 'TransverseInertia') and 'Restore' not in obj.State:
+            self._updateMassProperties(obj)
+
     # This will be implemented in the derived class
+    def shapeHandler(self, obj, draft=False):
+        """ Returns the handler that draws the shape from the current parameters, or a draft
+            quality preview of it """
+        _err("No shape handler defined for %s" % (self.__class__.__name__))
+        return None
+
+    def _draw(self, obj, handler, cacheable):
+        # Shapes built from linked objects can't be identified by their parameters, so aren't cached
+        cache = getShapeCache() if cacheable else None
+        if cache is not None:
+            shape = cache.get(handler.__class__.__name__, self.geometryHash(obj))
+            if shape is not None:
+                handler.assign(shape)
+                _rebuilds['cached'] += 1
+                return True
+
+        _rebuilds['built'] += 1
+        if not handler.draw():
+            return False
+
+        if cache is not None:
+            shape = obj.Shape.copy()
+            shape.Placement = FreeCAD.Placement()
+            cache.put(handler.__class__.__name__, self.geometryHash(obj), shape)
+        return True
+
     def execute(self, obj):
-        _err("No execute method defined for %s" % (self.__class__.__name__))
+        linked = self._linkedShapes(obj)
+        if self._isBuilt(obj, self.geometryHash(obj), linked):
+            # Only the placement changed. The shape follows the placement, so there's nothing to draw
+            if self._builtPlacement is not None and obj.Placement != self._builtPlacement:
+                self._builtPlacement = FreeCAD.Placement(obj.Placement)
+                _rebuilds['moved'] += 1
+            else:
+                _rebuilds['skipped'] += 1
+            return
+
+        handler = self.shapeHandler(obj)
+        if handler is None or not self._draw(obj, handler, len(linked) == 0):
+            self._builtGeometry = None
+            return
+
+        # The handler may have adjusted the parameters
+        geometry = self.geometryHash(obj)
+        self._builtGeometry = (geometry, linked)
+        self._builtShape = obj.Shape
+        self._builtPlacement = FreeCAD.Placement(obj.Placement)
+        if hasattr(obj, 'GeometryHash') and obj.GeometryHash != geometry:
+            obj.GeometryHash = geometry
@@ -25,29 +25,34 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
 from App.ShapeComponent import ShapeComponent
+from App.ShapeHandlerRegistry import ShapeHandlerRegistry
 
 from App.Constants import FIN_TYPE_TRAPEZOID, FIN_TYPE_ELLIPSE, FIN_TYPE_SKETCH
 from App.Constants import FIN_CROSS_SAME, FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, \
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE
 
-from App.FinTrapezoidShapeHandler import FinTrapezoidShapeHandler
-from App.FinEllipseShapeHandler import FinEllipseShapeHandler
-from App.FinSketchShapeHandler import FinSketchShapeHandler
-
 from DraftTools import translate
 
+# Handlers are imported when a fin of that type is first drawn. The registration order is the
+# order of the FinType choices
+finHandlers = ShapeHandlerRegistry()
+finHandlers.register(FIN_TYPE_TRAPEZOID, "App.FinTrapezoidShapeHandler.FinTrapezoidShapeHandler")
+finHandlers.register(FIN_TYPE_ELLIPSE, "App.FinEllipseShapeHandler.FinEllipseShapeHandler")
+finHandlers.register(FIN_TYPE_SKETCH, "App.FinSketchShapeHandler.FinSketchShapeHandler")
+
 class ShapeFin(ShapeComponent):
 
+    _geometryProperties = ['FinType', 'RootCrossSection', 'RootChord', 'RootThickness', 'RootPerCent',
+                           'RootLength1', 'RootLength2', 'TipCrossSection', 'TipChord', 'TipThickness', 'TipPerCent',
+                           'TipLength1', 'TipLength2', 'Height', 'SweepLength', 'SweepAngle', 'Ttw', 'TtwOffset',
+                           'TtwLength', 'TtwHeight', 'TtwThickness', 'Profile', 'AirfoilFile']
+
     def __init__(self, obj):
         super().__init__(obj)
 
         if not hasattr(obj,"FinType"):
             obj.addProperty('App::PropertyEnumeration', 'FinType', 'Fin', translate('App::Property', 'Fin type'))
-        obj.FinType = [FIN_TYPE_TRAPEZOID, 
-                FIN_TYPE_ELLIPSE, 
-                # FIN_TYPE_TUBE, 
-                FIN_TYPE_SKETCH
-                ]
+        obj.FinType = finHandlers.types()
         obj.FinType = FIN_TYPE_TRAPEZOID
 
         if not hasattr(obj,"RootCrossSection"):
@@ -104,20 +109,27 @@ class ShapeFin(ShapeComponent):
         if not hasattr(obj,"TtwThickness"):
             obj.addProperty('App::PropertyLength', 'TtwThickness', 'Fin', translate('App::Property', 'TTW thickness')).TtwThickness = 1.0
 
+        self._addAirfoilProperties(obj)
+
         if not hasattr(obj, "Profile"):
             obj.addProperty('App::PropertyLink', 'Profile', 'Fin', translate('App::Property', 'Custom fin sketch')).Profile = None
 
         if not hasattr(obj,"Shape"):
             obj.addProperty('Part::PropertyPartShape', 'Shape', 'Fin', translate('App::Property', 'Shape of the fin'))
 
-    def execute(self, obj):
+    def _addAirfoilProperties(self, obj):
+        if not hasattr(obj, "AirfoilFile"):
+            obj.addProperty('App::PropertyFile', 'AirfoilFile', 'Fin', translate('App::Property', 'Airfoil coordinate file in Selig or Lednicer format, used by airfoil cross sections')).AirfoilFile = ""
+
+    def _restoreProperties(self, obj):
+        self._addAirfoilProperties(obj)
+
+    def _finShapeHandler(self, obj, draft=False):
+        return finHandlers.handler(obj.FinType, obj, draft)
 
-        if obj.FinType == FIN_TYPE_TRAPEZOID:
-            shape = FinTrapezoidShapeHandler(obj)
-        elif obj.FinType == FIN_TYPE_ELLIPSE:
-            shape = FinEllipseShapeHandler(obj)
-        elif obj.FinType == FIN_TYPE_SKETCH:
-            shape = FinSketchShapeHandler(obj)
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return self._obj.RootChord
 
-        if shape is not None:
-            shape.draw()
+    def shapeHandler(self, obj, draft=False):
+        return self._finShapeHandler(obj, draft)
@@ -0,0 +1,65 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for drawing fin cans"""
+
+__title__ = "FreeCAD Fin Cans"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+from App.ShapeFin import ShapeFin
+from App.Constants import FEATURE_FIN_CAN
+
+from App.FinCanShapeHandler import FinCanShapeHandler
+
+from DraftTools import translate
+
+class ShapeFinCan(ShapeFin):
+
+    _geometryProperties = ShapeFin._geometryProperties + ['FinCount', 'InnerDiameter', 'OuterDiameter', 'Length',
+                                                          'LeadingEdgeOffset']
+
+    def __init__(self, obj):
+        super().__init__(obj)
+        self.Type = FEATURE_FIN_CAN
+
+        # Default set to fit a BT-50
+        if not hasattr(obj,"FinCount"):
+            obj.addProperty('App::PropertyInteger', 'FinCount', 'FinCan', translate('App::Property', 'Number of fins')).FinCount = 3
+        if not hasattr(obj,"InnerDiameter"):
+            obj.addProperty('App::PropertyLength', 'InnerDiameter', 'FinCan', translate('App::Property', 'Diameter of the inside of the fin can')).InnerDiameter = 24.8
+        if not hasattr(obj,"OuterDiameter"):
+            obj.addProperty('App::PropertyLength', 'OuterDiameter', 'FinCan', translate('App::Property', 'Diameter of the outside of the fin can')).OuterDiameter = 27.8
+        if not hasattr(obj,"Length"):
+            obj.addProperty('App::PropertyLength', 'Length', 'FinCan', translate('App::Property', 'Length of the fin can')).Length = 76.2
+        if not hasattr(obj,"LeadingEdgeOffset"):
+            obj.addProperty('App::PropertyLength', 'LeadingEdgeOffset', 'FinCan', translate('App::Property', 'Distance from the forward end of the fin can to the fin leading edge')).LeadingEdgeOffset = 6.35
+
+        obj.Ttw = True
+        obj.TtwOffset = 0.0
+        obj.TtwLength = 57.15
+        obj.TtwHeight = 1.5
+
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return self._obj.Length
+
+    def shapeHandler(self, obj, draft=False):
+        return FinCanShapeHandler(obj, self._finShapeHandler(obj, draft), draft)
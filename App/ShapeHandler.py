@@ -0,0 +1,153 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Base class for drawing components"""
+
+__title__ = "FreeCAD Shape Handler"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import threading
+
+import FreeCAD
+import Part
+
+from App.Utilities import _err
+
+# Errors raised by OCC and the geometry calculations when the parameters don't produce a valid shape
+BUILD_ERRORS = (ValueError, ZeroDivisionError, Part.OCCError)
+
+# Draft quality used for interactive previews
+DRAFT_RESOLUTION = 20       # Points along curved profiles
+DRAFT_CROSS_SECTIONS = 8    # Cross sections in lofted fins
+
+# Properties that are never used to build a shape
+_NON_PARAMETERS = ['Shape', 'Placement', 'Label', 'Label2', 'Visibility', 'Proxy', 'ExpressionEngine', 'GeometryHash']
+
+class BoundedCache():
+    """ A fixed size cache that discards the oldest entry when full. Shapes can be built on a worker
+        thread, so access is serialized """
+
+    def __init__(self, size):
+        self._size = size
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, value):
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._size:
+                # Discard the oldest entry
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+class _LinkedShape():
+    """ The parts of a linked object, such as a fin profile sketch, used when building """
+
+    def __init__(self, obj):
+        self.Name = obj.Name
+        self.Label = obj.Label
+        self.Shape = obj.Shape.copy()
+
+class ParameterSnapshot():
+    """ Copies of the property values of a document object. Handlers that read their parameters
+        while building use this rather than the object so the build doesn't touch the document """
+
+    def __init__(self, obj):
+        for prop in obj.PropertiesList:
+            if prop in _NON_PARAMETERS:
+                continue
+            value = getattr(obj, prop)
+            if hasattr(value, 'isDerivedFrom') and value.isDerivedFrom('App::DocumentObject'):
+                value = _LinkedShape(value) if hasattr(value, 'Shape') else None
+            setattr(self, prop, value)
+
+class ShapeHandler():
+    """ Drawing is split in two. build() constructs the shape from the parameters captured by the
+        constructor without touching the document, so it may run on a worker thread. assign() sets
+        the shape on the object and must run on the main thread.
+
+        Draft handlers skip expensive detail such as fastener holes and through the wall tabs,
+        and use coarser curves. They're used for previews while editing """
+
+    def __init__(self, obj, draft=False):
+
+        # Raise build errors instead of reporting them, for debugging
+        self._debugShape = False
+
+        self._draft = draft
+
+        self._obj = obj
+
+    def isValidShape(self):
+        return True
+
+    # These will be implemented in the derived class
+    def _invalidShape(self):
+        """ Report that the parameters don't produce a valid shape """
+        _err("Invalid shape for %s" % (self.__class__.__name__))
+
+    def build(self):
+        """ Returns the shape, or None if it can't be built and the reason has been reported """
+        _err("No shape builder defined for %s" % (self.__class__.__name__))
+        return None
+
+    def assign(self, shape):
+        # Assigning the shape resets the placement, so keep a copy. It's taken here rather than when
+        # the handler is created so a move made while a preview was building isn't undone
+        placement = FreeCAD.Placement(self._obj.Placement)
+        self._obj.Shape = shape
+        self._obj.Placement = placement
+        if self._draft and hasattr(self._obj, 'GeometryHash'):
+            # A draft shape is never saved as current
+            self._obj.GeometryHash = ""
+
+    def draw(self):
+        """ Build and assign the shape, returning True if successful """
+        if not self.isValidShape():
+            return False
+
+        try:
+            shape = self.build()
+        except BUILD_ERRORS as ex:
+            if self._debugShape:
+                raise ex
+            self._invalidShape()
+            return False
+
+        if shape is None:
+            return False
+        self.assign(shape)
+        return True
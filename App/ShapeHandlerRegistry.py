@@ -0,0 +1,88 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Registry of the shape handlers for each component type"""
+
+__title__ = "FreeCAD Shape Handler Registry"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import importlib
+
+from App.Utilities import _err
+
+from DraftTools import translate
+
+class ShapeHandlerRegistry():
+    """ Maps component types, such as the nose cone types in App.Constants, to the handlers that
+        draw them. Handlers registered by name aren't imported until a component of that type is
+        first drawn, and the class is remembered after that.
+
+        Other workbenches can add their own shapes:
+
+            from App.ShapeNoseCone import noseConeHandlers
+            noseConeHandlers.register("MyNose", "MyWorkbench.MyNose.MyNoseShapeHandler")
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._classes = {}
+
+    def register(self, componentType, handler):
+        """ Register the handler for a component type, either as a class or as the name of a class
+            in the form 'module.Class'. Replaces any handler already registered for the type """
+        self._handlers[componentType] = handler
+        self._classes.pop(componentType, None)
+
+    def types(self):
+        """ The registered component types, in the order they were registered """
+        return list(self._handlers)
+
+    def __contains__(self, componentType):
+        return componentType in self._handlers
+
+    def handlerClass(self, componentType):
+        """ Returns the handler class for the component type, importing it if needed, or None """
+        handlerClass = self._classes.get(componentType)
+        if handlerClass is not None:
+            return handlerClass
+
+        handler = self._handlers.get(componentType)
+        if handler is None:
+            return None
+
+        handlerClass = handler
+        if isinstance(handler, str):
+            moduleName, _, className = handler.rpartition('.')
+            try:
+                handlerClass = getattr(importlib.import_module(moduleName), className)
+            except (ImportError, AttributeError) as ex:
+                _err(translate('Rocket', "Unable to load the shape handler '%s': %s") % (handler, str(ex)))
+                return None
+
+        self._classes[componentType] = handlerClass
+        return handlerClass
+
+    def handler(self, componentType, obj, draft=False):
+        """ Returns a handler for the object, or None if the component type isn't registered """
+        handlerClass = self.handlerClass(componentType)
+        if handlerClass is None:
+            return None
+        return handlerClass(obj, draft)
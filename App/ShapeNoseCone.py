@@ -25,16 +25,7 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
 from App.ShapeComponent import ShapeComponent
-
-from App.NoseConeShapeHandler import NoseConeShapeHandler
-from App.NoseBluntedConeShapeHandler import NoseBluntedConeShapeHandler
-from App.NoseEllipseShapeHandler import NoseEllipseShapeHandler
-from App.NoseHaackShapeHandler import NoseHaackShapeHandler
-from App.NoseOgiveShapeHandler import NoseOgiveShapeHandler
-from App.NoseBluntedOgiveShapeHandler import NoseBluntedOgiveShapeHandler
-from App.NoseSecantOgiveShapeHandler import NoseSecantOgiveShapeHandler
-from App.NoseParabolicShapeHandler import NoseParabolicShapeHandler
-from App.NosePowerShapeHandler import NosePowerShapeHandler
+from App.ShapeHandlerRegistry import ShapeHandlerRegistry
 
 from App.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
 from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID
@@ -43,6 +34,22 @@ from App.Utilities import _wrn
 
 from DraftTools import translate
 
+# Handlers are imported when a nose of that type is first drawn. The registration order is the
+# order of the NoseType choices
+noseConeHandlers = ShapeHandlerRegistry()
+noseConeHandlers.register(TYPE_CONE, "App.NoseConeShapeHandler.NoseConeShapeHandler")
+noseConeHandlers.register(TYPE_BLUNTED_CONE, "App.NoseBluntedConeShapeHandler.NoseBluntedConeShapeHandler")
+noseConeHandlers.register(TYPE_SPHERICAL, "App.NoseEllipseShapeHandler.NoseEllipseShapeHandler")
+noseConeHandlers.register(TYPE_ELLIPTICAL, "App.NoseEllipseShapeHandler.NoseEllipseShapeHandler")
+noseConeHandlers.register(TYPE_OGIVE, "App.NoseOgiveShapeHandler.NoseOgiveShapeHandler")
+noseConeHandlers.register(TYPE_BLUNTED_OGIVE, "App.NoseBluntedOgiveShapeHandler.NoseBluntedOgiveShapeHandler")
+noseConeHandlers.register(TYPE_SECANT_OGIVE, "App.NoseSecantOgiveShapeHandler.NoseSecantOgiveShapeHandler")
+noseConeHandlers.register(TYPE_VON_KARMAN, "App.NoseHaackShapeHandler.NoseHaackShapeHandler")
+noseConeHandlers.register(TYPE_PARABOLA, "App.NosePowerShapeHandler.NosePowerShapeHandler")
+noseConeHandlers.register(TYPE_PARABOLIC, "App.NoseParabolicShapeHandler.NoseParabolicShapeHandler")
+noseConeHandlers.register(TYPE_POWER, "App.NosePowerShapeHandler.NosePowerShapeHandler")
+noseConeHandlers.register(TYPE_HAACK, "App.NoseHaackShapeHandler.NoseHaackShapeHandler")
+
 def _migrate_from_1_0(obj):
     _wrn("Nose cone migrating object from 1.0")
 
@@ -89,6 +96,10 @@ def _migrate_from_2_0(obj):
 
 class ShapeNoseCone(ShapeComponent):
 
+    _geometryProperties = ['NoseType', 'NoseStyle', 'Length', 'Diameter', 'BluntedDiameter', 'Thickness',
+                           'Shoulder', 'ShoulderLength', 'ShoulderDiameter', 'ShoulderThickness', 'Coefficient',
+                           'OgiveDiameter', 'Resolution']
+
     def __init__(self, obj):
         super().__init__(obj)
         
@@ -117,18 +128,7 @@ class ShapeNoseCone(ShapeComponent):
 
         if not hasattr(obj, 'NoseType'):
             obj.addProperty('App::PropertyEnumeration', 'NoseType', 'NoseCone', translate('App::Property', 'Nose cone type'))
-        obj.NoseType = [TYPE_CONE,
-                    TYPE_BLUNTED_CONE,
-                    TYPE_SPHERICAL,
-                    TYPE_ELLIPTICAL,
-                    TYPE_OGIVE,
-                    TYPE_BLUNTED_OGIVE,
-                    TYPE_SECANT_OGIVE,
-                    TYPE_VON_KARMAN,
-                    TYPE_PARABOLA,
-                    TYPE_PARABOLIC,
-                    TYPE_POWER,
-                    TYPE_HAACK]
+        obj.NoseType = noseConeHandlers.types()
         obj.NoseType = TYPE_OGIVE
 
         if not hasattr(obj, 'NoseStyle'):
@@ -141,41 +141,38 @@ class ShapeNoseCone(ShapeComponent):
         if not hasattr(obj, 'Shape'):
             obj.addProperty('Part::PropertyPartShape', 'Shape', 'NoseCone', translate('App::Property', 'Shape of the nose cone'))
 
-    def onDocumentRestored(self, obj):
+        self._addMassProperties(obj)
+
+    def _needsMigration(self, obj):
+        return hasattr(obj, "Radius") or getattr(self, "version", None) in ["2.0", "2.1"]
+
+    def _migrate(self, obj):
         if hasattr(obj, "Radius"):
             _migrate_from_1_0(obj)
         if hasattr(obj.Proxy, "version") and obj.Proxy.version:
             if obj.Proxy.version in ["2.0", "2.1"]:
                 _migrate_from_2_0(obj)
 
-    def execute(self, obj):
-        shape = None
-        if obj.NoseType == TYPE_CONE:
-            shape = NoseConeShapeHandler(obj)
-        elif obj.NoseType == TYPE_BLUNTED_CONE:
-            shape = NoseBluntedConeShapeHandler(obj)
-        elif obj.NoseType == TYPE_SPHERICAL:
-            shape = NoseEllipseShapeHandler(obj)
-        elif obj.NoseType == TYPE_ELLIPTICAL:
-            shape = NoseEllipseShapeHandler(obj)
-        elif obj.NoseType == TYPE_OGIVE:
-            shape = NoseOgiveShapeHandler(obj)
-        elif obj.NoseType == TYPE_BLUNTED_OGIVE:
-            shape = NoseBluntedOgiveShapeHandler(obj)
-        elif obj.NoseType == TYPE_SECANT_OGIVE:
-            shape = NoseSecantOgiveShapeHandler(obj)
-        elif obj.NoseType == TYPE_VON_KARMAN:
+    def _restoreProperties(self, obj):
+        self._addMassProperties(obj)
+
+    def _shapeHandler(self, obj, draft=False):
+        return noseConeHandlers.handler(obj.NoseType, obj, draft)
+
+    def _massProperties(self, obj):
+        shape = self._shapeHandler(obj)
+        if shape is not None:
+            return shape.massProperties()
+        return None
+
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return self._obj.Length
+
+    def shapeHandler(self, obj, draft=False):
+        if obj.NoseType == TYPE_VON_KARMAN:
             obj.Coefficient = 0.0
-            shape = NoseHaackShapeHandler(obj)
-        elif obj.NoseType == TYPE_HAACK:
-            shape = NoseHaackShapeHandler(obj)
-        elif obj.NoseType == TYPE_PARABOLIC:
-            shape = NoseParabolicShapeHandler(obj)
         elif obj.NoseType == TYPE_PARABOLA:
             obj.Coefficient = 0.5
-            shape = NosePowerShapeHandler(obj)
-        elif obj.NoseType == TYPE_POWER:
-            shape = NosePowerShapeHandler(obj)
 
-        if shape is not None:
-            shape.draw()
+        return self._shapeHandler(obj, draft)
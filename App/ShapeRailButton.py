@@ -42,6 +42,10 @@ from DraftTools import translate
 
 class ShapeRailButton(ShapeComponent):
 
+    _geometryProperties = ['RailButtonType', 'OuterDiameter', 'InnerDiameter', 'TopThickness', 'BaseThickness',
+                           'Thickness', 'Length', 'Fastener', 'CountersinkAngle', 'ShankDiameter', 'HeadDiameter',
+                           'FilletedTop', 'FilletRadius']
+
     def __init__(self, obj):
         super().__init__(obj)
         self.Type = FEATURE_RAIL_BUTTON
@@ -97,10 +101,8 @@ class ShapeRailButton(ShapeComponent):
         # Return the length of this component along the central axis
         return self._obj.Length
 
-    def execute(self, obj):
-        shape = RailButtonShapeHandler(obj)
-        if shape is not None:
-            shape.draw()
+    def shapeHandler(self, obj, draft=False):
+        return RailButtonShapeHandler(obj, draft)
 
     def eligibleChild(self, childType):
         return False
@@ -34,6 +34,10 @@ from DraftTools import translate
 
 class ShapeRailGuide(ShapeComponent):
 
+    _geometryProperties = ['RailGuideBaseType', 'TopWidth', 'MiddleWidth', 'BaseWidth', 'TopThickness',
+                           'BaseThickness', 'Thickness', 'Length', 'Diameter', 'AutoDiameter', 'VAngle', 'ForwardSweep',
+                           'ForwardSweepAngle', 'AftSweep', 'AftSweepAngle', 'Notch', 'NotchWidth', 'NotchDepth']
+
     def __init__(self, obj):
         super().__init__(obj)
         self.Type = FEATURE_RAIL_GUIDE
@@ -84,7 +88,9 @@ class ShapeRailGuide(ShapeComponent):
         if not hasattr(obj,"Shape"):
             obj.addProperty('Part::PropertyPartShape', 'Shape', 'RailGuide', translate('App::Property', 'Shape of the launch guide'))
 
-    def execute(self, obj):
-        shape = RailGuideShapeHandler(obj)
-        if shape is not None:
-            shape.draw()
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return self._obj.Length
+
+    def shapeHandler(self, obj, draft=False):
+        return RailGuideShapeHandler(obj, draft)
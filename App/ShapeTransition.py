@@ -23,13 +23,7 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
 from App.ShapeComponent import ShapeComponent
-
-from App.TransitionConeShapeHandler import TransitionConeShapeHandler
-from App.TransitionEllipseShapeHandler import TransitionEllipseShapeHandler
-from App.TransitionHaackShapeHandler import TransitionHaackShapeHandler
-from App.TransitionOgiveShapeHandler import TransitionOgiveShapeHandler
-from App.TransitionParabolicShapeHandler import TransitionParabolicShapeHandler
-from App.TransitionPowerShapeHandler import TransitionPowerShapeHandler
+from App.ShapeHandlerRegistry import ShapeHandlerRegistry
 
 from App.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
 from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
@@ -38,6 +32,18 @@ from App.Utilities import _wrn
 
 from DraftTools import translate
 
+# Handlers are imported when a transition of that type is first drawn. The registration order is
+# the order of the TransitionType choices
+transitionHandlers = ShapeHandlerRegistry()
+transitionHandlers.register(TYPE_CONE, "App.TransitionConeShapeHandler.TransitionConeShapeHandler")
+transitionHandlers.register(TYPE_ELLIPTICAL, "App.TransitionEllipseShapeHandler.TransitionEllipseShapeHandler")
+transitionHandlers.register(TYPE_OGIVE, "App.TransitionOgiveShapeHandler.TransitionOgiveShapeHandler")
+transitionHandlers.register(TYPE_VON_KARMAN, "App.TransitionHaackShapeHandler.TransitionHaackShapeHandler")
+transitionHandlers.register(TYPE_PARABOLA, "App.TransitionPowerShapeHandler.TransitionPowerShapeHandler")
+transitionHandlers.register(TYPE_PARABOLIC, "App.TransitionParabolicShapeHandler.TransitionParabolicShapeHandler")
+transitionHandlers.register(TYPE_POWER, "App.TransitionPowerShapeHandler.TransitionPowerShapeHandler")
+transitionHandlers.register(TYPE_HAACK, "App.TransitionHaackShapeHandler.TransitionHaackShapeHandler")
+
 def _migrate_from_1_0(obj):
     _wrn("Transition migrating object from 1.0")
 
@@ -64,6 +70,11 @@ def _migrate_from_1_0(obj):
 
 class ShapeTransition(ShapeComponent):
 
+    _geometryProperties = ['TransitionType', 'TransitionStyle', 'Length', 'ForeDiameter', 'AftDiameter',
+                           'CoreDiameter', 'Thickness', 'Clipped', 'ForeShoulder', 'ForeShoulderLength',
+                           'ForeShoulderDiameter', 'ForeShoulderThickness', 'AftShoulder', 'AftShoulderLength',
+                           'AftShoulderDiameter', 'AftShoulderThickness', 'Coefficient', 'Resolution']
+
     def __init__(self, obj):
         super().__init__(obj)
 
@@ -102,14 +113,7 @@ class ShapeTransition(ShapeComponent):
 
         if not hasattr(obj, 'TransitionType'):
             obj.addProperty('App::PropertyEnumeration', 'TransitionType', 'Transition', translate('App::Property', 'Transition type'))
-        obj.TransitionType = [TYPE_CONE,
-                    TYPE_ELLIPTICAL,
-                    TYPE_OGIVE,
-                    TYPE_VON_KARMAN,
-                    TYPE_PARABOLA,
-                    TYPE_PARABOLIC,
-                    TYPE_POWER,
-                    TYPE_HAACK]
+        obj.TransitionType = transitionHandlers.types()
         obj.TransitionType = TYPE_CONE
 
         if not hasattr(obj, 'TransitionStyle'):
@@ -123,31 +127,34 @@ class ShapeTransition(ShapeComponent):
         if not hasattr(obj, 'Shape'):
             obj.addProperty('Part::PropertyPartShape', 'Shape', 'Transition', translate('App::Property', 'Shape of the transition'))
 
-    def onDocumentRestored(self, obj):
-        if hasattr(obj, "ForeRadius"):
-            _migrate_from_1_0(obj)
+        self._addMassProperties(obj)
+
+    def _needsMigration(self, obj):
+        return hasattr(obj, "ForeRadius")
+
+    def _migrate(self, obj):
+        _migrate_from_1_0(obj)
 
+    def _restoreProperties(self, obj):
+        self._addMassProperties(obj)
 
-    def execute(self, obj):
-        shape = None
-        if obj.TransitionType == TYPE_CONE:
-            shape = TransitionConeShapeHandler(obj)
-        elif obj.TransitionType == TYPE_ELLIPTICAL:
-            shape = TransitionEllipseShapeHandler(obj)
-        elif obj.TransitionType == TYPE_OGIVE:
-            shape = TransitionOgiveShapeHandler(obj)
-        elif obj.TransitionType == TYPE_VON_KARMAN:
+    def _shapeHandler(self, obj, draft=False):
+        return transitionHandlers.handler(obj.TransitionType, obj, draft)
+
+    def _massProperties(self, obj):
+        shape = self._shapeHandler(obj)
+        if shape is not None:
+            return shape.massProperties()
+        return None
+
+    def getAxialLength(self):
+        # Return the length of this component along the central axis
+        return self._obj.Length
+
+    def shapeHandler(self, obj, draft=False):
+        if obj.TransitionType == TYPE_VON_KARMAN:
             obj.Coefficient = 0.0
-            shape = TransitionHaackShapeHandler(obj)
-        elif obj.TransitionType == TYPE_HAACK:
-            shape = TransitionHaackShapeHandler(obj)
-        elif obj.TransitionType == TYPE_PARABOLIC:
-            shape = TransitionParabolicShapeHandler(obj)
         elif obj.TransitionType == TYPE_PARABOLA:
             obj.Coefficient = 0.5
-            shape = TransitionPowerShapeHandler(obj)
-        elif obj.TransitionType == TYPE_POWER:
-            shape = TransitionPowerShapeHandler(obj)
 
-        if shape is not None:
-            shape.draw()
+        return self._shapeHandler(obj, draft)
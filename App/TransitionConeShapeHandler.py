@@ -24,38 +24,9 @@ __title__ = "FreeCAD Conical Transition Shape Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
-import Part
-
 from App.TransitionShapeHandler import TransitionShapeHandler
-    
-    
-class TransitionConeShapeHandler(TransitionShapeHandler):
+from App.Geometry.Transition import ConeTransitionProfile
 
-    def isClippable(self):
-        # Clipped shape is the same as the unclipped
-        return False
-
-    def _radiusAt(self, r1, r2, length, pos):
-        if r1 > r2:
-            intercept = r1
-            x = length - pos
-            slope = (r2 - r1) / length
-        else:
-            intercept = r2
-            x = pos
-            slope = (r1 - r2) / length
-
-        y = x * slope + intercept
-        return y
+class TransitionConeShapeHandler(TransitionShapeHandler):
 
-    # Override the default to use native shapes
-    def _generateCurve(self, r1, r2, length, min = 0, max = 0):
-        if max == 0.0:
-            max = length
-        # if r1 > r2:
-        #     tmp = r1
-        #     r1 = r2
-        #     r2 = tmp
-        curve = Part.LineSegment(FreeCAD.Vector(min, r2), FreeCAD.Vector(max, r1))
-        return curve
+    _profileClass = ConeTransitionProfile
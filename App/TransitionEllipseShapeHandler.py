@@ -24,89 +24,9 @@ __title__ = "FreeCAD Elliptical Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import FreeCAD
-import Part
-import math
-
 from App.TransitionShapeHandler import TransitionShapeHandler
-    
-class TransitionEllipseShapeHandler(TransitionShapeHandler):
-
-    def _radiusAt(self, r1, r2, length, pos):
-        major = length
-        if r1 > r2:
-            minor = r1 - r2
-            center = r2
-            x = length - pos
-        else:
-            minor = r2 - r1
-            center = r1
-            x = pos
-
-        try:
-            y = (minor / major) * math.sqrt(major * major - x * x)
-        except Exception as ex:
-            print("r1 = %f, r2 = %f, length = %f, pos = %f, major = %f, minor = %f, x = %f" % (r1, r2, length, pos, major, minor, x))
-            raise ex
-        return y + center
-
-    def _eTheta(self, major, minor, tanTheta):
-        #
-        # Adgusts the angle to account for the eccentric anomalies. Refer to
-        #  https://forum.freecadweb.org/viewtopic.php?f=22&t=55655
-        eTheta = math.atan(major / minor * tanTheta)
-        return eTheta
-
-    # Override the default to use native shapes
-    #
-    # Doesn't work at the moment due to the extreme precision required in calculating the angles. The math is right
-    # but the points are off by thousandths of a mm resulting in discontinuities. Kept here for further
-    # development if desired
-    def _generateClippedCurve(self, r1, r2, length, min = 0, max = 0):
-        if max == 0.0:
-            max = self._length
+from App.Geometry.Transition import EllipseTransitionProfile
 
-        if r1 > r2:
-            major = length - min
-            minor = r1
-            if min <= 0:
-                theta1 = math.pi/2
-            else:
-                theta1 = self._eTheta(major, minor, (r1 / min))
-            theta2 = math.pi - self._eTheta(major, minor, (r2 / max))
-
-            print ("tan %f,%f compared to %f,%f" % (theta1, theta2, math.pi/2, math.pi))
-            curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(max, 0.0), major, minor), theta1, theta2)
-            for vertex in Part.Wire(curve.toShape()).Vertexes:
-                print(vertex.Point)
-
-            return curve
-
-        major = length - min
-        minor = r2
-        if min <= 0:
-            theta2 = math.pi/2
-        else:
-            theta2 = self._eTheta(major, minor, (r2 / min))
-        theta1 = self._eTheta(major, minor, (r1 / max))
-        curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(min, 0.0), major, minor), theta1, theta2)
-
-        return curve
-
-    # Override the default to use native shapes
-    def _generateCurve(self, r1, r2, length, min = 0, max = 0):
-        if self._clipped:
-            return super()._generateCurve(r1, r2, length, min, max)
-
-        if self._debugShape:
-            print ("r1 = %f, r2 = %f, min = %f, max = %f, length = %f" % (r1, r2, min, max, length))
-        if max == 0.0:
-            max = length - min
-        if r1 > r2:
-            radius = r1 - r2
-            curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(max, r2), max - min, radius), math.pi/2, math.pi)
-            return curve
+class TransitionEllipseShapeHandler(TransitionShapeHandler):
 
-        radius = r2 - r1
-        curve = Part.ArcOfEllipse(Part.Ellipse(FreeCAD.Vector(min, r1), max - min, radius), 0.0, math.pi/2)
-        return curve
+    _profileClass = EllipseTransitionProfile
@@ -24,36 +24,9 @@ __title__ = "FreeCAD Haack Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import math
-
-from DraftTools import translate
-
 from App.TransitionShapeHandler import TransitionShapeHandler
+from App.Geometry.Transition import HaackTransitionProfile
 
-from App.Utilities import _err    
-    
 class TransitionHaackShapeHandler(TransitionShapeHandler):
 
-    def isValidShape(self):
-        if self._coefficient < 0:
-            _err(translate('Rocket', "For %s transitions the coefficient must be >= 0") % self._type)
-            return False
-        return super().isValidShape()
-
-    def _theta(self, x, length):
-        return  math.acos(1 - 2*x/length)
-            
-    def _radiusAt(self, r1, r2, length, pos):
-        if r1 > r2:
-            radius = r1 - r2
-            center = r2
-            x = pos
-        else:
-            radius = r2 - r1
-            center = r1
-            x = length - pos
-
-        theta = self._theta(x, length)
-        y = radius * math.sqrt(theta - math.sin(2 * theta)/2
-            + self._coefficient * math.pow(math.sin(theta), 3)) / math.sqrt(math.pi)
-        return y + center
+    _profileClass = HaackTransitionProfile
@@ -24,26 +24,9 @@ __title__ = "FreeCAD Ogive Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import math
-
 from App.TransitionShapeHandler import TransitionShapeHandler
+from App.Geometry.Transition import OgiveTransitionProfile
 
 class TransitionOgiveShapeHandler(TransitionShapeHandler):
 
-    def isClippable(self):
-        # Clipped shape is the same as the unclipped
-        return False
-            
-    def _radiusAt(self, r1, r2, length, pos):
-        if r1 > r2:
-            radius = r1 - r2
-            center = r2
-            x = length - pos
-        else:
-            radius = r2 - r1
-            center = r1
-            x = pos
-        rho = (radius * radius + length * length) / (2.0 * radius)
-
-        y = math.sqrt(rho * rho - math.pow(x, 2)) + radius - rho
-        return y + center
+    _profileClass = OgiveTransitionProfile
@@ -24,30 +24,9 @@ __title__ = "FreeCAD Parabolic Series Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-from DraftTools import translate
-
 from App.TransitionShapeHandler import TransitionShapeHandler
+from App.Geometry.Transition import ParabolicTransitionProfile
 
-from App.Utilities import _err    
-    
 class TransitionParabolicShapeHandler(TransitionShapeHandler):
 
-    def isValidShape(self):
-        if self._coefficient < 0 or self._coefficient > 1:
-            _err(translate('Rocket', "For %s transitions the coefficient must be in the range (0 <= coefficient <= 1)") % self._type)
-            return False
-        return super().isValidShape()
-            
-    def _radiusAt(self, r1, r2, length, pos):
-        if r1 > r2:
-            radius = r1 - r2
-            center = r2
-            x = pos
-        else:
-            radius = r2 - r1
-            center = r1
-            x = length - pos
-
-        ratio = x / length
-        y = radius * ((2 * ratio) - (self._coefficient * ratio * ratio)) / (2 - self._coefficient)
-        return y + center
+    _profileClass = ParabolicTransitionProfile
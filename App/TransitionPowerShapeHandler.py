@@ -24,31 +24,9 @@ __title__ = "FreeCAD Haack Transition Handler"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
-import math
-
-from DraftTools import translate
-
 from App.TransitionShapeHandler import TransitionShapeHandler
+from App.Geometry.Transition import PowerTransitionProfile
 
-from App.Utilities import _err
-    
 class TransitionPowerShapeHandler(TransitionShapeHandler):
 
-    def isValidShape(self):
-        if self._coefficient <= 0 or self._coefficient > 1:
-            _err(translate('Rocket', "For %s transitions the coefficient must be in the range (0 < coefficient <= 1)") % self._type)
-            return False
-        return super().isValidShape()
-            
-    def _radiusAt(self, r1, r2, length, pos):
-        if r1 > r2:
-            radius = r1 - r2
-            center = r2
-            x = pos
-        else:
-            radius = r2 - r1
-            center = r1
-            x = length - pos
-
-        y = radius * math.pow((x / length), self._coefficient)
-        return y + center
+    _profileClass = PowerTransitionProfile
@@ -29,27 +29,32 @@ class RocketWorkbench ( Workbench ):
     ToolTip = "Rocket workbench"
 
     def Initialize(self):
+        import time
+        start = time.perf_counter()
+
         FreeCADGui.addLanguagePath(FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/translations")
 
-        # load the module
+        # load the module. The commands import their implementations when first used
         import RocketGui
         import SketcherGui
         from PySide.QtCore import QT_TRANSLATE_NOOP
         
         self.appendToolbar(QT_TRANSLATE_NOOP('Rocket', 'Rocket'),
-                        ['Rocket_NoseCone', 'Rocket_Transition', 'Rocket_BodyTube', 'Rocket_CenteringRing', 'Rocket_Bulkhead', 'Rocket_Fin', 'Rocket_LaunchGuides', 
+                        ['Rocket_NoseCone', 'Rocket_Transition', 'Rocket_BodyTube', 'Rocket_CenteringRing', 'Rocket_Bulkhead', 'Rocket_Fin', 'Rocket_FinCan', 'Rocket_LaunchGuides', 
                         'Separator', 'Rocket_Calculators', 'Separator', 'Rocket_NewSketch', 'Sketcher_EditSketch'])
 
         self.appendMenu(QT_TRANSLATE_NOOP('Rocket', 'Rocket'), 
-                        ['Rocket_NoseCone', 'Rocket_Transition', 'Rocket_BodyTube', 'Rocket_CenteringRing', 'Rocket_Bulkhead', 'Rocket_Fin'])
+                        ['Rocket_NoseCone', 'Rocket_Transition', 'Rocket_BodyTube', 'Rocket_CenteringRing', 'Rocket_Bulkhead', 'Rocket_Fin', 'Rocket_FinCan'])
         self.appendMenu([QT_TRANSLATE_NOOP('Rocket', 'Rocket'), 
                          QT_TRANSLATE_NOOP("Rocket", "Launch Guides")],
                         ['Rocket_LaunchLug', 'Rocket_RailButton', 'Rocket_RailGuide'])
         self.appendMenu(QT_TRANSLATE_NOOP('Rocket', 'Rocket'), 
-                        ['Separator'])
+                        ['Separator', 'Rocket_Restack', 'Separator'])
         self.appendMenu([QT_TRANSLATE_NOOP("Rocket", "Rocket"),
                          QT_TRANSLATE_NOOP("Rocket", "Calculators")],
-                        ['Rocket_CalcBlackPowder', 'Rocket_CalcParachute', 'Rocket_CalcThrustToWeight', 'Rocket_CalcVentHoles'])
+                        ['Rocket_CalcBlackPowder', 'Rocket_CalcParachute', 'Rocket_CalcStability', 'Rocket_CalcThrustToWeight', 'Rocket_CalcVentHoles'])
+
+        FreeCAD.Console.PrintLog("Rocket workbench initialized in %.1f ms\n" % ((time.perf_counter() - start) * 1000.0))
 
     def GetClassName(self):
         return "Gui::PythonWorkbench"
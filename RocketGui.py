@@ -24,50 +24,130 @@ __url__ = "https://www.davesrocketshop.com"
 
 import FreeCAD
 import FreeCADGui
+import importlib
+import time
 
-from DraftTools import translate
+from PySide.QtCore import QCoreApplication, QT_TRANSLATE_NOOP
 
-from Ui.CmdNoseCone import CmdNoseCone
-from Ui.CmdTransition import CmdTransition
-from Ui.CmdCenteringRing import CmdCenteringRing
-from Ui.CmdBodyTube import CmdBodyTube
-from Ui.CmdBulkhead import CmdBulkhead
-from Ui.CmdLaunchGuides import CmdLaunchLug, CmdRailButton, CmdRailGuide, CmdStandOff
-from Ui.CmdFin import CmdFin
+# Registering the commands doesn't import their modules. Each module pulls in its shapes, task
+# panels and dialogs, so it's imported the first time one of its commands is used
+_start = time.perf_counter()
 
-# Calculators
-from Ui.CmdCalcBlackPowder import CmdCalcBlackPowder
-from Ui.CmdCalcParachute import CmdCalcParachute
-from Ui.CmdCalcThrustToWeight import CmdCalcThrustToWeight
-from Ui.CmdCalcVentHoles import CmdCalcVentHoles
+# Time taken to import each command module, in ms
+_importTimes = {}
 
-# Rocket specific sketcher
-from Ui.CmdSketcher import CmdNewSketch
+def importTimes():
+    return dict(_importTimes)
 
-FreeCADGui.addCommand('Rocket_NoseCone', CmdNoseCone())
-FreeCADGui.addCommand('Rocket_Transition', CmdTransition())
-FreeCADGui.addCommand('Rocket_CenteringRing', CmdCenteringRing())
-FreeCADGui.addCommand('Rocket_Bulkhead', CmdBulkhead())
-FreeCADGui.addCommand('Rocket_Fin', CmdFin())
+def translate(context, text):
+    # DraftTools.translate would import Draft when the workbench is activated
+    return QCoreApplication.translate(context, text)
 
-FreeCADGui.addCommand('Rocket_BodyTube', CmdBodyTube())
+def _icon(name):
+    return FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/" + name
 
-FreeCADGui.addCommand('Rocket_LaunchLug', CmdLaunchLug())
-FreeCADGui.addCommand('Rocket_RailButton', CmdRailButton())
-FreeCADGui.addCommand('Rocket_RailGuide', CmdRailGuide())
-FreeCADGui.addCommand('Rocket_Standoff', CmdStandOff())
+def _always():
+    # Always available, even without active document
+    return True
 
-FreeCADGui.addCommand('Rocket_CalcBlackPowder', CmdCalcBlackPowder())
-FreeCADGui.addCommand('Rocket_CalcParachute', CmdCalcParachute())
-FreeCADGui.addCommand('Rocket_CalcThrustToWeight', CmdCalcThrustToWeight())
-FreeCADGui.addCommand('Rocket_CalcVentHoles', CmdCalcVentHoles())
+def _hasDocument():
+    if FreeCAD.ActiveDocument:
+        return True
+    return False
+
+def _hasSelection():
+    if FreeCAD.ActiveDocument and len(FreeCADGui.Selection.getSelection()) > 0:
+        return True
+    return False
+
+class _LazyCommand:
+    """ Stands in for a command until it's first activated, then imports the module implementing
+        it and passes everything on to the real command """
+
+    def __init__(self, moduleName, className, menuText, toolTip, pixmap, isActive=_hasDocument):
+        self._moduleName = moduleName
+        self._className = className
+        self._menuText = menuText
+        self._toolTip = toolTip
+        self._pixmap = pixmap
+        self._isActive = isActive
+        self._command = None
+
+    def _load(self):
+        if self._command is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self._moduleName)
+            if self._moduleName not in _importTimes:
+                _importTimes[self._moduleName] = (time.perf_counter() - start) * 1000.0
+                FreeCAD.Console.PrintLog("Imported %s in %.1f ms\n" % (self._moduleName, _importTimes[self._moduleName]))
+            self._command = getattr(module, self._className)()
+        return self._command
+
+    def Activated(self):
+        self._load().Activated()
 
-FreeCADGui.addCommand('Rocket_NewSketch', CmdNewSketch())
+    def IsActive(self):
+        if self._command is not None:
+            return self._command.IsActive()
+        return self._isActive()
+
+    def GetResources(self):
+        return {'MenuText': translate('Rocket', self._menuText),
+                'ToolTip': translate('Rocket', self._toolTip),
+                'Pixmap': self._pixmap}
+
+FreeCADGui.addCommand('Rocket_NoseCone', _LazyCommand('Ui.CmdNoseCone', 'CmdNoseCone',
+    QT_TRANSLATE_NOOP('Rocket', 'Nose Cone'), QT_TRANSLATE_NOOP('Rocket', 'Nose cone design'), _icon("Rocket_NoseCone.svg")))
+FreeCADGui.addCommand('Rocket_Transition', _LazyCommand('Ui.CmdTransition', 'CmdTransition',
+    QT_TRANSLATE_NOOP('Rocket', 'Transition'), QT_TRANSLATE_NOOP('Rocket', 'Transition design'), _icon("Rocket_Transition.svg")))
+FreeCADGui.addCommand('Rocket_CenteringRing', _LazyCommand('Ui.CmdCenteringRing', 'CmdCenteringRing',
+    QT_TRANSLATE_NOOP('Rocket', 'Centering Ring'), QT_TRANSLATE_NOOP('Rocket', 'Centering Ring design'), _icon("Rocket_CenteringRing.svg")))
+FreeCADGui.addCommand('Rocket_Bulkhead', _LazyCommand('Ui.CmdBulkhead', 'CmdBulkhead',
+    QT_TRANSLATE_NOOP('Rocket', 'Bulkhead'), QT_TRANSLATE_NOOP('Rocket', 'Bulkhead design'), _icon("Rocket_Bulkhead.svg")))
+FreeCADGui.addCommand('Rocket_Fin', _LazyCommand('Ui.CmdFin', 'CmdFin',
+    QT_TRANSLATE_NOOP('Rocket', 'Fin'), QT_TRANSLATE_NOOP('Rocket', 'Fin design'), _icon("Rocket_Fin.svg")))
+FreeCADGui.addCommand('Rocket_FinCan', _LazyCommand('Ui.CmdFinCan', 'CmdFinCan',
+    QT_TRANSLATE_NOOP('Rocket', 'Fin Can'), QT_TRANSLATE_NOOP('Rocket', 'Fin can design'), _icon("Rocket_FinCan.svg")))
+
+FreeCADGui.addCommand('Rocket_BodyTube', _LazyCommand('Ui.CmdBodyTube', 'CmdBodyTube',
+    QT_TRANSLATE_NOOP('Rocket', 'Body Tube'), QT_TRANSLATE_NOOP('Rocket', 'Body tube design'), _icon("Rocket_BodyTube.svg")))
+
+FreeCADGui.addCommand('Rocket_Restack', _LazyCommand('Ui.CmdRestack', 'CmdRestack',
+    QT_TRANSLATE_NOOP('Rocket', 'Restack'), QT_TRANSLATE_NOOP('Rocket', 'Place the selected components end to end, in the order selected'),
+    _icon("RocketWorkbench.svg"), _hasSelection))
+
+FreeCADGui.addCommand('Rocket_LaunchLug', _LazyCommand('Ui.CmdLaunchGuides', 'CmdLaunchLug',
+    QT_TRANSLATE_NOOP('Rocket', 'Launch Lug'), QT_TRANSLATE_NOOP('Rocket', 'Launch lug design'), _icon("Rocket_LaunchLug.svg")))
+FreeCADGui.addCommand('Rocket_RailButton', _LazyCommand('Ui.CmdLaunchGuides', 'CmdRailButton',
+    QT_TRANSLATE_NOOP('Rocket', 'Rail Button'), QT_TRANSLATE_NOOP('Rocket', 'Rail button design'), _icon("Rocket_RailButton.svg")))
+FreeCADGui.addCommand('Rocket_RailGuide', _LazyCommand('Ui.CmdLaunchGuides', 'CmdRailGuide',
+    QT_TRANSLATE_NOOP('Rocket', 'Rail Guide'), QT_TRANSLATE_NOOP('Rocket', 'Rail guide design'), _icon("Rocket_RailGuide.svg")))
+FreeCADGui.addCommand('Rocket_Standoff', _LazyCommand('Ui.CmdLaunchGuides', 'CmdStandOff',
+    QT_TRANSLATE_NOOP('Rocket', 'Stand Off'), QT_TRANSLATE_NOOP('Rocket', 'Stand off design'), _icon("Rocket_Standoff.svg")))
+
+FreeCADGui.addCommand('Rocket_CalcBlackPowder', _LazyCommand('Ui.CmdCalcBlackPowder', 'CmdCalcBlackPowder',
+    QT_TRANSLATE_NOOP('Rocket', 'Calculate ejection charge'), QT_TRANSLATE_NOOP('Rocket', 'Calculate ejection charge'),
+    _icon("Rocket_Calculator.svg"), _always))
+FreeCADGui.addCommand('Rocket_CalcParachute', _LazyCommand('Ui.CmdCalcParachute', 'CmdCalcParachute',
+    QT_TRANSLATE_NOOP('Rocket', 'Calculate parachute size'), QT_TRANSLATE_NOOP('Rocket', 'Calculate parachute size'),
+    _icon("Rocket_Calculator.svg"), _always))
+FreeCADGui.addCommand('Rocket_CalcStability', _LazyCommand('Ui.CmdCalcStability', 'CmdCalcStability',
+    QT_TRANSLATE_NOOP('Rocket', 'Calculate Stability'), QT_TRANSLATE_NOOP('Rocket', 'Calculate the Barrowman center of pressure and static margin'),
+    _icon("Rocket_Calculator.svg")))
+FreeCADGui.addCommand('Rocket_CalcThrustToWeight', _LazyCommand('Ui.CmdCalcThrustToWeight', 'CmdCalcThrustToWeight',
+    QT_TRANSLATE_NOOP('Rocket', 'Calculate Thrust To Weight'), QT_TRANSLATE_NOOP('Rocket', 'Calculate Thrust To Weight'),
+    _icon("Rocket_Calculator.svg"), _always))
+FreeCADGui.addCommand('Rocket_CalcVentHoles', _LazyCommand('Ui.CmdCalcVentHoles', 'CmdCalcVentHoles',
+    QT_TRANSLATE_NOOP('Rocket', 'Calculate vent hole size'), QT_TRANSLATE_NOOP('Rocket', 'Calculate vent hole size'),
+    _icon("Rocket_Calculator.svg"), _always))
+
+FreeCADGui.addCommand('Rocket_NewSketch', _LazyCommand('Ui.CmdSketcher', 'CmdNewSketch',
+    QT_TRANSLATE_NOOP('Rocket', 'Create sketch'), QT_TRANSLATE_NOOP('Rocket', 'Create a new sketch'), "Sketcher_NewSketch"))
 
 class _CalculatorGroupCommand:
 
     def GetCommands(self):
-        return tuple(['Rocket_CalcBlackPowder', 'Rocket_CalcParachute', 'Rocket_CalcThrustToWeight', 'Rocket_CalcVentHoles'])
+        return tuple(['Rocket_CalcBlackPowder', 'Rocket_CalcParachute', 'Rocket_CalcStability', 'Rocket_CalcThrustToWeight', 'Rocket_CalcVentHoles'])
     def GetResources(self):
         return {
             'MenuText': translate('Rocket', 'Calculators'),
@@ -95,3 +175,5 @@ class _GuidesGroupCommand:
 
 FreeCADGui.addCommand('Rocket_Calculators', _CalculatorGroupCommand())
 FreeCADGui.addCommand('Rocket_LaunchGuides', _GuidesGroupCommand())
+
+FreeCAD.Console.PrintLog("Registered the Rocket commands in %.1f ms\n" % ((time.perf_counter() - _start) * 1000.0))
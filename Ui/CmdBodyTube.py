@@ -30,8 +30,6 @@ import FreeCADGui
 from App.ShapeBodyTube import ShapeBodyTube
 from Ui.ViewBodyTube import ViewProviderBodyTube
 
-from DraftTools import translate
-
 def makeBodyTube(name):
     '''makeBodyTube(name): makes a Body Tube'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -58,8 +56,3 @@ class CmdBodyTube:
         if FreeCAD.ActiveDocument:
             return True
         return False
-            
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Body Tube'),
-                'ToolTip': translate("Rocket", 'Body tube design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_BodyTube.svg"}
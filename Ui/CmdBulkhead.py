@@ -30,8 +30,6 @@ import FreeCADGui
 from App.ShapeBulkhead import ShapeBulkhead
 from Ui.ViewBulkhead import ViewProviderBulkhead
 
-from DraftTools import translate
-
 def makeBulkhead(name):
     '''makeBulkhead(name): makes a bulkhead'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -58,8 +56,3 @@ class CmdBulkhead:
         if FreeCAD.ActiveDocument:
             return True
         return False
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Bulkhead'),
-                'ToolTip': translate("Rocket", 'Bulkhead design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Bulkhead.svg"}
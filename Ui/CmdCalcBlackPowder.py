@@ -27,8 +27,6 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import FreeCADGui
 
-from DraftTools import translate
-
 from Ui.DialogBlackPowder import DialogBlackPowder
 
 def calcBlackPowder():
@@ -43,8 +41,3 @@ class CmdCalcBlackPowder:
     def IsActive(self):
         # Always available, even without active document
         return True
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Calculate ejection charge'),
-                'ToolTip': translate("Rocket", 'Calculate ejection charge'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Calculator.svg"}
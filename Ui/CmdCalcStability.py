@@ -0,0 +1,44 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for calculating stability"""
+
+__title__ = "FreeCAD Stability Command"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+import FreeCAD
+import FreeCADGui
+
+from Ui.DialogStability import DialogStability
+
+def calcStability():
+    form = DialogStability()
+    form.exec_()
+
+class CmdCalcStability:
+    def Activated(self):
+        FreeCADGui.addModule("Ui.CmdCalcStability")
+        FreeCADGui.doCommand("Ui.CmdCalcStability.calcStability()")
+
+    def IsActive(self):
+        if FreeCAD.ActiveDocument:
+            return True
+        return False
@@ -27,8 +27,6 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import FreeCADGui
 
-from DraftTools import translate
-
 from Ui.DialogThrustToWeight import DialogThrustToWeight
 
 def calcThrustToWeight():
@@ -43,8 +41,3 @@ class CmdCalcThrustToWeight:
     def IsActive(self):
         # Always available, even without active document
         return True
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Calculate Thrust To Weight'),
-                'ToolTip': translate("Rocket", 'Calculate Thrust To Weight'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Calculator.svg"}
@@ -27,8 +27,6 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import FreeCADGui
 
-from DraftTools import translate
-
 from Ui.DialogVentHoles import DialogVentHole
 
 def calcVentHoles():
@@ -43,8 +41,3 @@ class CmdCalcVentHoles:
     def IsActive(self):
         # Always available, even without active document
         return True
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Calculate vent hole size'),
-                'ToolTip': translate("Rocket", 'Calculate vent hole size'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Calculator.svg"}
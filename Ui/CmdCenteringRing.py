@@ -30,8 +30,6 @@ import FreeCADGui
 from App.ShapeCenteringRing import ShapeCenteringRing
 from Ui.ViewCenteringRing import ViewProviderCenteringRing
 
-from DraftTools import translate
-
 def makeCenteringRing(name):
     '''makeCenteringRing(name): makes a centering ring'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -58,8 +56,3 @@ class CmdCenteringRing:
         if FreeCAD.ActiveDocument:
             return True
         return False
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Centering Ring'),
-                'ToolTip': translate("Rocket", 'Centering Ring design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_CenteringRing.svg"}
@@ -32,8 +32,6 @@ from App.ShapeFin import ShapeFin
 from Ui.ViewFin import ViewProviderFin
 # import Sketcher
 
-from DraftTools import translate
-
 def makeFin(name):
     '''makeFin(name): makes a Fin'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -68,8 +66,3 @@ class CmdFin:
         if FreeCAD.ActiveDocument:
             return True
         return False
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Fin'),
-                'ToolTip': translate("Rocket", 'Fin design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Fin.svg"}
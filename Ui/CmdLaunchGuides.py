@@ -32,8 +32,6 @@ from App.ShapeLaunchLug import ShapeLaunchLug
 from App.ShapeRailButton import ShapeRailButton
 from Ui.ViewLaunchGuide import ViewProviderRailButton, ViewProviderLaunchLug, ViewProviderRailGuide
 
-from DraftTools import translate
-
 def makeLaunchLug(name='LaunchLug'):
     '''makeLaunchLug(name): makes a Launch Lug'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -90,11 +88,6 @@ class CmdLaunchLug:
         if FreeCAD.ActiveDocument:
             return True
         return False
-            
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Launch Lug'),
-                'ToolTip': translate("Rocket", 'Launch lug design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_LaunchLug.svg"}
 
 class CmdRailButton:
     def Activated(self):
@@ -107,11 +100,6 @@ class CmdRailButton:
         if FreeCAD.ActiveDocument:
             return True
         return False
-            
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Rail Button'),
-                'ToolTip': translate("Rocket", 'Rail button design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_RailButton.svg"}
 
 class CmdRailGuide:
     def Activated(self):
@@ -124,11 +112,6 @@ class CmdRailGuide:
         if FreeCAD.ActiveDocument:
             return True
         return False
-            
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Rail Guide'),
-                'ToolTip': translate("Rocket", 'Rail guide design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_RailGuide.svg"}
 
 class CmdStandOff:
     def Activated(self):
@@ -141,8 +124,3 @@ class CmdStandOff:
         if FreeCAD.ActiveDocument:
             return True
         return False
-            
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Stand Off'),
-                'ToolTip': translate("Rocket", 'Stand off design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Standoff.svg"}
@@ -31,8 +31,6 @@ import FreeCADGui
 from App.ShapeNoseCone import ShapeNoseCone
 from Ui.ViewNoseCone import ViewProviderNoseCone
 
-from DraftTools import translate
-
 def makeNoseCone(name):
     '''makeNoseCone(name): makes a Nose Cone'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -59,8 +57,3 @@ class CmdNoseCone:
         if FreeCAD.ActiveDocument:
             return True
         return False
-
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Nose Cone'),
-                'ToolTip': translate("Rocket", 'Nose cone design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_NoseCone.svg"}
@@ -0,0 +1,52 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for restacking components"""
+
+__title__ = "FreeCAD Restack Command"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+import FreeCAD
+import FreeCADGui
+
+from App.Restack import restack
+from App.Utilities import _err
+
+from DraftTools import translate
+
+def restackSelection():
+    selection = FreeCADGui.Selection.getSelection()
+    if len(selection) == 0:
+        _err(translate('Rocket', "Select the components to restack, from front to back"))
+        return
+
+    # Keep the first component where it is
+    restack(selection)
+
+class CmdRestack:
+    def Activated(self):
+        FreeCADGui.addModule("Ui.CmdRestack")
+        FreeCADGui.doCommand("Ui.CmdRestack.restackSelection()")
+
+    def IsActive(self):
+        if FreeCAD.ActiveDocument and len(FreeCADGui.Selection.getSelection()) > 0:
+            return True
+        return False
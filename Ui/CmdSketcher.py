@@ -27,8 +27,6 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import FreeCADGui
 
-from DraftTools import translate
-
 def newSketch():
     obj = FreeCAD.ActiveDocument.addObject("Sketcher::SketchObject","Sketch")
     # Select the XZ plane for consistency
@@ -47,8 +45,3 @@ class CmdNewSketch:
         if FreeCAD.ActiveDocument:
             return True
         return False
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Create sketch'),
-                'ToolTip': translate("Rocket", 'Create a new sketch'),
-                'Pixmap': "Sketcher_NewSketch" } #FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Calculator.svg"}
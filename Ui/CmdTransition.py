@@ -31,8 +31,6 @@ import FreeCADGui
 from App.ShapeTransition import ShapeTransition
 from Ui.ViewTransition import ViewProviderTransition
 
-from DraftTools import translate
-
 def makeTransition(name):
     '''makeTransition(name): makes a Transition'''
     obj = FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
@@ -59,8 +57,3 @@ class CmdTransition:
         if FreeCAD.ActiveDocument:
             return True
         return False
-        
-    def GetResources(self):
-        return {'MenuText': translate("Rocket", 'Transition'),
-                'ToolTip': translate("Rocket", 'Transition design'),
-                'Pixmap': FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Transition.svg"}
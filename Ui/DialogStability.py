@@ -0,0 +1,176 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for the Barrowman stability calculator"""
+
+__title__ = "FreeCAD Stability Calculator"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+import FreeCAD
+import FreeCADGui
+
+from DraftTools import translate
+
+from PySide import QtGui, QtCore
+from PySide2.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QGridLayout
+
+from App.Barrowman import getBarrowman
+from App.MassRollup import getMassRollup
+
+class DialogStability(QDialog):
+    def __init__(self):
+        super().__init__()
+
+        self._engine = getBarrowman(FreeCAD.ActiveDocument)
+
+        self.initUI()
+
+    def initUI(self):
+
+        ui = FreeCADGui.UiLoader()
+
+        # create our window
+        # define window		xLoc,yLoc,xDim,yDim
+        self.setGeometry(	250, 250, 640, 480)
+        self.setWindowTitle(translate('Rocket', "Barrowman Stability Calculator"))
+        self.resize(QtCore.QSize(100,100).expandedTo(self.minimumSizeHint())) # sets size of the widget
+        self.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint)
+
+        self.machLabel = QtGui.QLabel(translate('Rocket', "Mach Number"), self)
+
+        self.machSpinBox = QtGui.QDoubleSpinBox(self)
+        self.machSpinBox.setFixedWidth(100)
+        self.machSpinBox.setDecimals(2)
+        self.machSpinBox.setMinimum(0.0)
+        self.machSpinBox.setMaximum(0.95)
+        self.machSpinBox.setSingleStep(0.05)
+        self.machSpinBox.setValue(0.3)
+        self.machSpinBox.valueChanged.connect(self.onMach)
+
+        self.cgLabel = QtGui.QLabel(translate('Rocket', "CG From Nose Tip"), self)
+
+        self.cgInput = ui.createWidget("Gui::InputField")
+        self.cgInput.unit = 'mm'
+        self.cgInput.setFixedWidth(100)
+        self.cgInput.setText(FreeCAD.Units.Quantity(str(self._rolledUpCG()) + "mm").UserString)
+        self.cgInput.textEdited.connect(self.onCG)
+
+        self.normalForceLabel = QtGui.QLabel(translate('Rocket', "Normal Force Coefficient Slope"), self)
+
+        self.normalForceInput = QtGui.QLineEdit(self)
+        self.normalForceInput.setFixedWidth(100)
+        self.normalForceInput.setReadOnly(True)
+
+        self.cpLabel = QtGui.QLabel(translate('Rocket', "CP From Nose Tip"), self)
+
+        self.cpInput = ui.createWidget("Gui::InputField")
+        self.cpInput.unit = 'mm'
+        self.cpInput.setFixedWidth(100)
+        self.cpInput.setReadOnly(True)
+
+        self.marginLabel = QtGui.QLabel(translate('Rocket', "Static Margin (calibers)"), self)
+
+        self.marginInput = QtGui.QLineEdit(self)
+        self.marginInput.setFixedWidth(100)
+        self.marginInput.setReadOnly(True)
+
+        # OK button
+        okButton = QtGui.QPushButton('OK', self)
+        okButton.setDefault(False)
+        okButton.setAutoDefault(False)
+        okButton.clicked.connect(self.onOk)
+
+        layout = QVBoxLayout()
+        line = QGridLayout()
+        row = 0
+
+        line.addWidget(self.machLabel, row, 0, 1, 2)
+        line.addWidget(self.machSpinBox, row, 1)
+        row += 1
+
+        line.addWidget(self.cgLabel, row, 0)
+        line.addWidget(self.cgInput, row, 1)
+        row += 1
+
+        line.addWidget(self.normalForceLabel, row, 0)
+        line.addWidget(self.normalForceInput, row, 1)
+        row += 1
+
+        line.addWidget(self.cpLabel, row, 0)
+        line.addWidget(self.cpInput, row, 1)
+        row += 1
+
+        line.addWidget(self.marginLabel, row, 0)
+        line.addWidget(self.marginInput, row, 1)
+        layout.addLayout(line)
+
+        line = QHBoxLayout()
+        line.addStretch()
+        line.addWidget(okButton)
+        layout.addLayout(line)
+
+        self.setLayout(layout)
+
+        self._calc()
+
+        # now make the window visible
+        self.show()
+
+    def _rolledUpCG(self):
+        # Default to the center of gravity of the modeled components
+        properties = getMassRollup(FreeCAD.ActiveDocument).massProperties()
+        if properties.volume <= 0.0:
+            return 0.0
+        return self._engine.noseTip() - float(properties.center[0])
+
+    def _calc(self):
+        try:
+            normalForce, center = self._engine.centerOfPressure(float(self.machSpinBox.value()))
+        except ValueError:
+            self.normalForceInput.setText("")
+            self.cpInput.setText("")
+            self.marginInput.setText("")
+            return
+
+        # Positions are reported from the nose tip
+        tip = self._engine.noseTip()
+        cp = tip - float(center)
+        cg = float(FreeCAD.Units.Quantity(self.cgInput.text()).Value)
+        margin = (cp - cg) / self._engine.referenceDiameter()
+
+        self.normalForceInput.setText("%.3f" % float(normalForce))
+        self.cpInput.setText(FreeCAD.Units.Quantity(str(cp) + "mm").UserString)
+        self.marginInput.setText("%.2f" % margin)
+
+    def onMach(self, value):
+        try:
+            self._calc()
+        except ValueError:
+            pass
+
+    def onCG(self, value):
+        try:
+            self._calc()
+        except ValueError:
+            pass
+
+    def onOk(self):
+        self.close()
@@ -0,0 +1,246 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Coalescing live preview scheduler for the component task panels"""
+
+__title__ = "FreeCAD Preview Scheduler"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+    
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import FreeCAD
+
+from PySide import QtCore
+from PySide.QtCore import QObject, Signal
+
+from App.ShapeHandler import BUILD_ERRORS
+from Ui.ViewProvider import _NON_PARAMETERS
+
+# Edits arriving within this window are coalesced into a single redraw, in ms.
+# Configurable in the Rocket workbench parameters as PreviewDelay
+PREVIEW_DELAY = 150
+
+_PARAMETER_PATH = "User parameter:BaseApp/Preferences/Mod/Rocket"
+
+# Properties that don't change the generated shape
+_NON_GEOMETRY = _NON_PARAMETERS + ['ExpressionEngine', 'Proxy']
+
+class _PendingRedraw:
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.edited = None  # Time of the first edit not yet shown, from time.perf_counter()
+        self.edits = 0
+        self.built = None   # Parameters used by the last build
+        self.generation = 0 # Identifies the build in progress. Results from older builds are dropped
+
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+
+class PreviewScheduler(QObject):
+    """
+        Task panels request a redraw on every keystroke. The scheduler waits until the edits
+        have settled for the coalescing window before rebuilding, keeps at most one redraw
+        pending per object, and skips rebuilding when the parameters are those last built.
+
+        Previews are draft quality. The full shape is built when the document is recomputed on
+        accepting the panel. The parameters are validated on the main thread so any messages
+        appear immediately, then the shape is built on a worker thread and assigned back on the
+        main thread. Builds superseded by newer edits are dropped.
+    """
+
+    shapeBuilt = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+
+        self._pending = {}
+        self._generation = 0
+        self._builds = ThreadPoolExecutor(max_workers=1)
+        self.shapeBuilt.connect(self._assign, QtCore.Qt.QueuedConnection)
+
+        # Edit to preview latency statistics, in seconds
+        self.previews = 0
+        self.coalesced = 0
+        self.skipped = 0
+        self.superseded = 0
+        self.lastLatency = 0.0
+        self.totalLatency = 0.0
+        self.maxLatency = 0.0
+
+    def delay(self):
+        return FreeCAD.ParamGet(_PARAMETER_PATH).GetInt("PreviewDelay", PREVIEW_DELAY)
+
+    def _entry(self, obj):
+        name = obj.Name
+        entry = self._pending.get(name)
+        if entry is None or entry.obj != obj:
+            entry = _PendingRedraw(obj)
+            entry.timer.timeout.connect(lambda: self._redraw(name))
+            self._pending[name] = entry
+        return entry
+
+    def schedule(self, obj):
+        """ Request a redraw of obj once the edits have settled """
+        entry = self._entry(obj)
+        if entry.edited is None:
+            entry.edited = time.perf_counter()
+        else:
+            self.coalesced += 1
+        entry.edits += 1
+        entry.timer.start(self.delay())
+
+    def redraw(self, obj):
+        """ Redraw obj now on the main thread, replacing any pending redraw """
+        entry = self._entry(obj)
+        entry.timer.stop()
+        entry.generation = self._nextGeneration()
+        if entry.edited is None:
+            entry.edited = time.perf_counter()
+
+        obj.Proxy.execute(obj)
+        entry.built = self._parameters(obj)
+        self._record(entry)
+
+    def cancel(self, obj):
+        """ Drop any pending redraw. Used when the panel closes and the document is recomputed """
+        entry = self._pending.pop(obj.Name, None)
+        if entry is not None:
+            entry.timer.stop()
+
+    def _parameters(self, obj):
+        parameters = []
+        for prop in obj.PropertiesList:
+            if prop in _NON_GEOMETRY:
+                continue
+            value = getattr(obj, prop)
+            if hasattr(value, 'isDerivedFrom') and value.isDerivedFrom('App::DocumentObject'):
+                value = value.Name
+            parameters.append((prop, value))
+        return parameters
+
+    def _nextGeneration(self):
+        self._generation += 1
+        return self._generation
+
+    def _current(self, name, generation):
+        entry = self._pending.get(name)
+        return entry is not None and entry.generation == generation
+
+    def _redraw(self, name):
+        entry = self._pending.get(name)
+        if entry is None:
+            return
+        entry.timer.stop()
+
+        parameters = self._parameters(entry.obj)
+        if parameters == entry.built:
+            self.skipped += 1
+            entry.edited = None
+            entry.edits = 0
+            return
+        entry.built = parameters
+
+        proxy = entry.obj.Proxy
+        handler = proxy.shapeHandler(entry.obj, draft=True) if hasattr(proxy, 'shapeHandler') else None
+        if handler is None:
+            proxy.execute(entry.obj)
+            self._record(entry)
+            return
+
+        entry.generation = self._nextGeneration()
+        if not handler.isValidShape():
+            entry.edited = None
+            entry.edits = 0
+            return
+        self._builds.submit(self._build, name, entry.generation, handler)
+
+    def _build(self, name, generation, handler):
+        # Runs on the worker thread
+        if not self._current(name, generation):
+            return
+
+        shape = None
+        failed = False
+        details = None
+        try:
+            shape = handler.build()
+        except BUILD_ERRORS:
+            failed = True
+        except Exception:
+            # Anything else is a bug in the handler. The future is never read, so it's
+            # reported here rather than being lost with the preview
+            failed = True
+            details = traceback.format_exc()
+        self.shapeBuilt.emit((name, generation, handler, shape, failed, details))
+
+    def _assign(self, result):
+        name, generation, handler, shape, failed, details = result
+        if details is not None:
+            FreeCAD.Console.PrintError("Preview of %s failed\n%s" % (name, details))
+        if not self._current(name, generation):
+            self.superseded += 1
+            return
+
+        if failed:
+            handler._invalidShape()
+        elif shape is not None:
+            handler.assign(shape)
+        self._record(self._pending[name])
+
+    def _record(self, entry):
+        if entry.edited is None:
+            # Shown by an earlier preview
+            return
+        latency = time.perf_counter() - entry.edited
+        self.previews += 1
+        self.lastLatency = latency
+        self.totalLatency += latency
+        self.maxLatency = max(self.maxLatency, latency)
+        FreeCAD.Console.PrintLog("Preview of %s: %d edits, %.1f ms from edit to preview\n" % (entry.obj.Label, entry.edits, latency * 1000.0))
+        entry.edited = None
+        entry.edits = 0
+
+    def meanLatency(self):
+        if self.previews == 0:
+            return 0.0
+        return self.totalLatency / self.previews
+
+    def statistics(self):
+        return {
+            "previews" : self.previews,
+            "coalesced" : self.coalesced,
+            "skipped" : self.skipped,
+            "superseded" : self.superseded,
+            "last" : self.lastLatency,
+            "mean" : self.meanLatency(),
+            "max" : self.maxLatency
+        }
+
+_scheduler = None
+
+def previewScheduler():
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = PreviewScheduler()
+    return _scheduler
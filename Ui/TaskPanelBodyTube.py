@@ -34,6 +34,7 @@ from PySide import QtGui
 from PySide2.QtWidgets import QDialog, QGridLayout
 
 from Ui.TaskPanelDatabase import TaskPanelDatabase
+from Ui.PreviewScheduler import previewScheduler
 from App.Constants import COMPONENT_TYPE_BODYTUBE
 
 from App.Utilities import _valueWithUnits
@@ -102,7 +103,7 @@ class TaskPanelBodyTube:
         self.update()
         
         if mode == 0: # fresh created
-            self._obj.Proxy.execute(self._obj)  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
         
     def transferTo(self):
@@ -120,21 +121,21 @@ class TaskPanelBodyTube:
     def onIdChanged(self, value):
         try:
             self._obj.InnerDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onOdChanged(self, value):
         try:
             self._obj.OuterDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onLengthChanged(self, value):
         try:
             self._obj.Length = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -146,7 +147,10 @@ class TaskPanelBodyTube:
         self._obj.Length = _valueWithUnits(result["length"], result["length_units"])
 
         self.update()
-        self._obj.Proxy.execute(self._obj) 
+        self.redraw()
+        
+    def redraw(self):
+        previewScheduler().schedule(self._obj)
         
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
@@ -155,19 +159,21 @@ class TaskPanelBodyTube:
         if button == QtGui.QDialogButtonBox.Apply:
             #print "Apply"
             self.transferTo()
-            self._obj.Proxy.execute(self._obj) 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
@@ -34,6 +34,7 @@ from PySide2.QtWidgets import QDialog, QGridLayout
 from DraftTools import translate
 
 from Ui.TaskPanelDatabase import TaskPanelDatabase
+from Ui.PreviewScheduler import previewScheduler
 from App.Constants import COMPONENT_TYPE_BULKHEAD, COMPONENT_TYPE_CENTERINGRING
 
 from App.Utilities import _valueWithUnits
@@ -242,7 +243,7 @@ class TaskPanelBulkhead:
         self.update()
         
         if mode == 0: # fresh created
-            self._obj.Proxy.execute(self._obj)  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
         
     def transferTo(self):
@@ -296,21 +297,21 @@ class TaskPanelBulkhead:
     def onDiameter(self, value):
         try:
             self._obj.Diameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onThickness(self, value):
         try:
             self._obj.Thickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onCenterDiameter(self, value):
         try:
             self._obj.CenterDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -322,19 +323,19 @@ class TaskPanelBulkhead:
         self._obj.Step = self._bulkForm.stepCheckbox.isChecked()
         self._setStepState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onStepDiameter(self, value):
         try:
             self._obj.StepDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onStepThickness(self, value):
         try:
             self._obj.StepThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -348,30 +349,30 @@ class TaskPanelBulkhead:
         self._obj.Holes = self._bulkForm.holeCheckbox.isChecked()
         self._setHoleState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onHoleDiameter(self, value):
         try:
             self._obj.HoleDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onHoleCenter(self, value):
         try:
             self._obj.HoleCenter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onHoleCount(self, value):
         self._obj.HoleCount = int(value)
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onHoleOffset(self, value):
         try:
             self._obj.HoleOffset = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -383,19 +384,19 @@ class TaskPanelBulkhead:
         self._obj.Notched = self._bulkForm.notchedCheckbox.isChecked()
         self._setNotchedState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onNotchWidth(self, value):
         try:
             self._obj.NotchWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onNotchHeight(self, value):
         try:
             self._obj.NotchHeight = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -423,7 +424,10 @@ class TaskPanelBulkhead:
             self._obj.NotchHeight = 0.0
         
         self.update()
-        self._obj.Proxy.execute(self._obj) 
+        self.redraw()
+        
+    def redraw(self):
+        previewScheduler().schedule(self._obj)
         
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
@@ -432,19 +436,21 @@ class TaskPanelBulkhead:
         if button == QtGui.QDialogButtonBox.Apply:
             #print "Apply"
             self.transferTo()
-            self._obj.Proxy.execute(self._obj) 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
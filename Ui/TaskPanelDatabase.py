@@ -153,6 +153,11 @@ class TaskPanelDatabase(QObject):
         self._obj.PartNumber = result["part_number"]
         self._obj.Description = result["description"]
         self._obj.Material = result["material_name"]
+        if hasattr(self._obj, 'ManufacturerMass'):
+            if result["mass"] > 0.0:
+                self._obj.ManufacturerMass = FreeCAD.Units.Quantity(str(result["mass"]) + str(result["mass_units"])).getValueAs('kg').Value
+            else:
+                self._obj.ManufacturerMass = 0.0
 
         # self._obj.NoseType = str(result["shape"])
         # self._obj.NoseStyle = str(result["style"])
@@ -29,7 +29,7 @@ import FreeCAD
 import FreeCADGui
 
 from PySide import QtGui, QtCore
-from PySide.QtCore import QObject, Signal
+from PySide.QtCore import QObject
 from PySide2.QtWidgets import QDialog, QGridLayout, QVBoxLayout, QSizePolicy
 import math
 
@@ -40,21 +40,28 @@ from App.Constants import FIN_CROSS_SAME, FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE
 
 from App.Utilities import _err, _toFloat
+from Ui.PreviewScheduler import previewScheduler
 
 class _FinDialog(QDialog):
 
-    def __init__(self, sketch, parent=None):
+    def __init__(self, sketch, finCanPanel, parent=None):
         super(_FinDialog, self).__init__(parent)
 
         # define our window
         self.setGeometry(250, 250, 400, 350)
-        self.setWindowTitle(translate('Rocket', "Fin Parameter"))
+        if finCanPanel:
+            self.setWindowTitle(translate('Rocket', "Fin Can Parameter"))
+        else:
+            self.setWindowTitle(translate('Rocket', "Fin Parameter"))
 
         self.tabWidget = QtGui.QTabWidget()
         self.tabGeneral = QtGui.QWidget()
         self.tabTtw = QtGui.QWidget()
         self.tabWidget.addTab(self.tabGeneral, translate('Rocket', "General"))
         self.tabWidget.addTab(self.tabTtw, translate('Rocket', "Fin Tabs"))
+        if finCanPanel:
+            self.tabCan = QtGui.QWidget()
+            self.tabWidget.addTab(self.tabCan, translate('Rocket', "Fin Can"))
 
         layout = QVBoxLayout()
         layout.addWidget(self.tabWidget)
@@ -62,6 +69,8 @@ class _FinDialog(QDialog):
 
         self.setTabGeneral(sketch)
         self.setTabTtw()
+        if finCanPanel:
+            self.setTabCan()
 
     def setTabGeneral(self, sketch):
 
@@ -325,16 +334,78 @@ class _FinDialog(QDialog):
 
         self.tabTtw.setLayout(layout)
 
-class TaskPanelFin(QObject):
+    def setTabCan(self):
+
+        ui = FreeCADGui.UiLoader()
+
+        self.canFinCountLabel = QtGui.QLabel(translate('Rocket', "Fin Count"), self)
+
+        self.canFinCountSpinBox = QtGui.QSpinBox(self)
+        self.canFinCountSpinBox.setFixedWidth(80)
+        self.canFinCountSpinBox.setMinimum(1)
+        self.canFinCountSpinBox.setMaximum(10000)
+
+        self.canInnerDiameterLabel = QtGui.QLabel(translate('Rocket', "Inner Diameter"), self)
+
+        self.canInnerDiameterInput = ui.createWidget("Gui::InputField")
+        self.canInnerDiameterInput.unit = 'mm'
+        self.canInnerDiameterInput.setFixedWidth(80)
 
-    redrawRequired = Signal()   # Allows for async redraws to allow for longer processing times
+        self.canOuterDiameterLabel = QtGui.QLabel(translate('Rocket', "Outer Diameter"), self)
+
+        self.canOuterDiameterInput = ui.createWidget("Gui::InputField")
+        self.canOuterDiameterInput.unit = 'mm'
+        self.canOuterDiameterInput.setFixedWidth(80)
+
+        self.canLengthLabel = QtGui.QLabel(translate('Rocket', "Length"), self)
+
+        self.canLengthInput = ui.createWidget("Gui::InputField")
+        self.canLengthInput.unit = 'mm'
+        self.canLengthInput.setFixedWidth(80)
+
+        self.canLeadingEdgeOffsetLabel = QtGui.QLabel(translate('Rocket', "Leading Edge Offset"), self)
+
+        self.canLeadingEdgeOffsetInput = ui.createWidget("Gui::InputField")
+        self.canLeadingEdgeOffsetInput.unit = 'mm'
+        self.canLeadingEdgeOffsetInput.setFixedWidth(80)
+
+        row = 0
+        grid = QGridLayout()
+
+        grid.addWidget(self.canFinCountLabel, row, 0)
+        grid.addWidget(self.canFinCountSpinBox, row, 1)
+        row += 1
+
+        grid.addWidget(self.canInnerDiameterLabel, row, 0)
+        grid.addWidget(self.canInnerDiameterInput, row, 1)
+        row += 1
+
+        grid.addWidget(self.canOuterDiameterLabel, row, 0)
+        grid.addWidget(self.canOuterDiameterInput, row, 1)
+        row += 1
+
+        grid.addWidget(self.canLengthLabel, row, 0)
+        grid.addWidget(self.canLengthInput, row, 1)
+        row += 1
+
+        grid.addWidget(self.canLeadingEdgeOffsetLabel, row, 0)
+        grid.addWidget(self.canLeadingEdgeOffsetInput, row, 1)
+
+        layout = QVBoxLayout()
+        layout.addItem(grid)
+        layout.addItem(QtGui.QSpacerItem(0,0, QSizePolicy.Expanding, QSizePolicy.Expanding))
 
-    def __init__(self,obj,mode):
+        self.tabCan.setLayout(layout)
+
+class TaskPanelFin(QObject):
+
+    def __init__(self, obj, finCanPanel, mode):
         super().__init__()
 
         self._obj = obj
+        self._finCanPanel = finCanPanel
         
-        self._finForm = _FinDialog(self._obj.FinType == FIN_TYPE_SKETCH)
+        self._finForm = _FinDialog(self._obj.FinType == FIN_TYPE_SKETCH, self._finCanPanel)
 
         self.form = [self._finForm]
         self._finForm.setWindowIcon(QtGui.QIcon(FreeCAD.getUserAppDataDir() + "Mod/Rocket/Resources/icons/Rocket_Fin.svg"))
@@ -365,13 +436,17 @@ class TaskPanelFin(QObject):
         self._finForm.ttwHeightInput.textEdited.connect(self.onTTWHeight)
         self._finForm.ttwThicknessInput.textEdited.connect(self.onTTWThickness)
 
-        self._redrawPending = False
-        self.redrawRequired.connect(self.onRedraw, QtCore.Qt.QueuedConnection)
-        
+        if self._finCanPanel:
+            self._finForm.canFinCountSpinBox.valueChanged.connect(self.onCanFinCount)
+            self._finForm.canInnerDiameterInput.textEdited.connect(self.onCanInnerDiameter)
+            self._finForm.canOuterDiameterInput.textEdited.connect(self.onCanOuterDiameter)
+            self._finForm.canLengthInput.textEdited.connect(self.onCanLength)
+            self._finForm.canLeadingEdgeOffsetInput.textEdited.connect(self.onCanLeadingEdgeOffset)
+
         self.update()
         
         if mode == 0: # fresh created
-            self.redraw()  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
         
     def transferTo(self):
@@ -402,6 +477,13 @@ class TaskPanelFin(QObject):
         self._obj.TtwHeight = self._finForm.ttwHeightInput.text()
         self._obj.TtwThickness = self._finForm.ttwThicknessInput.text()
 
+        if self._finCanPanel:
+            self._obj.FinCount = self._finForm.canFinCountSpinBox.value()
+            self._obj.InnerDiameter = self._finForm.canInnerDiameterInput.text()
+            self._obj.OuterDiameter = self._finForm.canOuterDiameterInput.text()
+            self._obj.Length = self._finForm.canLengthInput.text()
+            self._obj.LeadingEdgeOffset = self._finForm.canLeadingEdgeOffsetInput.text()
+
     def transferFrom(self):
         "Transfer from the object to the dialog"
         self._finForm.finTypesCombo.setCurrentText(self._obj.FinType)
@@ -430,6 +512,13 @@ class TaskPanelFin(QObject):
         self._finForm.ttwHeightInput.setText(self._obj.TtwHeight.UserString)
         self._finForm.ttwThicknessInput.setText(self._obj.TtwThickness.UserString)
 
+        if self._finCanPanel:
+            self._finForm.canFinCountSpinBox.setValue(self._obj.FinCount)
+            self._finForm.canInnerDiameterInput.setText(self._obj.InnerDiameter.UserString)
+            self._finForm.canOuterDiameterInput.setText(self._obj.OuterDiameter.UserString)
+            self._finForm.canLengthInput.setText(self._obj.Length.UserString)
+            self._finForm.canLeadingEdgeOffsetInput.setText(self._obj.LeadingEdgeOffset.UserString)
+
         self._enableRootLengths()
         self._enableFinTypes() # This calls _enableTipLengths()
         self._enableRootPercent()
@@ -438,9 +527,7 @@ class TaskPanelFin(QObject):
         self._setTtwState()
 
     def redraw(self):
-        if not self._redrawPending:
-            self._redrawPending = True
-            self.redrawRequired.emit()
+        previewScheduler().schedule(self._obj)
 
     def _enableFinTypes(self):
         if self._obj.FinType == FIN_TYPE_TRAPEZOID:
@@ -786,10 +873,38 @@ class TaskPanelFin(QObject):
         except ValueError:
             pass
 
-    def onRedraw(self):
-        self._obj.Proxy.execute(self._obj)
-        self._redrawPending = False
+    def onCanFinCount(self, value):
+        self._obj.FinCount = value
+        self.redraw()
+        
+    def onCanInnerDiameter(self, value):
+        try:
+            self._obj.InnerDiameter = FreeCAD.Units.Quantity(value).Value
+            self.redraw()
+        except ValueError:
+            pass
+        
+    def onCanOuterDiameter(self, value):
+        try:
+            self._obj.OuterDiameter = FreeCAD.Units.Quantity(value).Value
+            self.redraw()
+        except ValueError:
+            pass
+        
+    def onCanLength(self, value):
+        try:
+            self._obj.Length = FreeCAD.Units.Quantity(value).Value
+            self.redraw()
+        except ValueError:
+            pass
         
+    def onCanLeadingEdgeOffset(self, value):
+        try:
+            self._obj.LeadingEdgeOffset = FreeCAD.Units.Quantity(value).Value
+            self.redraw()
+        except ValueError:
+            pass
+
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
 
@@ -797,19 +912,21 @@ class TaskPanelFin(QObject):
         if button == QtGui.QDialogButtonBox.Apply:
             #print "Apply"
             self.transferTo()
-            self.redraw() 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
@@ -34,6 +34,7 @@ from PySide2.QtWidgets import QDialog, QGridLayout, QVBoxLayout, QSizePolicy
 from DraftTools import translate
 
 from Ui.TaskPanelDatabase import TaskPanelDatabase
+from Ui.PreviewScheduler import previewScheduler
 from App.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
 from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID
 from App.Constants import COMPONENT_TYPE_NOSECONE
@@ -257,7 +258,7 @@ class TaskPanelNoseCone:
         self.update()
         
         if mode == 0: # fresh created
-            self._obj.Proxy.execute(self._obj)  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
         
     def transferTo(self):
@@ -344,7 +345,7 @@ class TaskPanelNoseCone:
         self._obj.NoseType = value
         self._setTypeState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
 
     def _setStyleState(self):
         value = self._obj.NoseStyle
@@ -363,26 +364,26 @@ class TaskPanelNoseCone:
         self._obj.NoseStyle = value
         self._setStyleState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onLengthChanged(self, value):
         try:
             self._obj.Length = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onBluntedChanged(self, value):
         try:
             self._obj.BluntedDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onDiameterChanged(self, value):
         try:
             self._obj.Diameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
 
             self._setLengthState() # Update for spherical noses
         except ValueError:
@@ -391,18 +392,18 @@ class TaskPanelNoseCone:
     def onThicknessChanged(self, value):
         try:
             self._obj.Thickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onCoefficientChanged(self, value):
         self._obj.Coefficient = _toFloat(value)
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onOgiveDiameterChanged(self, value):
         try:
             self._obj.OgiveDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
@@ -425,26 +426,26 @@ class TaskPanelNoseCone:
         self._obj.Shoulder = self._noseForm.shoulderCheckbox.isChecked()
         self._setShoulderState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onShoulderDiameterChanged(self, value):
         try:
             self._obj.ShoulderDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onShoulderLengthChanged(self, value):
         try:
             self._obj.ShoulderLength = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onShoulderThicknessChanged(self, value):
         try:
             self._obj.ShoulderThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -463,7 +464,10 @@ class TaskPanelNoseCone:
         self._obj.Shoulder = (self._obj.ShoulderDiameter > 0.0) and (self._obj.ShoulderLength >= 0)
         self._obj.ShoulderThickness = self._obj.Thickness
         self.update()
-        self._obj.Proxy.execute(self._obj) 
+        self.redraw()
+        
+    def redraw(self):
+        previewScheduler().schedule(self._obj)
         
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
@@ -471,19 +475,21 @@ class TaskPanelNoseCone:
     def clicked(self,button):
         if button == QtGui.QDialogButtonBox.Apply:
             self.transferTo()
-            self._obj.Proxy.execute(self._obj) 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
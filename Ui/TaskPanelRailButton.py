@@ -41,6 +41,7 @@ from App.Constants import FASTENER_PRESET_6_HEAD, FASTENER_PRESET_6_SHANK
 from App.Constants import FASTENER_PRESET_8_HEAD, FASTENER_PRESET_8_SHANK
 from App.Constants import FASTENER_PRESET_10_HEAD, FASTENER_PRESET_10_SHANK
 from App.Constants import FASTENER_PRESET_1_4_HEAD, FASTENER_PRESET_1_4_SHANK
+from Ui.PreviewScheduler import previewScheduler
 
 
 
@@ -244,7 +245,7 @@ class TaskPanelRailButton:
         self.update()
         
         if mode == 0: # fresh created
-            self._obj.Proxy.execute(self._obj)  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
         
     def transferTo(self):
@@ -301,53 +302,53 @@ class TaskPanelRailButton:
         self._obj.RailButtonType = value
         self._setTypeState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onOd(self, value):
         try:
             self._obj.OuterDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onId(self, value):
         try:
             self._obj.InnerDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onTopThickness(self, value):
         try:
             self._obj.TopThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onBaseThickness(self, value):
         try:
             self._obj.BaseThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onThickness(self, value):
         try:
             self._obj.Thickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onLength(self, value):
         try:
             self._obj.Length = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
     def onFastener(self, value):
         self._obj.Fastener = value
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
 
     def _setFasteners(self):
         self._btForm.countersinkTypeCombo.setCurrentText(self._obj.CountersinkAngle)
@@ -357,13 +358,13 @@ class TaskPanelRailButton:
     def onCountersink(self, value):
         self._obj.CountersinkAngle = value
         self._btForm.fastenerPresetCombo.setCurrentText("")
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
     
     def onHeadDiameter(self, value):
         try:
             self._obj.HeadDiameter = FreeCAD.Units.Quantity(value).Value
             self._btForm.fastenerPresetCombo.setCurrentText("")
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
     
@@ -371,7 +372,7 @@ class TaskPanelRailButton:
         try:
             self._obj.ShankDiameter = FreeCAD.Units.Quantity(value).Value
             self._btForm.fastenerPresetCombo.setCurrentText("")
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
@@ -381,7 +382,7 @@ class TaskPanelRailButton:
             self._obj.HeadDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_6_HEAD).Value
             self._obj.ShankDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_6_SHANK).Value
             self._setFasteners()
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
@@ -391,7 +392,7 @@ class TaskPanelRailButton:
             self._obj.HeadDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_8_HEAD).Value
             self._obj.ShankDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_8_SHANK).Value
             self._setFasteners()
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
@@ -401,7 +402,7 @@ class TaskPanelRailButton:
             self._obj.HeadDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_10_HEAD).Value
             self._obj.ShankDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_10_SHANK).Value
             self._setFasteners()
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
@@ -411,7 +412,7 @@ class TaskPanelRailButton:
             self._obj.HeadDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_1_4_HEAD).Value
             self._obj.ShankDiameter = FreeCAD.Units.Quantity(FASTENER_PRESET_1_4_SHANK).Value
             self._setFasteners()
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
     
@@ -427,17 +428,20 @@ class TaskPanelRailButton:
 
     def onFillet(self, value):
         self._obj.FilletedTop = value
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
     
     def onFilletRadius(self, value):
         try:
             self._obj.FilletRadius = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
     
     def onLocation(self):
-        self._obj.Proxy.execute(self._obj) 
+        self.redraw()
+        
+    def redraw(self):
+        previewScheduler().schedule(self._obj)
         
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
@@ -446,19 +450,21 @@ class TaskPanelRailButton:
         if button == QtGui.QDialogButtonBox.Apply:
             #print "Apply"
             self.transferTo()
-            self._obj.Proxy.execute(self._obj) 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
@@ -34,6 +34,7 @@ from PySide import QtGui, QtCore
 from PySide2.QtWidgets import QDialog, QGridLayout, QVBoxLayout, QSizePolicy
 
 from App.Constants import RAIL_GUIDE_BASE_FLAT, RAIL_GUIDE_BASE_CONFORMAL, RAIL_GUIDE_BASE_V
+from Ui.PreviewScheduler import previewScheduler
 
 class _RailGuideDialog(QDialog):
 
@@ -271,7 +272,7 @@ class TaskPanelRailGuide:
         self.update()
         
         if mode == 0: # fresh created
-            self._obj.Proxy.execute(self._obj)  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
   
     def transferTo(self):
@@ -346,61 +347,61 @@ class TaskPanelRailGuide:
         self._obj.RailGuideBaseType = value
         self._setTypeState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
 
     def onTopWidth(self, value):
         try:
             self._obj.TopWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onMiddleWidth(self, value):
         try:
             self._obj.MiddleWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onBaseWidth(self, value):
         try:
             self._obj.BaseWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onTopThickness(self, value):
         try:
             self._obj.TopThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onBaseThickness(self, value):
         try:
             self._obj.BaseThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onThickness(self, value):
         try:
             self._obj.Thickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onLength(self, value):
         try:
             self._obj.Length = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onDiameter(self, value):
         try:
             self._obj.Diameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -412,12 +413,12 @@ class TaskPanelRailGuide:
         self._obj.AutoDiameter = value
         self._setAutoDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onVAngle(self, value):
         try:
             self._obj.VAngle = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -429,12 +430,12 @@ class TaskPanelRailGuide:
         self._obj.ForwardSweep = value
         self._setForwardSweepState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onForwardSweepAngle(self, value):
         try:
             self._obj.ForwardSweepAngle = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -446,12 +447,12 @@ class TaskPanelRailGuide:
         self._obj.AftSweep = value
         self._setAftSweepState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onAftSweepAngle(self, value):
         try:
             self._obj.AftSweepAngle = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -459,24 +460,27 @@ class TaskPanelRailGuide:
         self._obj.Notch = value
         # self._setAftSweepState()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onNotchWidth(self, value):
         try:
             self._obj.NotchWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onNotchDepth(self, value):
         try:
             self._obj.NotchDepth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
 
     def onLocation(self):
-        self._obj.Proxy.execute(self._obj) 
+        self.redraw()
+        
+    def redraw(self):
+        previewScheduler().schedule(self._obj)
         
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
@@ -485,19 +489,21 @@ class TaskPanelRailGuide:
         if button == QtGui.QDialogButtonBox.Apply:
             #print "Apply"
             self.transferTo()
-            self._obj.Proxy.execute(self._obj) 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
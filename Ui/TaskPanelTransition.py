@@ -34,6 +34,7 @@ from PySide2.QtWidgets import QDialog, QGridLayout, QVBoxLayout, QSizePolicy
 from DraftTools import translate
 
 from Ui.TaskPanelDatabase import TaskPanelDatabase
+from Ui.PreviewScheduler import previewScheduler
 from App.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
 from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
 from App.Constants import COMPONENT_TYPE_TRANSITION
@@ -291,7 +292,7 @@ class TaskPanelTransition:
         self.update()
         
         if mode == 0: # fresh created
-            self._obj.Proxy.execute(self._obj)  # calculate once 
+            previewScheduler().redraw(self._obj)  # calculate once 
             FreeCAD.Gui.SendMsgToActiveView("ViewFit")
         
     def transferTo(self):
@@ -373,7 +374,7 @@ class TaskPanelTransition:
         self._showTransitionType()
         self._showClippable()
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def _showTransitionStyle(self):
         value = self._obj.TransitionStyle
@@ -408,50 +409,50 @@ class TaskPanelTransition:
         self._obj.TransitionStyle = value
 
         self._showTransitionStyle()
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onLength(self, value):
         try:
             self._obj.Length = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onForeDiameter(self, value):
         try:
             self._obj.ForeDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onAftDiameter(self, value):
         try:
             self._obj.AftDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onCoreDiameter(self, value):
         try:
             self._obj.CoreDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onThickness(self, value):
         try:
             self._obj.Thickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onCoefficient(self, value):
         self._obj.Coefficient = _toFloat(value)
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onClipped(self, value):
         self._obj.Clipped = self._tranForm.clippedCheckbox.isChecked()
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onForeShoulder(self, value):
         self._obj.ForeShoulder = self._tranForm.foreGroup.isChecked()
@@ -469,26 +470,26 @@ class TaskPanelTransition:
             self._tranForm.foreShoulderLengthInput.setEnabled(False)
             self._tranForm.foreShoulderThicknessInput.setEnabled(False)
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onForeShoulderDiameter(self, value):
         try:
             self._obj.ForeShoulderDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onForeShoulderLength(self, value):
         try:
             self._obj.ForeShoulderLength = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onForeShoulderThickness(self, value):
         try:
             self._obj.ForeShoulderThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -508,26 +509,26 @@ class TaskPanelTransition:
             self._tranForm.aftShoulderLengthInput.setEnabled(False)
             self._tranForm.aftShoulderThicknessInput.setEnabled(False)
 
-        self._obj.Proxy.execute(self._obj)
+        self.redraw()
         
     def onAftShoulderDiameter(self, value):
         try:
             self._obj.AftShoulderDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onAftShoulderLength(self, value):
         try:
             self._obj.AftShoulderLength = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
     def onAftShoulderThickness(self, value):
         try:
             self._obj.AftShoulderThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self.redraw()
         except ValueError:
             pass
         
@@ -554,7 +555,10 @@ class TaskPanelTransition:
         self._obj.AftShoulder = (self._obj.AftShoulderDiameter > 0.0) and (self._obj.AftShoulderLength >= 0)
 
         self.update()
-        self._obj.Proxy.execute(self._obj) 
+        self.redraw()
+        
+    def redraw(self):
+        previewScheduler().schedule(self._obj)
         
     def getStandardButtons(self):
         return int(QtGui.QDialogButtonBox.Ok) | int(QtGui.QDialogButtonBox.Cancel)| int(QtGui.QDialogButtonBox.Apply)
@@ -563,19 +567,21 @@ class TaskPanelTransition:
         if button == QtGui.QDialogButtonBox.Apply:
             #print "Apply"
             self.transferTo()
-            self._obj.Proxy.execute(self._obj) 
+            previewScheduler().redraw(self._obj)
         
     def update(self):
         'fills the widgets'
         self.transferFrom()
                 
     def accept(self):
+        previewScheduler().cancel(self._obj)
         self.transferTo()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
         
                     
     def reject(self):
+        previewScheduler().cancel(self._obj)
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
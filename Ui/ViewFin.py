@@ -40,17 +40,12 @@ class ViewProviderFin(ViewProvider):
 
     def setEdit(self, vobj, mode):
         if mode == 0:
-            taskd = TaskPanelFin(self.Object,mode)
+            taskd = TaskPanelFin(self.Object, False, mode)
             taskd.obj = vobj.Object
             taskd.update()
             FreeCADGui.Control.showDialog(taskd)
             return True
 
-    def unsetEdit(self, vobj, mode):
-        if mode == 0:
-            FreeCADGui.Control.closeDialog()
-            return
-
     def claimChildren(self):
         if hasattr(self.Object, "Profile"):
             return [self.Object.Profile]
@@ -48,11 +48,6 @@ class ViewProviderRailGuide(ViewProvider):
             FreeCADGui.Control.showDialog(taskd)
             return True
 
-    def unsetEdit(self, vobj, mode):
-        if mode == 0:
-            FreeCADGui.Control.closeDialog()
-            return
-
 class ViewProviderRailButton(ViewProviderRailGuide):
         
     def getIcon(self):
@@ -45,8 +45,3 @@ class ViewProviderNoseCone(ViewProvider):
             taskd.update()
             FreeCADGui.Control.showDialog(taskd)
             return True
-
-    def unsetEdit(self, vobj, mode):
-        if mode == 0:
-            FreeCADGui.Control.closeDialog()
-            return
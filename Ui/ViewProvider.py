@@ -24,8 +24,24 @@ __title__ = "FreeCAD View Provider"
 __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
     
+import FreeCADGui
+
 from DraftTools import translate
 
+from PySide import QtCore
+
+from App.ShapeComponent import MASS_PROPERTIES
+
+# Coarse tessellation used while the component parameters are being edited
+DRAFT_DEVIATION = 2.0               # Percent of the shape size
+DRAFT_ANGULAR_DEFLECTION = 45.0     # Degrees
+
+# Time without edits before the fine tessellation is restored, in ms
+FINE_DETAIL_DELAY = 750
+
+# Changes to these properties don't come from editing the component parameters
+_NON_PARAMETERS = ['Shape', 'Placement', 'Label', 'Label2', 'Visibility', 'GeometryHash'] + MASS_PROPERTIES
+
 class ViewProvider:
 
     def __init__(self, vobj):
@@ -35,6 +51,43 @@ class ViewProvider:
         self.ViewObject = vobj
         self.Object = vobj.Object
 
+        self._fineDetail = None # The Deviation and AngularDeflection replaced by the draft tessellation
+        self._fineDetailTimer = None
+
+    def updateData(self, obj, prop):
+        # Interactive edits are tessellated coarsely so the panel stays responsive
+        if prop not in _NON_PARAMETERS and self._isEditing():
+            self.draftDetail()
+
+    def _isEditing(self):
+        inEdit = self.ViewObject.Document.getInEdit()
+        return inEdit is not None and inEdit.Object == self.Object
+
+    def draftDetail(self):
+        """ Switch to the coarse tessellation until there have been no edits for FINE_DETAIL_DELAY """
+        vobj = self.ViewObject
+        if not hasattr(vobj, 'Deviation'):
+            return
+
+        if self._fineDetail is None:
+            self._fineDetail = (vobj.Deviation, vobj.AngularDeflection)
+            vobj.Deviation = max(DRAFT_DEVIATION, vobj.Deviation)
+            vobj.AngularDeflection = max(DRAFT_ANGULAR_DEFLECTION, vobj.AngularDeflection)
+
+        if self._fineDetailTimer is None:
+            self._fineDetailTimer = QtCore.QTimer()
+            self._fineDetailTimer.setSingleShot(True)
+            self._fineDetailTimer.timeout.connect(self.fineDetail)
+        self._fineDetailTimer.start(FINE_DETAIL_DELAY)
+
+    def fineDetail(self):
+        """ Restore the tessellation in use before editing """
+        if self._fineDetailTimer is not None:
+            self._fineDetailTimer.stop()
+        if self._fineDetail is not None:
+            self.ViewObject.Deviation, self.ViewObject.AngularDeflection = self._fineDetail
+            self._fineDetail = None
+
     def setupContextMenu(self, viewObject, menu):
         action = menu.addAction(translate('Rocket', 'Edit %1').replace('%1', viewObject.Object.Label))
         action.triggered.connect(lambda: self.startDefaultEditMode(viewObject))
@@ -47,6 +100,11 @@ class ViewProvider:
             document.openTransaction(text)
         viewObject.Document.setEdit(viewObject.Object, 0)
 
+    def unsetEdit(self, vobj, mode):
+        if mode == 0:
+            self.fineDetail()
+            FreeCADGui.Control.closeDialog()
+
     def __getstate__(self):
         return None
 
@@ -0,0 +1,64 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Bulkhead hole pattern regeneration timing
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/BenchmarkBulkhead.py
+"""
+
+__title__ = "FreeCAD Bulkhead Benchmark"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import time
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+import FreeCAD
+
+from App.ShapeBulkhead import ShapeBulkhead
+
+REPEAT = 3
+
+doc = FreeCAD.newDocument("BulkheadBenchmark")
+obj = doc.addObject("Part::FeaturePython", "Bulkhead")
+ShapeBulkhead(obj)
+obj.Diameter = 100.0
+obj.Step = True
+obj.StepDiameter = 95.0
+obj.Holes = True
+obj.HoleDiameter = 5.0
+obj.HoleCenter = 40.0
+
+print("%6s %12s %12s" % ("Holes", "Time (s)", "Volume"))
+for count in [1, 3, 6, 12, 24]:
+    obj.HoleCount = count
+
+    # Build through the handler. A recompute would skip the unchanged shape or read it from the
+    # shape cache
+    start = time.perf_counter()
+    for i in range(REPEAT):
+        shape = obj.Proxy.shapeHandler(obj).build()
+    print("%6d %12.4f %12.2f" % (count, (time.perf_counter() - start) / REPEAT, shape.Volume))
+
+FreeCAD.closeDocument(doc.Name)
@@ -0,0 +1,81 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Elliptical fin regeneration timing
+
+Compares the adaptive section spacing against the original fixed 100 section loft
+for each cross section. Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/BenchmarkEllipseFin.py
+"""
+
+__title__ = "FreeCAD Elliptical Fin Benchmark"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import time
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+import FreeCAD
+
+from App.Constants import FIN_TYPE_ELLIPSE
+from App.Constants import FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, \
+    FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LETE
+
+from App.ShapeFin import ShapeFin
+from App.FinEllipseShapeHandler import FinEllipseShapeHandler, CROSS_SECTIONS
+
+REPEAT = 3
+
+class _FixedSectionHandler(FinEllipseShapeHandler):
+    # The original section spacing, evenly spaced in height
+    def _sectionHeights(self):
+        height = float(self._parameters.Height)
+        return [i * height / float(CROSS_SECTIONS) for i in range(CROSS_SECTIONS)]
+
+def _time(handler):
+    start = time.perf_counter()
+    for i in range(REPEAT):
+        handler.draw()
+    return (time.perf_counter() - start) / REPEAT
+
+doc = FreeCAD.newDocument("EllipseFinBenchmark")
+obj = doc.addObject("Part::FeaturePython", "Fin")
+ShapeFin(obj)
+obj.FinType = FIN_TYPE_ELLIPSE
+
+print("%10s %9s %12s %12s %10s %12s" % ("Section", "Sections", "Loft (s)", "Adaptive (s)", "Speedup", "Volume err"))
+for crossSection in [FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE,
+        FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LETE]:
+    obj.RootCrossSection = crossSection
+
+    fixed = _time(_FixedSectionHandler(obj))
+    fixedVolume = obj.Shape.Volume
+
+    handler = FinEllipseShapeHandler(obj)
+    adaptive = _time(handler)
+    volume = obj.Shape.Volume
+
+    print("%10s %9d %12.4f %12.4f %10.1f %11.3f%%" % (crossSection, handler._crossSections(), fixed, adaptive,
+        fixed / adaptive, 100.0 * abs(volume - fixedVolume) / fixedVolume))
+
+FreeCAD.closeDocument(doc.Name)
@@ -0,0 +1,68 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Fin can regeneration timing
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/BenchmarkFinCan.py
+"""
+
+__title__ = "FreeCAD Fin Can Benchmark"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import time
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+import FreeCAD
+
+from App.ShapeFinCan import ShapeFinCan
+from App.FinCanShapeHandler import clearFinCache
+
+REPEAT = 3
+
+def _time(obj):
+    # Build through the handler. A recompute would skip the unchanged shape or read it from the
+    # shape cache
+    start = time.perf_counter()
+    obj.Proxy.shapeHandler(obj).build()
+    return time.perf_counter() - start
+
+doc = FreeCAD.newDocument("FinCanBenchmark")
+obj = doc.addObject("Part::FeaturePython", "FinCan")
+ShapeFinCan(obj)
+
+print("%6s %12s %12s %14s" % ("Fins", "Cold (s)", "Cached (s)", "Cached/fin (s)"))
+for count in range(3, 13):
+    obj.FinCount = count
+    cold = 0.0
+    cached = 0.0
+    for i in range(REPEAT):
+        clearFinCache()
+        cold += _time(obj)
+        cached += _time(obj)
+    cold /= REPEAT
+    cached /= REPEAT
+    print("%6d %12.4f %12.4f %14.4f" % (count, cold, cached, cached / count))
+
+FreeCAD.closeDocument(doc.Name)
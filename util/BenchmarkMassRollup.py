@@ -0,0 +1,76 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Mass rollup timing for a single part change
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/BenchmarkMassRollup.py
+"""
+
+__title__ = "FreeCAD Mass Rollup Benchmark"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import time
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+import FreeCAD
+
+from App.ShapeBodyTube import ShapeBodyTube
+from App.ShapeCenteringRing import ShapeCenteringRing
+from App.MassRollup import MassRollup, getMassRollup
+
+STAGES = 4
+PARTS = 50  # per stage
+
+doc = FreeCAD.newDocument("MassRollupBenchmark")
+rings = []
+for stage in range(STAGES):
+    group = doc.addObject("App::DocumentObjectGroup", "Stage")
+    for i in range(PARTS):
+        obj = doc.addObject("Part::FeaturePython", "CenteringRing")
+        ShapeCenteringRing(obj)
+        obj.Material = "1/8 in. Aircraft Plywood"
+        obj.Placement.Base.x = 10.0 * (stage * PARTS + i)
+        group.addObject(obj)
+        rings.append(obj)
+    tube = doc.addObject("Part::FeaturePython", "BodyTube")
+    ShapeBodyTube(tube)
+    tube.Material = "Kraft phenolic"
+    group.addObject(tube)
+
+rollup = getMassRollup(doc)
+start = time.perf_counter()
+properties = rollup.massProperties()
+print("Full rollup:   %9.4f s, %4d aggregates, mass %.4f kg" % (time.perf_counter() - start, rollup.recalculated, properties.volume))
+
+rollup.recalculated = 0
+rings[PARTS + 7].Thickness = 12.0
+start = time.perf_counter()
+properties = rollup.massProperties()
+print("One part edit: %9.4f s, %4d aggregates, mass %.4f kg" % (time.perf_counter() - start, rollup.recalculated, properties.volume))
+
+check = MassRollup(doc).massProperties()
+print("Uncached check mass %.4f kg, center %s" % (check.volume, str(check.center)))
+
+FreeCAD.closeDocument(doc.Name)
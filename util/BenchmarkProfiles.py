@@ -0,0 +1,63 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Profile evaluation timing without FreeCAD
+
+Run from the root directory using python:
+
+    python util/BenchmarkProfiles.py
+"""
+
+__title__ = "FreeCAD Profile Benchmark"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import time
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+from App.Constants import STYLE_SOLID, STYLE_HOLLOW, STYLE_CAPPED
+from App.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_POWER, TYPE_PARABOLIC
+
+from App.Geometry.Nose import noseProfile
+from App.Geometry.Transition import transitionProfile
+
+REPEAT = 1000
+
+print("%-24s %-8s %14s" % ("Type", "Style", "Profiles/s"))
+for noseType in [TYPE_CONE, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_POWER, TYPE_PARABOLIC]:
+    for style in [STYLE_SOLID, STYLE_HOLLOW, STYLE_CAPPED]:
+        start = time.perf_counter()
+        for i in range(REPEAT):
+            profile = noseProfile(noseType, style, 100.0 + i * 0.01, 12.4, thickness=1.5, shoulder=True, shoulderLength=20.0,
+                shoulderRadius=11.9, shoulderThickness=1.5, coefficient=0.5, resolution=100)
+            if profile.validate() is None:
+                profile.segments()
+        print("%-24s %-8s %14.0f" % ("nose " + noseType, style, REPEAT / (time.perf_counter() - start)))
+
+for transitionType in [TYPE_CONE, TYPE_OGIVE, TYPE_VON_KARMAN]:
+    start = time.perf_counter()
+    for i in range(REPEAT):
+        profile = transitionProfile(transitionType, STYLE_HOLLOW, 60.0 + i * 0.01, 12.4, 20.0, thickness=1.5,
+            coefficient=0.5, clipped=True, resolution=100)
+        if profile.validate() is None:
+            profile.segments()
+    print("%-24s %-8s %14.0f" % ("transition " + transitionType, STYLE_HOLLOW, REPEAT / (time.perf_counter() - start)))
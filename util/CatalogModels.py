@@ -0,0 +1,64 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Generate models for every nose cone, transition and tube in the parts database
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/CatalogModels.py --pass cache [processes] [formats]
+
+Models are stored in the cache directory by the hash of their dimensions, so running it
+again after a database update only generates the records that changed. catalog.json in
+the cache directory maps each catalog record to its model files.
+"""
+
+__title__ = "FreeCAD Catalog Model Generation"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+from App.CatalogModels import generateCatalogModels
+from App.ParametricSweep import FORMAT_BREP
+
+# FreeCADCmd passes its own arguments through, so only use those following the script
+args = sys.argv[[arg.endswith("CatalogModels.py") for arg in sys.argv].index(True) + 1:]
+if len(args) > 0 and args[0] == "--pass":
+    args = args[1:]
+if len(args) < 1:
+    print(__doc__)
+    sys.exit(1)
+
+processes = None
+if len(args) > 1:
+    processes = int(args[1])
+formats = [FORMAT_BREP]
+if len(args) > 2:
+    formats = args[2].split(",")
+
+index = generateCatalogModels(args[0], formats, processes, ".")
+
+records = index["records"].values()
+failed = [record for record in records if record["error"] is not None]
+print("%d records, %d models generated in %.2f s, %d failed" % (len(records), index["generated"], index["elapsed"], len(failed)))
+for record in failed:
+    print("    %s %s: %s" % (record["manufacturer"], record["part_number"], record["error"]))
@@ -0,0 +1,128 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Cross check the calculated mass properties against the OCC solids
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/CheckMassProperties.py
+"""
+
+__title__ = "FreeCAD Mass Properties Check"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+import FreeCAD
+
+from App.ShapeNoseCone import ShapeNoseCone
+from App.ShapeTransition import ShapeTransition
+from App.ShapeBodyTube import ShapeBodyTube
+from App.ShapeBulkhead import ShapeBulkhead
+from App.ShapeCenteringRing import ShapeCenteringRing
+
+from App.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, \
+    TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER
+from App.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
+
+TOLERANCE = 0.005   # Relative error reported as a failure
+
+failures = 0
+
+def _relative(calculated, expected, scale):
+    return abs(calculated - expected) / scale
+
+def check(name, obj):
+    global failures
+
+    obj.Proxy.execute(obj)
+    shape = obj.Shape
+    if shape.isNull() or shape.Volume <= 0:
+        print("%-44s no shape" % name)
+        return
+
+    matrix = shape.MatrixOfInertia
+    errors = [_relative(obj.Volume.Value, shape.Volume, shape.Volume),
+              _relative(obj.CenterOfMass.x, shape.CenterOfMass.x, shape.BoundBox.XLength),
+              _relative(obj.AxialInertia, matrix.A11, matrix.A11),
+              _relative(obj.TransverseInertia, (matrix.A22 + matrix.A33) / 2.0, (matrix.A22 + matrix.A33) / 2.0)]
+    status = "ok"
+    if max(errors) > TOLERANCE:
+        status = "FAIL"
+        failures += 1
+    print("%-44s %9.5f %9.5f %9.5f %9.5f %s" % ((name,) + tuple(errors) + (status,)))
+
+doc = FreeCAD.newDocument("MassPropertiesCheck")
+
+print("%-44s %9s %9s %9s %9s" % ("Component", "Volume", "CG", "Axial", "Transverse"))
+for noseType in [TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE,
+                 TYPE_VON_KARMAN, TYPE_PARABOLA, TYPE_PARABOLIC, TYPE_POWER, TYPE_HAACK]:
+    for style in [STYLE_SOLID, STYLE_HOLLOW, STYLE_CAPPED]:
+        for shoulder in [False, True]:
+            obj = doc.addObject("Part::FeaturePython", "NoseCone")
+            ShapeNoseCone(obj)
+            obj.NoseType = noseType
+            obj.NoseStyle = style
+            obj.Shoulder = shoulder
+            obj.Coefficient = 0.5
+            obj.BluntedDiameter = 5.0
+            check("nose %s %s%s" % (noseType, style, " shoulder" if shoulder else ""), obj)
+
+for transitionType in [TYPE_CONE, TYPE_ELLIPTICAL, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLIC, TYPE_POWER]:
+    for style in [STYLE_SOLID, STYLE_SOLID_CORE, STYLE_HOLLOW, STYLE_CAPPED]:
+        for shoulder in [False, True]:
+            obj = doc.addObject("Part::FeaturePython", "Transition")
+            ShapeTransition(obj)
+            obj.TransitionType = transitionType
+            obj.TransitionStyle = style
+            obj.ForeShoulder = shoulder
+            obj.AftShoulder = shoulder
+            obj.Coefficient = 0.5
+            check("transition %s %s%s" % (transitionType, style, " shoulders" if shoulder else ""), obj)
+
+obj = doc.addObject("Part::FeaturePython", "BodyTube")
+ShapeBodyTube(obj)
+check("body tube", obj)
+
+for holes in [0, 1, 2, 5]:
+    obj = doc.addObject("Part::FeaturePython", "Bulkhead")
+    ShapeBulkhead(obj)
+    obj.Step = True
+    obj.Holes = holes > 0
+    obj.HoleCount = max(holes, 1)
+    check("bulkhead step, %d holes" % holes, obj)
+
+for notched in [False, True]:
+    obj = doc.addObject("Part::FeaturePython", "CenteringRing")
+    ShapeCenteringRing(obj)
+    obj.Diameter = 40.0
+    obj.StepDiameter = 36.0
+    obj.Step = True
+    obj.Holes = True
+    obj.HoleCount = 3
+    obj.HoleCenter = 15.0
+    obj.Notched = notched
+    check("centering ring%s" % (" notched" if notched else ""), obj)
+
+FreeCAD.closeDocument(doc.Name)
+print("%d failures" % failures)
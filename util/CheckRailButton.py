@@ -0,0 +1,197 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Compare the revolved rail buttons with the original boolean construction
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/CheckRailButton.py
+"""
+
+__title__ = "FreeCAD Rail Button Check"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import math
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+import FreeCAD
+import Part
+
+from App.ShapeRailButton import ShapeRailButton
+from App.RailButtonShapeHandler import RailButtonShapeHandler
+
+from App.Constants import RAIL_BUTTON_ROUND, RAIL_BUTTON_AIRFOIL
+from App.Constants import CONTERSINK_ANGLE_60, CONTERSINK_ANGLE_82, CONTERSINK_ANGLE_90, CONTERSINK_ANGLE_100, \
+                            CONTERSINK_ANGLE_110, CONTERSINK_ANGLE_120
+
+VOLUME_TOLERANCE = 0.001    # Relative volume error reported as a failure
+BOUNDS_TOLERANCE = 0.001    # Bounding box error in mm reported as a failure
+
+failures = 0
+
+class BaselineRailButtonShapeHandler(RailButtonShapeHandler):
+    """ The rail button as it was drawn before the revolved profile, from fused and cut solids """
+
+    def isBaselineValid(self):
+        # The validation before the fillet and fastener checks were added
+        if self._outerDiameter <= 0 or self._innerDiameter <= 0 or self._outerDiameter <= self._innerDiameter:
+            return False
+        if self._topThickness <= 0 or self._baseThickness <= 0 or self._thickness <= 0:
+            return False
+        if self._thickness <= (self._topThickness + self._baseThickness):
+            return False
+        if self._railButtonType == RAIL_BUTTON_AIRFOIL:
+            if self._length <= 0 or self._length <= self._outerDiameter:
+                return False
+        return True
+
+    def _fastener(self):
+        fastener = Part.makeCone(self._headDiameter / 2.0, 0, self._fastenerCountersinkHeight(),
+                        FreeCAD.Vector(0,0,self._thickness),
+                        FreeCAD.Vector(0,0,-1))
+        shank = Part.makeCylinder(self._shankDiameter / 2.0, self._thickness)
+
+        fastener = fastener.fuse(shank)
+
+        return fastener
+
+    def _drawButton(self):
+        spool = Part.makeCylinder(self._innerDiameter / 2.0, self._thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(0,0,1))
+
+        spoolTop = Part.makeCylinder(self._outerDiameter / 2.0, self._topThickness, FreeCAD.Vector(0,0,self._thickness - self._topThickness), FreeCAD.Vector(0,0,1))
+        if self._hasFillet:
+            spoolTop = spoolTop.makeFillet(self._filletRadius, [spoolTop.Edges[0]])
+        spool = spool.fuse(spoolTop)
+
+        spoolBottom = Part.makeCylinder(self._outerDiameter / 2.0, self._baseThickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(0,0,1))
+        spool = spool.fuse(spoolBottom)
+
+        if self._hasFastener:
+            spool = spool.cut(self._fastener())
+
+        return spool
+
+    def _airfoil(self, base, thickness, diameter, length):
+        radius = diameter/2.0
+        theta = math.pi - math.atan2(length - radius, radius)
+        x = -(radius * math.cos(theta))
+        y = radius * math.sin(theta)
+
+        v1 = FreeCAD.Vector(-x,y,base)
+        v2 = FreeCAD.Vector(-x,-y,base)
+        v3 = FreeCAD.Vector(radius,0,base)
+        v4 = FreeCAD.Vector(radius - length,0,base)
+
+        arc = Part.Arc(v1,v3,v2)
+        line1 = Part.LineSegment(v1, v4)
+        line2 = Part.LineSegment(v2, v4)
+        shape = Part.Shape([arc, line1, line2])
+        wire = Part.Wire(shape.Edges)
+        face = Part.Face(wire)
+        return face.extrude(FreeCAD.Vector(0, 0, thickness))
+
+    def _drawAirfoil(self):
+        spool = self._airfoil(0.0, self._thickness, self._innerDiameter, self._length)
+        spool.translate(FreeCAD.Vector((self._outerDiameter - self._innerDiameter) / 2.0, 0, 0))
+        if self._hasFillet:
+            spool = spool.makeFillet(self._filletRadius, [spool.Edges[3], spool.Edges[6], spool.Edges[8]])
+
+        spoolTop = self._airfoil(self._thickness - self._topThickness, self._topThickness, self._outerDiameter, self._length)
+        if self._hasFillet:
+            spoolTop = spoolTop.makeFillet(self._filletRadius, [spoolTop.Edges[3], spoolTop.Edges[6], spoolTop.Edges[8]])
+        spool = spool.fuse(spoolTop)
+
+        spoolBottom = self._airfoil(0.0, self._baseThickness, self._outerDiameter, self._length)
+        spool = spool.fuse(spoolBottom)
+
+        if self._hasFastener:
+            spool = spool.cut(self._fastener())
+
+        return spool
+
+def _baseline(obj):
+    # Returns the baseline shape, or None if the original code didn't draw one
+    handler = BaselineRailButtonShapeHandler(obj)
+    if not handler.isBaselineValid():
+        return None
+    try:
+        shape = handler.build()
+    except (ValueError, ZeroDivisionError, Part.OCCError):
+        return None
+    if shape.isNull() or not shape.isValid():
+        return None
+    return shape
+
+def _boundsError(shape, expected):
+    box = shape.BoundBox
+    other = expected.BoundBox
+    return max(abs(box.XMin - other.XMin), abs(box.XMax - other.XMax),
+               abs(box.YMin - other.YMin), abs(box.YMax - other.YMax),
+               abs(box.ZMin - other.ZMin), abs(box.ZMax - other.ZMax))
+
+def check(name, obj):
+    global failures
+
+    expected = _baseline(obj)
+    handler = RailButtonShapeHandler(obj)
+    handler._debugShape = True
+    if not handler.isValidShape():
+        if expected is None:
+            print("%-52s rejected by both" % name)
+        else:
+            print("%-52s FAIL rejected, but drawn by the original" % name)
+            failures += 1
+        return
+
+    shape = handler.build()
+    if expected is None:
+        print("%-52s %9s %9s drawn, rejected by the original" % (name, "-", "-"))
+        return
+
+    volumeError = abs(shape.Volume - expected.Volume) / expected.Volume
+    boundsError = _boundsError(shape, expected)
+    status = "ok"
+    if volumeError > VOLUME_TOLERANCE or boundsError > BOUNDS_TOLERANCE or not shape.isValid():
+        status = "FAIL"
+        failures += 1
+    print("%-52s %9.6f %9.6f %s" % (name, volumeError, boundsError, status))
+
+doc = FreeCAD.newDocument("RailButtonCheck")
+
+print("%-52s %9s %9s" % ("Rail button", "Volume", "Bounds"))
+for buttonType in [RAIL_BUTTON_ROUND, RAIL_BUTTON_AIRFOIL]:
+    for fastener in [False, True]:
+        for fillet in [False, True]:
+            for angle in [CONTERSINK_ANGLE_60, CONTERSINK_ANGLE_82, CONTERSINK_ANGLE_90, CONTERSINK_ANGLE_100,
+                          CONTERSINK_ANGLE_110, CONTERSINK_ANGLE_120]:
+                obj = doc.addObject("Part::FeaturePython", "RailButton")
+                ShapeRailButton(obj)
+                obj.RailButtonType = buttonType
+                obj.Fastener = fastener
+                obj.FilletedTop = fillet
+                obj.CountersinkAngle = angle
+                check("%s%s%s %s" % (buttonType, " fastener" if fastener else "", " fillet" if fillet else "",
+                                     angle.split(" ")[0]), obj)
+
+FreeCAD.closeDocument(doc.Name)
+print("%d failures" % failures)
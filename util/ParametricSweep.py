@@ -0,0 +1,79 @@
+# ***************************************************************************
+# *   Copyright (c) 2021 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Generate every variant of a component parameter grid
+
+Run from the root directory using FreeCADCmd:
+
+    FreeCADCmd util/ParametricSweep.py --pass grid.json output [processes] [formats]
+
+where grid.json names the component and lists the values of each property, for example
+
+    {
+        "feature" : "RocketNoseCone",
+        "grid" : {
+            "NoseType" : ["cone", "ogive", "Von Karman", "power series"],
+            "NoseStyle" : ["solid", "hollow"],
+            "Length" : [60.0, 80.0, 100.0],
+            "Diameter" : [24.8, 41.6]
+        },
+        "formats" : ["brep", "step", "stl"]
+    }
+
+Shapes are written to the output directory along with manifest.json, which records the
+volume and build time of each variant.
+"""
+
+__title__ = "FreeCAD Parametric Sweep"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import sys
+import json
+
+sys.path.insert(0, ".") # Current directory is the root directory
+
+from App.ParametricSweep import sweep, FORMAT_BREP
+
+# FreeCADCmd passes its own arguments through, so only use those following the script
+args = sys.argv[[arg.endswith("ParametricSweep.py") for arg in sys.argv].index(True) + 1:]
+if len(args) > 0 and args[0] == "--pass":
+    args = args[1:]
+if len(args) < 2:
+    print(__doc__)
+    sys.exit(1)
+
+with open(args[0]) as gridFile:
+    definition = json.load(gridFile)
+
+processes = None
+if len(args) > 2:
+    processes = int(args[2])
+formats = definition.get("formats", [FORMAT_BREP])
+if len(args) > 3:
+    formats = args[3].split(",")
+
+manifest = sweep(definition["feature"], definition["grid"], args[1], formats, processes)
+
+variants = manifest["variants"]
+failed = [variant for variant in variants if variant["error"] is not None]
+build = sum([variant["build"] for variant in variants])
+print("%d variants, %d failed, %d processes" % (len(variants), len(failed), manifest["processes"]))
+print("Elapsed %.2f s, total build %.2f s, mean build %.4f s" % (manifest["elapsed"], build, build / max(1, len(variants))))